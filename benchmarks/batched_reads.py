@@ -0,0 +1,50 @@
+"""
+Per-batch latency of LIMIT/OFFSET against keyset pagination.
+
+    python -m benchmarks.batched_reads --rows 10000000 --batch-size 1000
+
+OFFSET latency grows with the depth of the batch, keyset latency stays flat.
+"""
+from typing import List
+
+from django.db.models import Q
+
+from benchmarks.utils import argument_parser, fill_events, setup_django, timed
+
+
+def main() -> None:
+    parser = argument_parser(__doc__, rows=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    setup_django(args.database)
+    fill_events(args.rows)
+
+    from django_event_store.event_repository import DjangoEventRepository
+    from event_store.specification import SpecificationResult
+    from event_store.stream import Stream
+
+    reader = DjangoEventRepository().repo_reader
+    results: List = []
+    for stream in (Stream.new(), Stream.new("stream")):
+        for time_sort_by in (None, "as_at"):
+            spec = SpecificationResult(
+                stream=stream,
+                read_as="batch",
+                batch_size=args.batch_size,
+                time_sort_by=time_sort_by,
+            )
+            qs = reader._unlimited_read_scope(spec)
+            print(f"\n{stream.name} ordered by {time_sort_by or 'id'}")
+            for depth in (0, 0.25, 0.5, 0.75, 0.99):
+                offset = int(args.rows * depth)
+                with timed(f"OFFSET {offset}", results):
+                    list(qs[offset : offset + args.batch_size])
+
+                last_row = qs[offset - 1] if offset else None
+                seek = reader._seek_condition(last_row, spec) if last_row else Q()
+                with timed(f"keyset after row {offset}", results):
+                    list(qs.filter(seek)[: args.batch_size])
+
+
+if __name__ == "__main__":
+    main()
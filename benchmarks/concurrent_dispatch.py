@@ -0,0 +1,68 @@
+"""
+Publish latency with I/O-bound subscribers, dispatched one after another by
+Dispatcher against ConcurrentDispatcher, with thread and coroutine handlers.
+Runs on the in-memory repository, ``--rows`` is the number of publishes.
+
+    python -m benchmarks.concurrent_dispatch --rows 100 --subscribers 8
+"""
+import asyncio
+import time
+from typing import List
+
+from benchmarks.utils import argument_parser, timed
+
+
+def publish(dispatcher, subscribers: List, rows: int, events: int) -> None:
+    from event_store import Client, Event, InMemoryRepository
+
+    client = Client(repository=InMemoryRepository(), dispatcher=dispatcher)
+    for subscriber in subscribers:
+        client.subscribe(subscriber, [Event])
+    for _ in range(rows):
+        client.publish([Event() for _ in range(events)], stream_name="stream")
+
+
+def main() -> None:
+    parser = argument_parser(__doc__, rows=100)
+    parser.add_argument("--subscribers", type=int, default=8)
+    parser.add_argument("--events", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    from event_store import ConcurrentDispatcher, Dispatcher
+
+    latency = args.latency
+
+    def blocking(event):
+        time.sleep(latency)
+
+    async def coroutine(event):
+        await asyncio.sleep(latency)
+
+    # distinct handlers, each subscriber is dispatched on its own
+    def handlers(handler):
+        return [
+            type(f"Handler{index}", (), {"__call__": staticmethod(handler)})()
+            for index in range(args.subscribers)
+        ]
+
+    print(
+        f"{args.rows} publishes of {args.events} events, "
+        f"{args.subscribers} subscribers, {latency * 1000:.1f} ms each"
+    )
+    results: List = []
+    with timed("Dispatcher, blocking handlers", results):
+        publish(Dispatcher(), handlers(blocking), args.rows, args.events)
+    for max_workers in (4, args.subscribers):
+        dispatcher = ConcurrentDispatcher(max_workers=max_workers)
+        with timed(f"ConcurrentDispatcher, {max_workers} threads", results):
+            publish(dispatcher, handlers(blocking), args.rows, args.events)
+        dispatcher.shutdown()
+    dispatcher = ConcurrentDispatcher()
+    with timed("ConcurrentDispatcher, coroutine handlers", results):
+        publish(dispatcher, handlers(coroutine), args.rows, args.events)
+    dispatcher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
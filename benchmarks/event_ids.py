@@ -0,0 +1,58 @@
+"""
+Insert throughput of events with random UUID4 against time-ordered UUID7 ids,
+as the unique index on Event.event_id grows.
+
+    python -m benchmarks.event_ids --rows 1000000
+"""
+import time
+from datetime import datetime
+
+from benchmarks.utils import argument_parser, setup_django
+
+
+def insert_events(generator, rows: int, chunk: int) -> None:
+    from django.db import connection, transaction
+
+    from django_event_store.models import Event
+
+    events = Event._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {events}")
+        cursor.execute("VACUUM")
+
+    timestamp = str(datetime(2021, 1, 1))
+    total = 0.0
+    for offset in range(0, rows, chunk):
+        size = min(chunk, rows - offset)
+        values = [
+            (generator(), "BenchmarkEvent", timestamp, timestamp) for _ in range(size)
+        ]
+        started = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {events} "
+                "(event_id, event_type, data, metadata, created_at, valid_at) "
+                "VALUES (%s, %s, '{}', '{}', %s, %s)",
+                values,
+            )
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        print(f"{offset + size:>12} rows {size / elapsed:>12.0f} rows/s")
+    print(f"{'total':>12}      {rows / total:>12.0f} rows/s")
+
+
+def main() -> None:
+    parser = argument_parser(__doc__, rows=1_000_000)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    args = parser.parse_args()
+    setup_django(args.database)
+
+    from event_store.event_id import uuid4, uuid7
+
+    for label, generator in (("uuid4", uuid4), ("uuid7", uuid7)):
+        print(f"\n{label}, {args.rows} rows")
+        insert_events(lambda: generator().replace("-", ""), args.rows, args.chunk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Text stream names and event types against the interned schema of
+``django_event_store.interned``, whose links also reference events by
+Event.id: size of tables with their indexes, latency of local stream and
+event type reads and of link_to_stream.
+
+    python -m benchmarks.interned_names --rows 100000
+"""
+import uuid
+from typing import List
+
+from benchmarks.utils import argument_parser, fill_events, setup_django, timed
+
+
+def copy_to_interned() -> None:
+    """
+    Runs the interned migrations again, they copy the events filled in
+    afterwards into the interned tables.
+    """
+    from django.db import connection
+    from django.db.migrations.executor import MigrationExecutor
+
+    from django_event_store.interned.models import Event
+
+    if Event.objects.exists():
+        return
+
+    executor = MigrationExecutor(connection)
+    executor.migrate([("django_event_store_interned", "0001_initial")])
+    executor.loader.build_graph()
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+def table_sizes(models) -> int:
+    """
+    Bytes used by tables of ``models`` and their indexes, from the sqlite
+    dbstat virtual table.
+    """
+    from django.db import connection
+
+    tables = [model._meta.db_table for model in models]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT SUM(pgsize) FROM dbstat "
+            "JOIN sqlite_master ON sqlite_master.name = dbstat.name "
+            f"WHERE tbl_name IN ({', '.join(['%s'] * len(tables))})",
+            tables,
+        )
+        return cursor.fetchone()[0]
+
+
+def main() -> None:
+    parser = argument_parser(__doc__, rows=100_000)
+    parser.add_argument("--links", type=int, default=10_000)
+    parser.add_argument("--link-batch", type=int, default=100)
+    args = parser.parse_args()
+    setup_django(args.database)
+    fill_events(args.rows)
+    copy_to_interned()
+
+    from django_event_store import models as text
+    from django_event_store.event_repository import DjangoEventRepository
+    from django_event_store.interned import models as interned
+    from django_event_store.interned.event_repository import InternedEventRepository
+    from event_store.specification import SpecificationResult
+    from event_store.stream import Stream
+
+    results: List = []
+    for label, repository, models in (
+        (
+            "text",
+            DjangoEventRepository(),
+            [text.Event, text.EventsInStreams, text.StreamHead],
+        ),
+        (
+            "interned",
+            InternedEventRepository(),
+            [
+                interned.Event,
+                interned.EventsInStreams,
+                interned.StreamHead,
+                interned.StreamName,
+                interned.EventType,
+            ],
+        ),
+    ):
+        print(f"\n{label}, {args.rows} rows, {table_sizes(models) / 2**20:.2f} MiB")
+        # warms the name cache
+        repository.count(SpecificationResult(stream=Stream.new("stream")))
+        with timed("stream read", results):
+            repository.read(
+                SpecificationResult(stream=Stream.new("stream"), count=args.rows)
+            )
+        with timed("event type read", results):
+            repository.read(
+                SpecificationResult(
+                    stream=Stream.new(),
+                    count=args.rows,
+                    with_types=["BenchmarkEvent"],
+                )
+            )
+
+        event_ids = list(
+            models[0]
+            .objects.order_by("id")
+            .values_list("event_id", flat=True)[: args.links]
+        )
+        linked = Stream.new(f"linked-{uuid.uuid4()}")
+        with timed(f"link_to_stream, batches of {args.link_batch}", results):
+            for offset in range(0, len(event_ids), args.link_batch):
+                repository.link_to_stream(
+                    event_ids[offset : offset + args.link_batch], linked
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Record to event mapping of SpecificationReader.each: every transformation
+applied to every record in turn against the compiled Pipeline, which skips
+identity transformations, fuses field-local ones and maps whole batches. Reads from the in-memory
+repository, no database involved.
+
+    python -m benchmarks.pipeline_mapping --rows 200000
+"""
+from typing import List
+
+from benchmarks.utils import argument_parser, timed
+
+
+def main() -> None:
+    parser = argument_parser(__doc__, rows=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from event_store import Event, InMemoryRepository
+    from event_store.expected_version import ExpectedVersion
+    from event_store.mappers.pipeline import Pipeline
+    from event_store.mappers.pipeline_mapper import PipelineMapper
+    from event_store.mappers.transformations.event_class_remapper import (
+        EventClassRemapper,
+    )
+    from event_store.mappers.transformations.symbolize_metadata_keys import (
+        SymbolizeMetadataKeys,
+    )
+    from event_store.specification import SpecificationResult
+    from event_store.specification_reader import SpecificationReader
+    from event_store.stream import Stream
+
+    class Unfused(Pipeline):
+        """
+        Every transformation in turn, as before pipelines were compiled.
+        """
+
+        def __init__(self, *transformations):
+            super().__init__(*transformations)
+            self.dump = self._dump_each
+            self.load = self._load_each
+            self.dump_many = lambda events: [self.dump(event) for event in events]
+            self.load_many = lambda records: [self.load(record) for record in records]
+
+        def _dump_each(self, domain_event):
+            for transformation in self.transformations:
+                domain_event = transformation.dump(domain_event)
+            return domain_event
+
+        def _load_each(self, record):
+            for transformation in self.transformations[::-1]:
+                record = transformation.load(record)
+            return record
+
+    repository = InMemoryRepository()
+    mapper = PipelineMapper(Pipeline())
+    records = [mapper.event_to_record(Event()) for _ in range(args.rows)]
+    repository.append_to_stream(records, Stream.new(), ExpectedVersion.any())
+    spec = SpecificationResult(stream=Stream.new(), batch_size=1000)
+
+    results: List = []
+    for label, class_map in (("default", {}), ("remapped", {"Event": "Renamed"})):
+        print(f"\n{label}, {args.rows} records")
+        for name, pipeline in (
+            ("each transformation", Unfused),
+            ("compiled", Pipeline),
+        ):
+            reader = SpecificationReader(
+                repository,
+                PipelineMapper(
+                    pipeline(EventClassRemapper(class_map), SymbolizeMetadataKeys())
+                ),
+            )
+            for _ in range(args.repeat):
+                with timed(name, results):
+                    for _ in reader.each(spec):
+                        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Row to Record mapping: Django model instances against values_list tuples.
+
+    python -m benchmarks.record_mapping --rows 100000
+"""
+from typing import List
+
+from benchmarks.utils import argument_parser, fill_events, setup_django, timed
+
+
+def main() -> None:
+    args = argument_parser(__doc__, rows=100_000).parse_args()
+    setup_django(args.database)
+    fill_events(args.rows)
+
+    from django_event_store.event_repository import DjangoEventRepository
+    from django_event_store.models import Event, EventsInStreams
+    from event_store.record import Record
+    from event_store.specification import SpecificationResult
+    from event_store.stream import Stream
+
+    def model_to_record(row) -> Record:
+        event = row.event if isinstance(row, EventsInStreams) else row
+        return Record(
+            event_id=event.event_id,
+            metadata=event.metadata,
+            data=event.data,
+            event_type=event.event_type,
+            timestamp=event.created_at.timestamp(),
+            valid_at=(event.valid_at or event.created_at).timestamp(),
+        )
+
+    reader = DjangoEventRepository().repo_reader
+    results: List = []
+    for stream, models in (
+        (Stream.new(), Event.objects.order_by("id")),
+        (
+            Stream.new("stream"),
+            EventsInStreams.objects.filter(stream="stream")
+            .select_related("event")
+            .order_by("id"),
+        ),
+    ):
+        print(f"\n{stream.name}, {args.rows} rows")
+        with timed("model instances", results):
+            [model_to_record(row) for row in models[: args.rows]]
+        with timed("values_list tuples", results):
+            reader.read(SpecificationResult(stream=stream, count=args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+import django
+from django.conf import settings
+
+
+def setup_django(database: str) -> None:
+    settings.configure(
+        INSTALLED_APPS=["django_event_store", "django_event_store.interned"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": database}
+        },
+        USE_TZ=False,
+    )
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def argument_parser(description: str, rows: int) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--rows", type=int, default=rows)
+    parser.add_argument("--database", default="benchmark.sqlite3")
+    return parser
+
+
+@contextmanager
+def timed(label: str, results: List) -> Iterator[None]:
+    started = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - started
+    results.append((label, elapsed))
+    print(f"{label:<48} {elapsed * 1000:10.2f} ms")
+
+
+def fill_events(rows: int, stream: str = "stream", chunk: int = 50_000) -> None:
+    """
+    Inserts ``rows`` events linked to ``stream`` with plain executemany calls,
+    which is much faster than going through the repository for large tables.
+    """
+    from django.db import connection, transaction
+
+    from django_event_store.models import Event, EventsInStreams, StreamHead
+
+    if Event.objects.count() >= rows:
+        return
+
+    events = Event._meta.db_table
+    in_streams = EventsInStreams._meta.db_table
+    start = datetime(2021, 1, 1)
+    with transaction.atomic(), connection.cursor() as cursor:
+        for offset in range(0, rows, chunk):
+            batch = range(offset, min(offset + chunk, rows))
+            ids = [uuid.uuid4().hex for _ in batch]
+            timestamps = [str(start + timedelta(seconds=index)) for index in batch]
+            cursor.executemany(
+                f"INSERT INTO {events} "
+                "(event_id, event_type, data, metadata, created_at, valid_at) "
+                "VALUES (%s, %s, '{}', '{}', %s, %s)",
+                [
+                    (event_id, "BenchmarkEvent", timestamp, timestamp)
+                    for event_id, timestamp in zip(ids, timestamps)
+                ],
+            )
+            cursor.executemany(
+                f"INSERT INTO {in_streams} (stream, position, created_at, event_id) "
+                "VALUES (%s, %s, %s, %s)",
+                [
+                    (stream, index, timestamp, event_id)
+                    for index, event_id, timestamp in zip(batch, ids, timestamps)
+                ],
+            )
+        StreamHead.objects.update_or_create(
+            stream=stream, defaults={"version": rows - 1, "event_count": rows}
+        )
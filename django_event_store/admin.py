@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from django_event_store.models import Event, EventsInStreams
+from django_event_store.models import Event, EventsInStreams, StreamHead
 
 
 class EventAdmin(admin.ModelAdmin):
@@ -39,5 +39,21 @@ class EventsInStreamsAdmin(admin.ModelAdmin):
     )
 
 
+class StreamHeadAdmin(admin.ModelAdmin):
+    ordering = ("stream",)
+    search_fields = ("stream",)
+    list_display = (
+        "stream",
+        "version",
+        "event_count",
+    )
+    readonly_fields = (
+        "stream",
+        "version",
+        "event_count",
+    )
+
+
 admin.site.register(Event, EventAdmin)
 admin.site.register(EventsInStreams, EventsInStreamsAdmin)
+admin.site.register(StreamHead, StreamHeadAdmin)
@@ -12,3 +12,7 @@ class AfterCommitCeleryDispatcher(DispatcherBase):
 
     def verify(self, subscriber) -> bool:
         return self.scheduler.verify(subscriber)
+
+    def supports_batch(self, subscriber) -> bool:
+        # a task gets one serialized record
+        return False
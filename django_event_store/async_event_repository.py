@@ -0,0 +1,121 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.db import close_old_connections
+
+from django_event_store.event_repository import DjangoEventRepository
+from event_store.async_repository import AsyncEventsRepository, iterate
+from event_store.expected_version import ExpectedVersion
+from event_store.repository import Records
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+
+class AsyncDjangoEventRepository(AsyncEventsRepository):
+    """
+    Runs DjangoEventRepository calls on a dedicated thread pool, so the ORM
+    never blocks the event loop. Each call is one hop to the pool, batched
+    and streamed reads take one hop per batch rather than one per row.
+    Streamed reads are read as keyset batches of the chunk size, a database
+    cursor can't be moved between the threads of the pool.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[DjangoEventRepository] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        max_workers: int = 4,
+    ):
+        self.repository = repository or DjangoEventRepository()
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers, thread_name_prefix="event-store"
+        )
+
+    async def append_to_stream(
+        self,
+        records: Records,
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncDjangoEventRepository":
+        await self._run(
+            self.repository.append_to_stream, records, stream, expected_version
+        )
+        return self
+
+    async def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "AsyncDjangoEventRepository":
+        await self._run(self.repository.append_many, streams)
+        return self
+
+    async def link_to_stream(
+        self,
+        event_ids: List[str],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncDjangoEventRepository":
+        await self._run(
+            self.repository.link_to_stream, event_ids, stream, expected_version
+        )
+        return self
+
+    async def read(self, spec: SpecificationResult):
+        if spec.first or spec.last:
+            return await self._run(self.repository.read, spec)
+        if spec.streamed:
+            return self._records(spec)
+        if spec.batched:
+            return self._batches(spec)
+        return iterate(await self._run(self.repository.read, spec))
+
+    async def has_event(self, event_id: str) -> bool:
+        return await self._run(self.repository.has_event, event_id)
+
+    async def delete_stream(self, stream: Stream) -> "AsyncDjangoEventRepository":
+        await self._run(self.repository.delete_stream, stream)
+        return self
+
+    async def count(self, spec: SpecificationResult) -> int:
+        return await self._run(self.repository.count, spec)
+
+    async def streams_of(self, event_id: str) -> list:
+        return await self._run(self.repository.streams_of, event_id)
+
+    async def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return await self._run(self.repository.streams_of_many, event_ids)
+
+    async def position_in_stream(self, event_id: str, stream: Stream) -> int:
+        return await self._run(self.repository.position_in_stream, event_id, stream)
+
+    async def _batches(self, spec: SpecificationResult):
+        # a generator, no query until the next() that needs a batch
+        batches = self.repository.read(spec)
+        while True:
+            batch = await self._run(next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
+    async def _records(self, spec: SpecificationResult):
+        async for batch in self._batches(replace(spec, read_as="batch")):
+            for record in batch:
+                yield record
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self._call, function, *args)
+        )
+
+    @staticmethod
+    def _call(function, *args):
+        # the pool threads live outside of Django's request cycle, which
+        # closes broken and expired (CONN_MAX_AGE) connections otherwise
+        close_old_connections()
+        try:
+            return function(*args)
+        finally:
+            close_old_connections()
@@ -1,28 +1,62 @@
 from datetime import datetime
-from typing import List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from django.db import IntegrityError, transaction
+from django.db.models import F, JSONField, Value
+from django.db.models.functions import Cast
 
 from django_event_store.event_repository_reader import DjangoEventRepositoryReader
 from django_event_store.models import Event as EventModel
-from django_event_store.models import EventsInStreams
+from django_event_store.models import EventsInStreams, StreamHead
+from django_event_store.names import Names
 from event_store import EventNotFound, EventsRepository, Record
+from event_store.batch_enumerator import in_batches
 from event_store.exceptions import WrongExpectedEventVersion
-from event_store.expected_version import ExpectedVersion
+from event_store.expected_version import POSITION_DEFAULT, ExpectedVersion
 from event_store.repository import Records
+from event_store.serializers import Serializer
 from event_store.specification import SpecificationResult
 from event_store.stream import Stream
 
 
 class DjangoEventRepository(EventsRepository):
     POSITION_SHIFT = 1
+    # rows per INSERT and ids per IN (...), below the SQLite variable limit
+    BATCH_SIZE = 500
 
-    def __init__(self):
-        # fixme, configurable
-        self.event_class = EventModel
-        self.stream_class = EventsInStreams
+    def __init__(
+        self,
+        approximate_count: bool = False,
+        event_class=EventModel,
+        stream_class=EventsInStreams,
+        head_class=StreamHead,
+        names: Optional[Names] = None,
+        batch_size: int = BATCH_SIZE,
+        serializer: Optional[Serializer] = None,
+    ):
+        if serializer is not None and not serializer.json:
+            raise ValueError(
+                "Events are stored in JSON columns, use a JSON serializer."
+            )
+        self.event_class = event_class
+        self.stream_class = stream_class
+        self.head_class = head_class
+        self.names = names or Names()
+        self.batch_size = batch_size
+        # encodes data and metadata instead of the JSONField, if given
+        self.serializer = serializer
+        # estimate count() of the whole, unfiltered store from table statistics
+        self.approximate_count = approximate_count
         self.repo_reader = DjangoEventRepositoryReader(
-            self.event_class, self.stream_class
+            self.event_class, self.stream_class, self.head_class, self.names
+        )
+        # plain columns or foreign keys, depending on the names in use
+        self._event_type_field = event_class._meta.get_field("event_type").attname
+        self._stream_field = stream_class._meta.get_field("stream").attname
+        self._head_stream_field = head_class._meta.get_field("stream").attname
+        # links keep event ids, otherwise ids of event rows
+        self._links_event_ids = (
+            stream_class._meta.get_field("event").target_field.name == "event_id"
         )
 
     def append_to_stream(
@@ -31,14 +65,55 @@ class DjangoEventRepository(EventsRepository):
         stream: Stream,
         expected_version: Optional[ExpectedVersion] = ExpectedVersion.any(),
     ) -> "DjangoEventRepository":
+        return self.append_many({stream.name: (records, expected_version)})
+
+    def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "DjangoEventRepository":
+        """
+        Checks expected versions of all streams and inserts events and stream
+        rows with one bulk insert per table, in a single transaction.
+        """
         # FIXME figure out how to handle transactions
-        with transaction.atomic():
-            self._add_to_stream(
-                [record.event_id for record in records], stream, expected_version
+        records = {}
+        for stream_records, _ in streams.values():
+            for record in stream_records:
+                records.setdefault(record.event_id, record)
+        event_types = list({record.event_type for record in records.values()})
+        event_type_keys = dict(
+            zip(event_types, self.names.event_type_keys(event_types, create=True))
+        )
+        events = [
+            self.event_class(
+                **self._record_to_dict(record, event_type_keys[record.event_type])
             )
-            self.event_class.objects.bulk_create(
-                [self.event_class(**self._record_to_dict(record)) for record in records]
+            for record in records.values()
+        ]
+        with transaction.atomic():
+            if self._links_event_ids:
+                event_keys = {event_id: event_id for event_id in records}
+            else:
+                # links reference event rows, they have to exist first
+                self.event_class.objects.bulk_create(events, self.batch_size)
+                event_keys = dict(zip(records, self._event_keys(list(records))))
+
+            self._insert_stream_rows(
+                [
+                    row
+                    for stream_name, (
+                        stream_records,
+                        expected_version,
+                    ) in streams.items()
+                    for row in self._stream_rows(
+                        [event_keys[record.event_id] for record in stream_records],
+                        Stream.new(stream_name),
+                        expected_version,
+                    )
+                ]
             )
+
+            if self._links_event_ids:
+                self.event_class.objects.bulk_create(events, self.batch_size)
         return self
 
     def link_to_stream(
@@ -48,12 +123,22 @@ class DjangoEventRepository(EventsRepository):
         expected_version: Optional[ExpectedVersion] = ExpectedVersion.any(),
     ) -> "EventsRepository":
         with transaction.atomic():
-            if self.event_class.objects.filter(event_id__in=event_ids).count() != len(
-                event_ids
-            ):
-                # TODO raise id of missing event
-                raise EventNotFound()
-            self._add_to_stream(event_ids, stream, expected_version)
+            self._insert_stream_rows(
+                self._stream_rows(self._event_keys(event_ids), stream, expected_version)
+            )
+        return self
+
+    def append_iter(
+        self,
+        records: Iterable[Record],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+        batch_size: Optional[int] = None,
+    ) -> "DjangoEventRepository":
+        with transaction.atomic():
+            super().append_iter(
+                records, stream, expected_version, batch_size or self.batch_size
+            )
         return self
 
     def read(self, spec: SpecificationResult) -> List[Records]:
@@ -63,60 +148,154 @@ class DjangoEventRepository(EventsRepository):
         return self.repo_reader.has_event(event_id)
 
     def delete_stream(self, stream: Stream) -> "EventsRepository":
-        self.stream_class.objects.filter(stream=stream.name).delete()
+        stream_key = self.names.stream_key(stream.name)
+        with transaction.atomic():
+            self.stream_class.objects.filter(stream=stream_key).delete()
+            self.head_class.objects.filter(stream=stream_key).delete()
         return self
 
     def count(self, spec: SpecificationResult) -> int:
-        pass
+        return self.repo_reader.count(spec, self.approximate_count)
 
     def streams_of(self, event_id: str) -> list:
-        pass
+        return self.repo_reader.streams_of(event_id)
+
+    def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return self.repo_reader.streams_of_many(event_ids)
 
     def position_in_stream(self, event_id: str, stream: Stream) -> int:
         return self.repo_reader.position_in_stream(event_id, stream)
 
-    def _add_to_stream(
+    def _event_keys(self, event_ids: Sequence[str]) -> list:
+        """
+        Values links to ``event_ids`` keep in their event column, raises
+        EventNotFound when any of the events doesn't exist.
+        """
+        batches = in_batches(event_ids, self.batch_size)
+        if self._links_event_ids:
+            found = sum(
+                self.event_class.objects.filter(event_id__in=batch).count()
+                for batch in batches
+            )
+            if found != len(event_ids):
+                # TODO raise id of missing event
+                raise EventNotFound()
+            return event_ids
+
+        to_python = self.event_class._meta.get_field("event_id").to_python
+        keys = {}
+        for batch in batches:
+            keys.update(
+                self.event_class.objects.filter(event_id__in=batch).values_list(
+                    "event_id", "id"
+                )
+            )
+        try:
+            return [keys[to_python(event_id)] for event_id in event_ids]
+        except KeyError as error:
+            raise EventNotFound(error.args[0])
+
+    def _stream_rows(
         self,
-        events_ids: Sequence[str],
+        event_keys: Sequence,
         stream: Stream,
         expected_version: Optional[ExpectedVersion] = None,
-    ) -> "DjangoEventRepository":
-        def last_stream_version(stream_: Stream):
-            return (
-                self.stream_class.objects.filter(stream=stream_.name)
-                .order_by("-position")
-                .first()
-            )
-
-        resolved_version = expected_version.resolve_for(stream, last_stream_version)
+    ) -> list:
+        """
+        Moves the stream head past ``event_keys`` and returns unsaved stream
+        rows for them.
+        """
+        stream_key = self.names.stream_key(stream.name, create=True)
+        resolved_version = expected_version.resolve_for(
+            stream, lambda _: self._stream_version(stream_key)
+        )
+        self._move_stream_head(
+            stream_key, expected_version, resolved_version, len(event_keys)
+        )
 
-        in_stream = [
+        return [
             self.stream_class(
-                stream=stream.name,
+                **{self._stream_field: stream_key},
                 position=self._compute_position(resolved_version, index),
-                event_id=event_id,
+                event_id=event_key,
             )
-            for index, event_id in enumerate(events_ids)
+            for index, event_key in enumerate(event_keys)
         ]
+
+    def _insert_stream_rows(self, in_stream: list) -> None:
         try:
-            self.stream_class.objects.bulk_create(in_stream)
+            self.stream_class.objects.bulk_create(in_stream, self.batch_size)
         except IntegrityError:
             # TODO IndexViolationDetector based on DB error msg
             raise WrongExpectedEventVersion()
 
-        return self
+    def _stream_version(self, stream_key) -> Optional[int]:
+        return (
+            self.head_class.objects.filter(stream=stream_key)
+            .values_list("version", flat=True)
+            .first()
+        )
+
+    def _move_stream_head(
+        self,
+        stream_key,
+        expected_version: ExpectedVersion,
+        resolved_version: Optional[int],
+        count: int,
+    ) -> None:
+        """
+        Conditional update of the stream head, it fails when another writer
+        moved the stream past the expected version in the meantime.
+        """
+        heads = self.head_class.objects.filter(stream=stream_key)
+        if resolved_version is None:
+            # ExpectedVersion.any() only counts events, they get no position
+            added = F("event_count") + count
+            if not heads.update(event_count=added):
+                if not self._create_stream_head(stream_key, POSITION_DEFAULT, count):
+                    heads.update(event_count=added)
+            return
+
+        if expected_version.is_none():
+            heads = heads.filter(event_count=0)
+        if heads.filter(version=resolved_version).update(
+            version=resolved_version + count, event_count=F("event_count") + count
+        ):
+            return
+        if resolved_version != POSITION_DEFAULT or not self._create_stream_head(
+            stream_key, resolved_version + count, count
+        ):
+            raise WrongExpectedEventVersion()
+
+    def _create_stream_head(self, stream_key, version: int, count: int) -> bool:
+        try:
+            with transaction.atomic():
+                self.head_class.objects.create(
+                    **{self._head_stream_field: stream_key},
+                    version=version,
+                    event_count=count,
+                )
+        except IntegrityError:
+            return False
+        return True
 
     def _compute_position(self, resolved_version: int, index: int) -> Optional[int]:
         if resolved_version is not None:
             return resolved_version + index + self.POSITION_SHIFT
         return None
 
-    def _record_to_dict(self, record: Record) -> dict:
+    def _record_to_dict(self, record: Record, event_type_key) -> dict:
+        data, metadata = record.data, record.metadata
+        if self.serializer is not None:
+            serialized = record.serialize(self.serializer)
+            # already JSON text, stored as is
+            data = Cast(Value(serialized.data), JSONField())
+            metadata = Cast(Value(serialized.metadata), JSONField())
         return {
             "event_id": record.event_id,
-            "data": record.data,
-            "metadata": record.metadata,
-            "event_type": record.event_type,
+            "data": data,
+            "metadata": metadata,
+            self._event_type_field: event_type_key,
             "created_at": datetime.fromtimestamp(record.timestamp),
             "valid_at": datetime.fromtimestamp(record.valid_at or record.timestamp),
         }
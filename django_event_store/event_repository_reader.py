@@ -1,34 +1,83 @@
 import math
-from typing import Union
+from typing import Dict, Iterator, List, Optional, Sequence
 
-from django_event_store.models import Event, EventsInStreams
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import F, Q, Subquery
+
+from django_event_store.names import Names
 from event_store import EventNotFound, Record
-from event_store.batch_enumerator import BatchIterator
+from event_store.repository import Records
 from event_store.specification import SpecificationResult
 from event_store.stream import Stream
 
 
 class DjangoEventRepositoryReader:
-    def __init__(self, event_class, stream_class):
+    TIME_SORT_FIELDS = {"as_at": "created_at", "as_of": "valid_at"}
+    # read as plain tuples: (id, *RECORD_FIELDS), no model instances involved
+    RECORD_FIELDS = (
+        "event_id",
+        "data",
+        "metadata",
+        "event_type",
+        "created_at",
+        "valid_at",
+    )
+
+    def __init__(self, event_class, stream_class, head_class, names: Names):
         self.event_class = event_class
         self.stream_class = stream_class
+        self.head_class = head_class
+        self.names = names
 
     def read(self, spec: SpecificationResult):
-        stream = self._read_scope(spec)
         if spec.batched:
+            return self.each_batch(spec)
 
-            def batch_reader(offset: int, limit: int):
-                return stream[offset : offset + limit]
-
-            return [
-                [self._to_record(event) for event in batch]
-                for batch in BatchIterator(spec.batch_size, spec.limit, batch_reader)
-            ]
+        stream = self._read_scope(spec)
+        if spec.streamed:
+            return self._streamed(stream, spec)
         elif spec.first:
             record = stream.first()
+            if not record:
+                self._verify_bounds(spec)
             return self._to_record(record) if record else None
 
-        return [self._to_record(event) for event in stream]
+        records = self._to_records(list(stream))
+        if not records:
+            self._verify_bounds(spec)
+        return records
+
+    def each_batch(self, spec: SpecificationResult) -> Iterator[Records]:
+        """
+        Batches of ``spec``, each one read by its own query once it is needed.
+        """
+        empty = True
+        for batch in self._batches(spec):
+            empty = False
+            yield self._to_records(batch)
+        if empty:
+            self._verify_bounds(spec)
+
+    def count(self, spec: SpecificationResult, approximate: bool = False) -> int:
+        if not self._filtered(spec):
+            if not spec.stream.is_global:
+                return min(self._stream_event_count(spec.stream), spec.limit)
+            if approximate:
+                estimate = self._estimated_count()
+                if estimate is not None:
+                    return min(estimate, spec.limit)
+
+        if spec.stream.is_global:
+            qs = self._read_scope_for_global(spec).order_by()
+        else:
+            qs = self._read_scope_for_local(spec).order_by()
+        if spec.limit is not math.inf:
+            qs = qs[: spec.limit]
+
+        count = qs.count()
+        if not count:
+            self._verify_bounds(spec)
+        return count
 
     def has_event(self, event_id: str) -> bool:
         return self.event_class.objects.filter(event_id=event_id).exists()
@@ -37,16 +86,160 @@ class DjangoEventRepositoryReader:
         try:
             return (
                 self.stream_class.objects.only("position")
-                .get(event_id=event_id, stream=stream.name)
+                .get(
+                    event__event_id=event_id,
+                    stream=self.names.stream_key(stream.name),
+                )
                 .position
             )
         except self.stream_class.DoesNotExist:
             raise EventNotFound()
 
+    def streams_of(self, event_id: str) -> list:
+        return [
+            Stream.new(self.names.stream_name(stream_key))
+            for stream_key in self.stream_class.objects.filter(event__event_id=event_id)
+            .order_by("id")
+            .values_list("stream", flat=True)
+        ]
+
+    def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        to_python = self.event_class._meta.get_field("event_id").to_python
+        streams = {to_python(event_id): [] for event_id in event_ids}
+        for event_id, stream_key in (
+            self.stream_class.objects.filter(event__event_id__in=streams)
+            .order_by("id")
+            .values_list("event__event_id", "stream")
+        ):
+            streams[event_id].append(Stream.new(self.names.stream_name(stream_key)))
+        return {event_id: streams[to_python(event_id)] for event_id in event_ids}
+
+    def _stream_event_count(self, stream: Stream) -> int:
+        event_count = (
+            self.head_class.objects.filter(stream=self.names.stream_key(stream.name))
+            .values_list("event_count", flat=True)
+            .first()
+        )
+        return event_count or 0
+
+    def _estimated_count(self) -> Optional[int]:
+        """
+        Row count of the events table from the database statistics, None when
+        the backend has none (e.g. the table was never analyzed).
+        """
+        connection = connections[router.db_for_read(self.event_class)]
+        table = self.event_class._meta.db_table
+        query = {
+            "postgresql": "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            "mysql": "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            "sqlite": "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1",
+        }.get(connection.vendor)
+        if query is None:
+            return None
+
+        try:
+            with transaction.atomic(using=connection.alias):
+                with connection.cursor() as cursor:
+                    cursor.execute(query, [table])
+                    row = cursor.fetchone()
+        except DatabaseError:
+            return None
+        if not row or row[0] is None:
+            return None
+
+        # sqlite_stat1 keeps "<rows> <rows per key>..." as text
+        estimate = int(float(str(row[0]).split()[0]))
+        return estimate if estimate >= 0 else None
+
+    def _filtered(self, spec: SpecificationResult) -> bool:
+        return bool(
+            spec.start
+            or spec.stop
+            or spec.with_ids is not None
+            or spec.with_types is not None
+        )
+
     def _read_scope(self, spec: SpecificationResult):
+        qs = self._unlimited_read_scope(spec)
+
+        if spec.limit is not math.inf:
+            qs = qs.all()[: spec.limit]
+
+        return qs.all()
+
+    def _unlimited_read_scope(self, spec: SpecificationResult):
         if spec.stream.is_global:
-            return self._read_scope_for_global(spec)
-        return self._read_scope_for_local(spec)
+            return self._read_scope_for_global(spec).values_list(
+                "id", *self.RECORD_FIELDS
+            )
+        return self._read_scope_for_local(spec).values_list(
+            "id", *(f"event__{field}" for field in self.RECORD_FIELDS)
+        )
+
+    def _batches(self, spec: SpecificationResult) -> Iterator[List]:
+        """
+        Keyset pagination: every batch seeks past the last row of the previous
+        one instead of using OFFSET, so batch N costs the same as batch 1.
+        Rows without a valid_at are read apart, after or before the others,
+        as an index range can't continue from a value into the NULLs.
+        """
+        prefix = "" if spec.stream.is_global else "event__"
+        qs = self._unlimited_read_scope(spec).order_by(
+            *self._ordering(spec, prefix, nulls=False)
+        )
+        remaining = spec.limit
+        batch: List = []
+        for phase in self._phases(spec, prefix):
+            seek = Q()
+            while remaining > 0:
+                limit = int(min(spec.batch_size - len(batch), remaining))
+                rows = list(qs.filter(phase, seek)[:limit])
+                batch += rows
+                remaining -= len(rows)
+                if len(batch) == spec.batch_size:
+                    yield batch
+                    batch = []
+                if len(rows) < limit:
+                    break
+                seek = self._seek_condition(rows[-1], spec)
+        if batch:
+            yield batch
+
+    def _phases(self, spec: SpecificationResult, prefix: str) -> List[Q]:
+        time_field = self.TIME_SORT_FIELDS.get(spec.time_sort_by)
+        if time_field is None or not self._nullable(time_field):
+            return [Q()]
+        # NULLs sort last reading forward and first reading backward
+        is_null = Q(**{f"{prefix}{time_field}__isnull": True})
+        has_value = Q(**{f"{prefix}{time_field}__isnull": False})
+        return [has_value, is_null] if spec.forward else [is_null, has_value]
+
+    def _streamed(self, stream, spec: SpecificationResult) -> Iterator[Record]:
+        empty = True
+        for row in stream.iterator(chunk_size=spec.batch_size):
+            empty = False
+            yield self._to_record(row)
+        if empty:
+            self._verify_bounds(spec)
+
+    def _seek_condition(self, row: tuple, spec: SpecificationResult) -> Q:
+        lookup = "gt" if spec.forward else "lt"
+        after_row = Q(**{f"id__{lookup}": row[0]})
+        time_field = self.TIME_SORT_FIELDS.get(spec.time_sort_by)
+        if time_field is None:
+            return after_row
+
+        value = row[self.RECORD_FIELDS.index(time_field) + 1]
+        if value is None:
+            # rows without a value are ordered by id alone
+            return after_row
+        field = time_field if spec.stream.is_global else f"event__{time_field}"
+        # the leading bound is the index range, the rest filters within it
+        bound = "gte" if spec.forward else "lte"
+        return Q(**{f"{field}__{bound}": value}) & (
+            Q(**{f"{field}__{lookup}": value}) | after_row
+        )
 
     def _read_scope_for_global(self, spec: SpecificationResult):
         qs = self.event_class.objects
@@ -55,87 +248,96 @@ class DjangoEventRepositoryReader:
             qs = qs.filter(event_id__in=spec.with_ids)
 
         if spec.with_types is not None:
-            qs = qs.filter(event_type__in=spec.with_types)
+            qs = qs.filter(event_type__in=self.names.event_type_keys(spec.with_types))
 
         if spec.start:
-            qs = qs.filter(**self._start_condition_global(spec))
+            qs = qs.filter(**self._start_condition(spec))
         if spec.stop:
-            qs = qs.filter(**self._stop_condition_global(spec))
-
-        qs = self._ordered_global(qs, spec)
-
-        if spec.limit is not math.inf:
-            qs = qs.all()[: spec.limit]
+            qs = qs.filter(**self._stop_condition(spec))
 
-        return qs.all()
+        return self._ordered_global(qs, spec)
 
     def _read_scope_for_local(self, spec: SpecificationResult):
-        qs = self.stream_class.objects.filter(stream=spec.stream.name).select_related(
-            "event"
+        qs = self.stream_class.objects.filter(
+            stream=self.names.stream_key(spec.stream.name)
         )
 
         if spec.with_ids is not None:
-            qs = qs.filter(event_id__in=spec.with_ids)
+            # no join when links keep event ids rather than event row ids
+            qs = qs.filter(event__event_id__in=spec.with_ids)
 
         if spec.with_types is not None:
-            qs = qs.filter(event__event_type__in=spec.with_types)
+            qs = qs.filter(
+                event__event_type__in=self.names.event_type_keys(spec.with_types)
+            )
 
         if spec.start:
             qs = qs.filter(**self._start_condition(spec))
         if spec.stop:
             qs = qs.filter(**self._stop_condition(spec))
 
-        qs = self._ordered_local(qs, spec)
+        return self._ordered_local(qs, spec)
 
-        if spec.limit is not math.inf:
-            qs = qs.all()[: spec.limit]
+    def _start_condition(self, spec: SpecificationResult) -> dict:
+        return self._start_offset_condition(self._bound(spec.start, spec), spec)
 
-        return qs.all()
+    def _stop_condition(self, spec: SpecificationResult) -> dict:
+        return self._stop_offset_condition(self._bound(spec.stop, spec), spec)
 
-    def _start_condition(self, spec: SpecificationResult):
-        event_in_stream = self.stream_class.objects.only("id").get(
-            event_id=spec.start, stream=spec.stream.name
-        )
-        return self._start_offset_condition(event_in_stream.id, spec)
+    def _bound(self, event_id: str, spec: SpecificationResult) -> Subquery:
+        # resolved by the database as part of the main query
+        return Subquery(self._bound_scope(event_id, spec).values("id")[:1])
 
-    def _stop_condition(self, spec):
-        event_in_stream = self.stream_class.objects.only("id").get(
-            event_id=spec.stop, stream=spec.stream.name
+    def _bound_scope(self, event_id: str, spec: SpecificationResult):
+        if spec.stream.is_global:
+            return self.event_class.objects.filter(event_id=event_id)
+        return self.stream_class.objects.filter(
+            event__event_id=event_id, stream=self.names.stream_key(spec.stream.name)
         )
-        return self._stop_offset_condition(event_in_stream.id, spec)
-
-    def _start_condition_global(self, spec):
-        event_in_stream = self.event_class.objects.only("id").get(event_id=spec.start)
-        return self._start_offset_condition(event_in_stream.id, spec)
 
-    def _stop_condition_global(self, spec):
-        event_in_stream = self.event_class.objects.only("id").get(event_id=spec.stop)
-        return self._stop_offset_condition(event_in_stream.id, spec)
+    def _verify_bounds(self, spec: SpecificationResult) -> None:
+        """
+        A missing start/stop event makes the main query empty, so bounds are
+        only checked after a read came back without any rows.
+        """
+        for event_id in (spec.start, spec.stop):
+            if event_id and not self._bound_scope(event_id, spec).exists():
+                raise EventNotFound(event_id)
 
-    def _start_offset_condition(self, event_id: str, spec: SpecificationResult) -> dict:
+    def _start_offset_condition(self, row_id, spec: SpecificationResult) -> dict:
         if spec.forward:
-            return {"id__gt": event_id}
-        return {"id__lt": event_id}
+            return {"id__gt": row_id}
+        return {"id__lt": row_id}
 
-    def _stop_offset_condition(self, event_id: str, spec: SpecificationResult) -> dict:
+    def _stop_offset_condition(self, row_id, spec: SpecificationResult) -> dict:
         if spec.forward:
-            return {"id__lt": event_id}
-        return {"id__gt": event_id}
+            return {"id__lt": row_id}
+        return {"id__gt": row_id}
 
     def _ordered(self, qs, spec: SpecificationResult, field: str = ""):
+        return qs.order_by(*self._ordering(spec, field))
+
+    def _ordering(
+        self, spec: SpecificationResult, field: str = "", nulls: bool = True
+    ) -> list:
         conditions = []
-        try:
+        time_field = self.TIME_SORT_FIELDS.get(spec.time_sort_by)
+        if time_field is not None and nulls and self._nullable(time_field):
+            # explicit NULL placement, as _batches reads them
+            time_order = F(f"{field}{time_field}")
             conditions.append(
-                {
-                    "as_at": self._order(f"{field}created_at", spec),
-                    "as_of": self._order(f"{field}valid_at", spec),
-                }[spec.time_sort_by]
+                time_order.desc(nulls_first=True)
+                if spec.backward
+                else time_order.asc(nulls_last=True)
             )
-        except KeyError:
-            pass
+        elif time_field is not None:
+            conditions.append(self._order(f"{field}{time_field}", spec))
 
         conditions.append(self._order("id", spec))
-        return qs.order_by(*conditions)
+        return conditions
+
+    def _nullable(self, field: str) -> bool:
+        return self.event_class._meta.get_field(field).null
 
     def _ordered_local(self, qs, spec: SpecificationResult):
         return self._ordered(qs, spec, "event__")
@@ -148,13 +350,24 @@ class DjangoEventRepositoryReader:
             return f"-{field}"
         return field
 
-    def _to_record(self, event: Union[Event, EventsInStreams]) -> Record:
-        record = event.event if isinstance(event, self.stream_class) else event
+    def _to_record(self, row: tuple) -> Record:
+        return self._row_to_record(row, self.names.event_type_name(row[4]))
+
+    def _to_records(self, rows: List[tuple]) -> Records:
+        # event type names resolved once per batch, not per row
+        event_types = self.names.event_type_names([row[4] for row in rows])
+        return [
+            self._row_to_record(row, event_type)
+            for row, event_type in zip(rows, event_types)
+        ]
+
+    def _row_to_record(self, row: tuple, event_type: str) -> Record:
+        _, event_id, data, metadata, _, created_at, valid_at = row
         return Record(
-            event_id=record.event_id,
-            metadata=record.metadata,
-            data=record.data,
-            event_type=record.event_type,
-            timestamp=record.created_at.timestamp(),
-            valid_at=record.valid_at.timestamp() or event.created_at.timestamp(),
+            event_id=event_id,
+            metadata=metadata,
+            data=data,
+            event_type=event_type,
+            timestamp=created_at.timestamp(),
+            valid_at=(valid_at or created_at).timestamp(),
         )
@@ -0,0 +1,190 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import close_old_connections, router, transaction
+
+from django_event_store.event_repository import DjangoEventRepository
+from event_store import EventsRepository, Record
+from event_store.expected_version import ExpectedVersion
+from event_store.repository import Records
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+Write = Tuple[Callable, Future]
+
+
+class GroupCommitRepository(EventsRepository):
+    """
+    Collects writes of many threads for up to ``window`` seconds and commits
+    them in one transaction, so concurrent small publishes share a single
+    commit. Each write runs in its own savepoint: a write that conflicts with
+    its expected version fails alone and the caller gets its exception, the
+    others are committed. Callers are blocked until the shared commit, so
+    anything they do after a write, e.g. broker dispatch in Client.publish,
+    sees committed events.
+
+    A caller waits at most ``timeout`` seconds for the commit and then gets
+    ``concurrent.futures.TimeoutError``; its write is dropped if the writer
+    hasn't started it yet, otherwise it may still be committed.
+
+    Writes made inside a transaction of the caller are not grouped, they go
+    straight to ``repository`` to stay part of that transaction.
+    """
+
+    def __init__(
+        self,
+        repository: DjangoEventRepository,
+        window: float = 0.002,
+        max_writes: int = 256,
+        timeout: Optional[float] = 30.0,
+    ):
+        self.repository = repository
+        self.window = window
+        self.max_writes = max_writes
+        self.timeout = timeout
+        self.using = router.db_for_write(repository.event_class)
+        self._writes: "queue.Queue[Write]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def append_to_stream(
+        self,
+        records: Records,
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "GroupCommitRepository":
+        return self._write(
+            self.repository.append_to_stream, records, stream, expected_version
+        )
+
+    def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "GroupCommitRepository":
+        return self._write(self.repository.append_many, streams)
+
+    def append_iter(
+        self,
+        records: Iterable[Record],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+        batch_size: Optional[int] = None,
+    ) -> "GroupCommitRepository":
+        return self._write(
+            self.repository.append_iter, records, stream, expected_version, batch_size
+        )
+
+    def link_to_stream(
+        self,
+        event_ids: List[str],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "GroupCommitRepository":
+        return self._write(
+            self.repository.link_to_stream, event_ids, stream, expected_version
+        )
+
+    def delete_stream(self, stream: Stream) -> "GroupCommitRepository":
+        return self._write(self.repository.delete_stream, stream)
+
+    def read(self, spec: SpecificationResult) -> List[Records]:
+        return self.repository.read(spec)
+
+    def has_event(self, event_id: str) -> bool:
+        return self.repository.has_event(event_id)
+
+    def count(self, spec: SpecificationResult) -> int:
+        return self.repository.count(spec)
+
+    def streams_of(self, event_id: str) -> list:
+        return self.repository.streams_of(event_id)
+
+    def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return self.repository.streams_of_many(event_ids)
+
+    def position_in_stream(self, event_id: str, stream: Stream) -> int:
+        return self.repository.position_in_stream(event_id, stream)
+
+    def _write(self, method: Callable, *args) -> "GroupCommitRepository":
+        if transaction.get_connection(self.using).in_atomic_block:
+            method(*args)
+            return self
+
+        future: Future = Future()
+        self._writes.put((partial(method, *args), future))
+        self._start_writer()
+        try:
+            # raises the exception of this write, if any
+            future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        return self
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run, name="event-store-group-commit", daemon=True
+                )
+                self._writer.start()
+
+    def _run(self) -> None:
+        while True:
+            writes = self._collect()
+            # the writer lives outside of Django's request cycle, which closes
+            # broken and expired (CONN_MAX_AGE) connections otherwise
+            close_old_connections()
+            try:
+                self._commit(writes)
+            finally:
+                close_old_connections()
+
+    def _collect(self) -> List[Write]:
+        writes = [self._writes.get()]
+        deadline = time.monotonic() + self.window
+        while len(writes) < self.max_writes:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                writes.append(self._writes.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return writes
+
+    def _commit(self, writes: List[Write]) -> None:
+        # writes cancelled by a caller that timed out are dropped
+        writes = [
+            (write, future)
+            for write, future in writes
+            if future.set_running_or_notify_cancel()
+        ]
+        # BaseException: EventDuplicatedInStream is one, and a caller's
+        # append_iter generator may raise anything
+        errors: List[Optional[BaseException]] = []
+        commit_error: Optional[BaseException] = None
+        try:
+            with transaction.atomic(using=self.using):
+                for write, _ in writes:
+                    try:
+                        with transaction.atomic(using=self.using):
+                            write()
+                    except BaseException as error:
+                        errors.append(error)
+                    else:
+                        errors.append(None)
+        except BaseException as error:
+            # the shared commit failed, none of the writes made it
+            commit_error = error
+        finally:
+            for index, (_, future) in enumerate(writes):
+                error = commit_error or errors[index]
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class InternedConfig(AppConfig):
+    name = "django_event_store.interned"
+    label = "django_event_store_interned"
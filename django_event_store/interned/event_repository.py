@@ -0,0 +1,37 @@
+from typing import Optional
+
+from django_event_store.event_repository import DjangoEventRepository
+from django_event_store.interned.models import (
+    Event,
+    EventsInStreams,
+    EventType,
+    StreamHead,
+    StreamName,
+)
+from django_event_store.names import InternedNames
+from event_store.serializers import Serializer
+
+# shared by all repositories, so the name <-> key cache lives per process
+names = InternedNames(StreamName, EventType)
+
+
+class InternedEventRepository(DjangoEventRepository):
+    """
+    DjangoEventRepository over the opt-in schema of the
+    ``django_event_store.interned`` app, where stream names and event types
+    are stored once in lookup tables and referenced by integer keys.
+    """
+
+    def __init__(
+        self,
+        approximate_count: bool = False,
+        serializer: Optional[Serializer] = None,
+    ):
+        super().__init__(
+            approximate_count=approximate_count,
+            event_class=Event,
+            stream_class=EventsInStreams,
+            head_class=StreamHead,
+            names=names,
+            serializer=serializer,
+        )
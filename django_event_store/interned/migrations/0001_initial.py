@@ -0,0 +1,149 @@
+# Generated by Django 3.2.25 on 2026-10-17 07:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Event",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.UUIDField(db_index=True, unique=True)),
+                ("data", models.JSONField()),
+                ("metadata", models.JSONField()),
+                ("created_at", models.DateTimeField()),
+                ("valid_at", models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="EventType",
+            fields=[
+                ("id", models.SmallAutoField(primary_key=True, serialize=False)),
+                ("name", models.TextField(unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="StreamName",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.TextField(unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="StreamHead",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.IntegerField(default=-1)),
+                ("event_count", models.IntegerField(default=0)),
+                (
+                    "stream",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="django_event_store_interned.streamname",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="EventsInStreams",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("position", models.IntegerField(null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stream_position",
+                        to="django_event_store_interned.event",
+                        to_field="event_id",
+                    ),
+                ),
+                (
+                    "stream",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="django_event_store_interned.streamname",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="event_type",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="django_event_store_interned.eventtype",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventsinstreams",
+            index=models.Index(fields=["stream", "id"], name="interned_stream_id_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="eventsinstreams",
+            unique_together={("stream", "position"), ("stream", "event")},
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["event_type", "id"], name="interned_type_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["created_at", "id"], name="interned_created_at_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["valid_at", "id"], name="interned_valid_at_id_idx"
+            ),
+        ),
+    ]
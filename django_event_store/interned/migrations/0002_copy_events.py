@@ -0,0 +1,120 @@
+from django.core.management.color import no_style
+from django.db import migrations
+
+CHUNK_SIZE = 1000
+
+
+def intern(model, names):
+    model.objects.bulk_create(
+        [model(name=name) for name in names], batch_size=CHUNK_SIZE
+    )
+    return dict(model.objects.values_list("name", "pk"))
+
+
+def in_chunks(queryset, fields):
+    """
+    Yields rows of ``queryset`` in id order, CHUNK_SIZE at a time.
+    """
+    last_id = None
+    while True:
+        chunk = queryset.order_by("id")
+        if last_id is not None:
+            chunk = chunk.filter(id__gt=last_id)
+        rows = list(chunk.values_list("id", *fields)[:CHUNK_SIZE])
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def copy_events(apps, schema_editor):
+    """
+    Copies events, links and stream heads of the django_event_store tables,
+    keeping their ids so readers see the same global order.
+    """
+    Event = apps.get_model("django_event_store", "Event")
+    EventsInStreams = apps.get_model("django_event_store", "EventsInStreams")
+    StreamHead = apps.get_model("django_event_store", "StreamHead")
+    InternedEvent = apps.get_model("django_event_store_interned", "Event")
+    InternedEventsInStreams = apps.get_model(
+        "django_event_store_interned", "EventsInStreams"
+    )
+    InternedStreamHead = apps.get_model("django_event_store_interned", "StreamHead")
+    StreamName = apps.get_model("django_event_store_interned", "StreamName")
+    EventType = apps.get_model("django_event_store_interned", "EventType")
+
+    event_types = intern(
+        EventType,
+        Event.objects.order_by("event_type")
+        .values_list("event_type", flat=True)
+        .distinct(),
+    )
+    streams = intern(
+        StreamName,
+        EventsInStreams.objects.order_by("stream")
+        .values_list("stream", flat=True)
+        .distinct(),
+    )
+
+    fields = ["event_id", "event_type", "data", "metadata", "created_at", "valid_at"]
+    for rows in in_chunks(Event.objects.all(), fields):
+        InternedEvent.objects.bulk_create(
+            InternedEvent(
+                id=id,
+                event_id=event_id,
+                event_type_id=event_types[event_type],
+                data=data,
+                metadata=metadata,
+                created_at=created_at,
+                valid_at=valid_at,
+            )
+            for id, event_id, event_type, data, metadata, created_at, valid_at in rows
+        )
+
+    # keep the copied created_at, this is a historical model of this migration
+    InternedEventsInStreams._meta.get_field("created_at").auto_now_add = False
+    fields = ["stream", "position", "created_at", "event_id"]
+    for rows in in_chunks(EventsInStreams.objects.all(), fields):
+        InternedEventsInStreams.objects.bulk_create(
+            InternedEventsInStreams(
+                id=id,
+                stream_id=streams[stream],
+                position=position,
+                created_at=created_at,
+                event_id=event_id,
+            )
+            for id, stream, position, created_at, event_id in rows
+        )
+    InternedStreamHead.objects.bulk_create(
+        [
+            InternedStreamHead(
+                stream_id=streams[stream], version=version, event_count=event_count
+            )
+            for stream, version, event_count in StreamHead.objects.values_list(
+                "stream", "version", "event_count"
+            )
+            if stream in streams
+        ],
+        batch_size=CHUNK_SIZE,
+    )
+    reset_sequences(schema_editor, [InternedEvent, InternedEventsInStreams])
+
+
+def reset_sequences(schema_editor, models):
+    connection = schema_editor.connection
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_event_store", "0003_composite_indexes"),
+        ("django_event_store_interned", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_event_rows(apps, schema_editor):
+    Event = apps.get_model("django_event_store_interned", "Event")
+    EventsInStreams = apps.get_model("django_event_store_interned", "EventsInStreams")
+
+    EventsInStreams.objects.update(
+        event_row=Subquery(
+            Event.objects.filter(event_id=OuterRef("event_id")).values("id")[:1]
+        )
+    )
+
+
+def unlink_event_rows(apps, schema_editor):
+    Event = apps.get_model("django_event_store_interned", "Event")
+    EventsInStreams = apps.get_model("django_event_store_interned", "EventsInStreams")
+
+    EventsInStreams.objects.update(
+        event=Subquery(
+            Event.objects.filter(id=OuterRef("event_row_id")).values("event_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Links reference event rows by Event.id instead of Event.event_id.
+    """
+
+    dependencies = [
+        ("django_event_store_interned", "0002_copy_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventsinstreams",
+            name="event_row",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="django_event_store_interned.event",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="eventsinstreams",
+            name="event",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="stream_position",
+                to="django_event_store_interned.event",
+                to_field="event_id",
+            ),
+        ),
+        migrations.RunPython(link_event_rows, unlink_event_rows),
+        migrations.AlterUniqueTogether(
+            name="eventsinstreams",
+            unique_together={("stream", "position")},
+        ),
+        migrations.RemoveField(
+            model_name="eventsinstreams",
+            name="event",
+        ),
+        migrations.RenameField(
+            model_name="eventsinstreams",
+            old_name="event_row",
+            new_name="event",
+        ),
+        migrations.AlterField(
+            model_name="eventsinstreams",
+            name="event",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="stream_position",
+                to="django_event_store_interned.event",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="eventsinstreams",
+            unique_together={("stream", "event"), ("stream", "position")},
+        ),
+    ]
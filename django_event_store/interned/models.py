@@ -0,0 +1,73 @@
+from django.db import models
+
+
+class StreamName(models.Model):
+    name = models.TextField(unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class EventType(models.Model):
+    id = models.SmallAutoField(primary_key=True)
+    name = models.TextField(unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class EventsInStreams(models.Model):
+    stream = models.ForeignKey(
+        StreamName, on_delete=models.PROTECT, related_name="+", db_index=False
+    )
+    position = models.IntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    event = models.ForeignKey(
+        "Event", on_delete=models.CASCADE, related_name="stream_position"
+    )
+
+    class Meta:
+        unique_together = [
+            ["stream", "event"],
+            ["stream", "position"],
+        ]
+        indexes = [
+            models.Index(fields=["stream", "id"], name="interned_stream_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.stream_id} ({self.event_id}) (position: {self.position})"
+
+
+class StreamHead(models.Model):
+    stream = models.OneToOneField(
+        StreamName, on_delete=models.CASCADE, related_name="+"
+    )
+    version = models.IntegerField(default=-1)
+    event_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.stream_id} (version: {self.version})"
+
+
+class Event(models.Model):
+    event_id = models.UUIDField(unique=True, db_index=True)
+    event_type = models.ForeignKey(
+        EventType, on_delete=models.PROTECT, related_name="+", db_index=False
+    )
+    data = models.JSONField()
+    metadata = models.JSONField()
+    created_at = models.DateTimeField(null=False)
+    valid_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event_type", "id"], name="interned_type_id_idx"),
+            models.Index(
+                fields=["created_at", "id"], name="interned_created_at_id_idx"
+            ),
+            models.Index(fields=["valid_at", "id"], name="interned_valid_at_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type_id} ({self.event_id})"
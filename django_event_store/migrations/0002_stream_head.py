@@ -0,0 +1,51 @@
+# Generated by Django 3.2.25 on 2026-10-17 07:31
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def create_stream_heads(apps, schema_editor):
+    EventsInStreams = apps.get_model("django_event_store", "EventsInStreams")
+    StreamHead = apps.get_model("django_event_store", "StreamHead")
+
+    StreamHead.objects.bulk_create(
+        [
+            StreamHead(
+                stream=head["stream"],
+                version=-1 if head["version"] is None else head["version"],
+                event_count=head["event_count"],
+            )
+            for head in EventsInStreams.objects.values("stream")
+            .order_by("stream")
+            .annotate(version=Max("position"), event_count=Count("id"))
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_event_store", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StreamHead",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("stream", models.TextField(unique=True)),
+                ("version", models.IntegerField(default=-1)),
+                ("event_count", models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_stream_heads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 3.2.25 on 2026-10-17 07:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_event_store", "0002_stream_head"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="created_at",
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="event_type",
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="valid_at",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["event_type", "id"], name="event_type_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["created_at", "id"], name="event_created_at_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["valid_at", "id"], name="event_valid_at_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="eventsinstreams",
+            index=models.Index(fields=["stream", "id"], name="events_in_stream_id_idx"),
+        ),
+    ]
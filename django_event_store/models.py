@@ -17,18 +17,41 @@ class EventsInStreams(models.Model):
             ["stream", "event"],
             ["stream", "position"],
         ]
+        indexes = [
+            # stream = ? ORDER BY id
+            models.Index(fields=["stream", "id"], name="events_in_stream_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.stream} ({self.event_id}) (position: {self.position})"
 
 
+class StreamHead(models.Model):
+    stream = models.TextField(unique=True)
+    version = models.IntegerField(default=-1)
+    event_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.stream} (version: {self.version})"
+
+
 class Event(models.Model):
     event_id = models.UUIDField(unique=True, db_index=True)
-    event_type = models.TextField(db_index=True)
+    event_type = models.TextField()
     data = models.JSONField()
     metadata = models.JSONField()
-    created_at = models.DateTimeField(null=False, db_index=True)
-    valid_at = models.DateTimeField(null=True, db_index=True)
+    created_at = models.DateTimeField(null=False)
+    valid_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            # event_type IN (...) ORDER BY id
+            models.Index(fields=["event_type", "id"], name="event_type_id_idx"),
+            # ORDER BY created_at, id (as_at)
+            models.Index(fields=["created_at", "id"], name="event_created_at_id_idx"),
+            # ORDER BY valid_at, id (as_of)
+            models.Index(fields=["valid_at", "id"], name="event_valid_at_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.event_type} ({self.event_id})"
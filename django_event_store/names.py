@@ -0,0 +1,189 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db import router, transaction
+
+
+class Names:
+    """
+    Stream names and event types stored as they are, in text columns.
+    """
+
+    def stream_key(self, name: str, create: bool = False):
+        return name
+
+    def stream_name(self, key) -> str:
+        return key
+
+    def event_type_key(self, name: str, create: bool = False):
+        return name
+
+    def event_type_keys(self, names: Iterable[str], create: bool = False) -> list:
+        return list(names)
+
+    def event_type_name(self, key) -> str:
+        return key
+
+    def event_type_names(self, keys: Iterable) -> List[str]:
+        return list(keys)
+
+
+class InternedNames(Names):
+    """
+    Stream names and event types interned into lookup tables and referenced
+    by integer keys.
+    """
+
+    def __init__(self, stream_name_class, event_type_class):
+        self.streams = NameCache(stream_name_class)
+        self.event_types = NameCache(event_type_class)
+
+    def stream_key(self, name: str, create: bool = False) -> Optional[int]:
+        return self.streams.key(name, create)
+
+    def stream_name(self, key: int) -> str:
+        return self.streams.name(key)
+
+    def event_type_key(self, name: str, create: bool = False) -> Optional[int]:
+        return self.event_types.key(name, create)
+
+    def event_type_keys(self, names: Iterable[str], create: bool = False) -> list:
+        names = list(names)
+        keys = self.event_types.keys_of(names, create)
+        return [keys.get(name) for name in names]
+
+    def event_type_name(self, key: int) -> str:
+        return self.event_types.name(key)
+
+    def event_type_names(self, keys: Iterable[int]) -> List[str]:
+        keys = list(keys)
+        names = self.event_types.names_of(keys)
+        return [names[key] for key in keys]
+
+
+class NameCache:
+    """
+    In-process name <-> key cache of a lookup table. A key inserted by this
+    process is shared with other threads only once its transaction commits,
+    so a rollback can't leave a key pointing to a row that doesn't exist.
+    Until then it is cached for the thread, i.e. the connection, that
+    inserted it, and dropped when the transaction or the savepoint it was
+    inserted in rolls back.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.keys: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+        # keys inserted by the thread's connection, not committed yet
+        self._local = threading.local()
+
+    def key(self, name: str, create: bool = False) -> Optional[int]:
+        return self.keys_of([name], create).get(name)
+
+    def keys_of(self, names: Iterable[str], create: bool = False) -> Dict[str, int]:
+        """
+        Keys of ``names`` with one query for those not cached yet; missing
+        names are left out, or inserted when ``create`` is true.
+        """
+        keys = {}
+        missing = set()
+        for name in names:
+            key = self.keys.get(name)
+            if key is None:
+                missing.add(name)
+            else:
+                keys[name] = key
+        if missing:
+            for name, key in self._pending_keys().items():
+                if name in missing:
+                    keys[name] = key
+                    missing.discard(name)
+        if not missing:
+            return keys
+
+        for name, key in self.model.objects.filter(name__in=missing).values_list(
+            "name", "pk"
+        ):
+            self._remember(name, key)
+            keys[name] = key
+            missing.discard(name)
+        if create:
+            for name in sorted(missing):
+                row, created = self.model.objects.get_or_create(name=name)
+                if created:
+                    self._remember_on_commit(name, row.pk)
+                else:
+                    self._remember(name, row.pk)
+                keys[name] = row.pk
+        return keys
+
+    def name(self, key: int) -> str:
+        return self.names_of([key])[key]
+
+    def names_of(self, keys: Iterable[int]) -> Dict[int, str]:
+        names = {}
+        missing = set()
+        for key in keys:
+            name = self.names.get(key)
+            if name is None:
+                missing.add(key)
+            else:
+                names[key] = name
+        if missing:
+            for key, name in self._pending_names().items():
+                if key in missing:
+                    names[key] = name
+                    missing.discard(key)
+        if missing:
+            for key, name in self.model.objects.filter(pk__in=missing).values_list(
+                "pk", "name"
+            ):
+                self._remember(name, key)
+                names[key] = name
+        return names
+
+    def _remember(self, name: str, key: int) -> None:
+        # rows of this connection's open transaction stay out of the shared
+        # cache even when a query reads them back
+        if key not in self._pending_names():
+            self.keys[name] = key
+            self.names[key] = name
+
+    def _remember_on_commit(self, name: str, key: int) -> None:
+        def committed():
+            self._pending().pop(name, None)
+            self._remember(name, key)
+
+        # cached for this connection before on_commit, which runs the
+        # callback right away outside of a transaction
+        self._pending_entries()[name] = (key, committed)
+        transaction.on_commit(committed, using=self._using())
+
+    def _pending_keys(self) -> Dict[str, int]:
+        return {name: key for name, (key, _) in self._pending_entries().items()}
+
+    def _pending_names(self) -> Dict[int, str]:
+        return {key: name for name, (key, _) in self._pending_entries().items()}
+
+    def _pending_entries(self) -> Dict[str, Tuple[int, Callable]]:
+        # Django discards the on_commit callbacks of rolled back savepoints
+        # and transactions, a pending key without its callback is gone
+        pending = self._pending()
+        if pending:
+            connection = transaction.get_connection(self._using())
+            registered = {id(callback[1]) for callback in connection.run_on_commit}
+            for name, (_, committed) in list(pending.items()):
+                if id(committed) not in registered:
+                    del pending[name]
+        return pending
+
+    def _pending(self) -> Dict[str, Tuple[int, Callable]]:
+        try:
+            return self._local.pending
+        except AttributeError:
+            self._local.pending = {}
+            return self._local.pending
+
+    def _using(self) -> str:
+        return router.db_for_write(self.model)
@@ -1,7 +1,13 @@
+from event_store.async_client import AsyncClient
+from event_store.async_in_memory_repository import AsyncInMemoryRepository
+from event_store.async_repository import AsyncEventsRepository
+from event_store.broker import batch_handler
 from event_store.client import Client
-from event_store.dispatcher import Dispatcher
+from event_store.concurrent_dispatcher import ConcurrentDispatcher
+from event_store.dispatcher import Dispatcher, Scope
 from event_store.event import Event
 from event_store.exceptions import (
+    DispatchError,
     EventNotFound,
     IncorrectStreamData,
     InvalidPageSize,
@@ -15,17 +21,24 @@ from event_store.stream import GLOBAL_STREAM
 from event_store.subscriptions import Subscriptions
 
 __all__ = [
+    "AsyncClient",
+    "AsyncEventsRepository",
+    "AsyncInMemoryRepository",
     "Client",
+    "ConcurrentDispatcher",
     "Dispatcher",
     "EventsRepository",
     "InMemoryRepository",
+    "Scope",
     "Subscriptions",
     "Event",
     "Record",
+    "DispatchError",
     "IncorrectStreamData",
     "EventNotFound",
     "InvalidPageSize",
     "InvalidPageStart",
     "InvalidPageStop",
     "GLOBAL_STREAM",
+    "batch_handler",
 ]
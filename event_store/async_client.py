@@ -0,0 +1,101 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from event_store.async_repository import AsyncEventsRepository
+from event_store.async_specification import AsyncSpecification
+from event_store.async_specification_reader import AsyncSpecificationReader
+from event_store.client import ClientBase, Events
+from event_store.dispatcher import Dispatcher, DispatcherBase
+from event_store.event_id import IdGenerator, new_id
+from event_store.expected_version import ExpectedVersion
+from event_store.mappers.pipeline_mapper import PipelineMapper
+from event_store.stream import GLOBAL_STREAM, Stream
+from event_store.subscriptions import Subscriptions
+
+
+class AsyncClient(ClientBase):
+    """
+    Client for asyncio code, on top of an AsyncEventsRepository. Subscribers
+    are called the same way as by Client, once the events are stored.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncEventsRepository,
+        subscriptions: Optional[Subscriptions] = None,
+        dispatcher: DispatcherBase = Dispatcher(),
+        mapper: Optional[PipelineMapper] = None,
+        clock: Callable = datetime.now,
+        id_generator: IdGenerator = new_id,
+    ):
+        super().__init__(
+            repository, subscriptions, dispatcher, mapper, clock, id_generator
+        )
+
+    async def publish(
+        self,
+        events: Events,
+        stream_name: str = GLOBAL_STREAM,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncClient":
+        if not isinstance(events, Iterable):
+            events = [events]
+
+        enriched_events = self._enrich_events_metadata(events)
+        records = self._transform(enriched_events)
+        await self.repository.append_to_stream(
+            records, Stream.new(stream_name), expected_version
+        )
+
+        await self.broker.call_many_async(zip(enriched_events, records))
+
+        return self
+
+    async def append(
+        self,
+        events: Events,
+        stream_name: str = GLOBAL_STREAM,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncClient":
+        if not isinstance(events, Iterable):
+            events = [events]
+
+        await self.repository.append_to_stream(
+            self._transform(self._enrich_events_metadata(events)),
+            Stream.new(stream_name),
+            expected_version,
+        )
+        return self
+
+    async def append_many(
+        self, streams: Dict[str, Tuple[Events, ExpectedVersion]]
+    ) -> "AsyncClient":
+        await self.repository.append_many(self._records_by_stream(streams))
+        return self
+
+    async def link(
+        self,
+        event_ids: Sequence[str],
+        stream_name: str,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncClient":
+        await self.repository.link_to_stream(
+            event_ids, Stream.new(stream_name), expected_version
+        )
+        return self
+
+    def read(self) -> AsyncSpecification:
+        return AsyncSpecification(
+            AsyncSpecificationReader(self.repository, self.mapper)
+        )
+
+    async def delete_stream(self, stream_name: str) -> "AsyncClient":
+        await self.repository.delete_stream(Stream(stream_name))
+        return self
+
+    async def streams_of(self, event_id: str) -> list:
+        return await self.repository.streams_of(event_id)
+
+    async def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return await self.repository.streams_of_many(event_ids)
@@ -0,0 +1,67 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from event_store.async_repository import AsyncEventsRepository, iterate
+from event_store.expected_version import ExpectedVersion
+from event_store.in_memory_repository import InMemoryRepository
+from event_store.repository import Records
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+
+class AsyncInMemoryRepository(AsyncEventsRepository):
+    """
+    Asyncio interface of InMemoryRepository, nothing in it blocks so calls
+    run right on the event loop.
+    """
+
+    def __init__(self, repository: Optional[InMemoryRepository] = None):
+        self.repository = repository or InMemoryRepository()
+
+    async def append_to_stream(
+        self,
+        records: Records,
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncInMemoryRepository":
+        self.repository.append_to_stream(records, stream, expected_version)
+        return self
+
+    async def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "AsyncInMemoryRepository":
+        self.repository.append_many(streams)
+        return self
+
+    async def link_to_stream(
+        self,
+        event_ids: List[str],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncInMemoryRepository":
+        self.repository.link_to_stream(event_ids, stream, expected_version)
+        return self
+
+    async def read(self, spec: SpecificationResult):
+        result = self.repository.read(spec)
+        if spec.first or spec.last:
+            return result
+        return iterate(result)
+
+    async def has_event(self, event_id: str) -> bool:
+        return self.repository.has_event(event_id)
+
+    async def delete_stream(self, stream: Stream) -> "AsyncInMemoryRepository":
+        self.repository.delete_stream(stream)
+        return self
+
+    async def count(self, spec: SpecificationResult) -> int:
+        return self.repository.count(spec)
+
+    async def streams_of(self, event_id: str) -> list:
+        return self.repository.streams_of(event_id)
+
+    async def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return self.repository.streams_of_many(event_ids)
+
+    async def position_in_stream(self, event_id: str, stream: Stream) -> int:
+        return self.repository.position_in_stream(event_id, stream)
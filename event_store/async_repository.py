@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+from event_store.expected_version import ExpectedVersion
+from event_store.repository import Records
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+
+class AsyncEventsRepository(ABC):
+    """
+    EventsRepository for asyncio code, every method is a coroutine.
+
+    read() returns a record or None for first/last reads, an async iterator of
+    records for streamed reads and an async iterator of batches otherwise.
+    """
+
+    @abstractmethod
+    async def append_to_stream(
+        self,
+        records: Records,
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncEventsRepository":
+        pass
+
+    @abstractmethod
+    async def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "AsyncEventsRepository":
+        pass
+
+    @abstractmethod
+    async def link_to_stream(
+        self,
+        event_ids: List[str],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "AsyncEventsRepository":
+        pass
+
+    @abstractmethod
+    async def read(self, spec: SpecificationResult) -> Any:
+        pass
+
+    @abstractmethod
+    async def has_event(self, event_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete_stream(self, stream: Stream) -> "AsyncEventsRepository":
+        pass
+
+    @abstractmethod
+    async def count(self, spec: SpecificationResult) -> int:
+        pass
+
+    @abstractmethod
+    async def streams_of(self, event_id: str) -> list:
+        pass
+
+    async def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return {event_id: await self.streams_of(event_id) for event_id in event_ids}
+
+    @abstractmethod
+    async def position_in_stream(self, event_id: str, stream: Stream) -> int:
+        pass
+
+
+async def iterate(iterable) -> AsyncIterator:
+    for item in iterable:
+        yield item
@@ -0,0 +1,65 @@
+from event_store.async_specification_reader import AsyncSpecificationReader
+from event_store.exceptions import EventNotFound
+from event_store.specification import Specification
+
+
+class AsyncSpecification(Specification):
+    """
+    Specification read with ``await`` and ``async for``, it is built the same
+    way as the synchronous one:
+
+        async for event in client.read().stream("orders").of_type(Placed):
+            ...
+    """
+
+    reader: AsyncSpecificationReader
+
+    def __aiter__(self):
+        return self.each()
+
+    async def count(self) -> int:
+        return await self.reader.count(self.result)
+
+    async def each_batch(self):
+        if self.result.streamed:
+            batch = []
+            async for event in self.each():
+                batch.append(event)
+                if len(batch) == self.result.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+
+        async for batch in self.reader.each(
+            self.in_batches(self.result.batch_size).result
+        ):
+            yield batch
+
+    async def each(self):
+        if self.result.streamed:
+            async for event in self.reader.each_streamed(self.result):
+                yield event
+            return
+
+        async for batch in self.each_batch():
+            for event in batch:
+                yield event
+
+    async def first(self):
+        return await self.reader.one(self.read_first().result)
+
+    async def last(self):
+        return await self.reader.one(self.read_last().result)
+
+    async def event(self, event_id: str):
+        result = await self.reader.one(self.read_first().with_ids([event_id]).result)
+
+        if not result:
+            raise EventNotFound(f"Event with ID {event_id} not found in stream")
+
+        return result
+
+    async def execute(self) -> list:
+        return [event async for event in self.each()]
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from event_store.async_repository import AsyncEventsRepository
+
+
+class AsyncSpecificationReader:
+    def __init__(self, repository: "AsyncEventsRepository", mapper):
+        self.repository = repository
+        self.mapper = mapper
+
+    async def one(self, specification_result):
+        record = await self.repository.read(specification_result)
+        return self.mapper.record_to_event(record) if record else None
+
+    async def each(self, specification_result):
+        async for batch in await self.repository.read(specification_result):
+            yield self.mapper.records_to_events(batch)
+
+    async def each_streamed(self, specification_result):
+        async for record in await self.repository.read(specification_result):
+            yield self.mapper.record_to_event(record)
+
+    async def count(self, specification_result):
+        return await self.repository.count(specification_result)
+
+    async def has_event(self, event_id):
+        return await self.repository.has_event(event_id)
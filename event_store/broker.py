@@ -1,19 +1,37 @@
-from typing import Callable, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-from event_store.dispatcher import DispatcherBase
+from event_store.dispatcher import Call, DispatcherBase
 from event_store.event import Event
 from event_store.subscriptions import Subscriptions
 
 
+def batch_handler(subscriber: Callable) -> Callable:
+    """
+    Marks a subscriber, function or class, as taking the list of events of a
+    publish it is subscribed to, in stream order, instead of one event per
+    call.
+    """
+    subscriber.accepts_batch = True
+    return subscriber
+
+
+def is_batch_handler(subscriber) -> bool:
+    return getattr(subscriber, "accepts_batch", False) is True
+
+
 class Broker:
     def __init__(self, subscriptions: Subscriptions, dispatcher: DispatcherBase):
         self.subscriptions = subscriptions
         self.dispatcher = dispatcher
 
     def call(self, event: Event, record):
-        subscribers = self.subscriptions.all_for(event.event_type)
-        for subscriber in subscribers:
-            self.dispatcher.dispatch(subscriber, event, record)
+        self.call_many([(event, record)])
+
+    def call_many(self, events: Iterable[Tuple[Event, Any]]):
+        self.dispatcher.dispatch_many(self._calls(events))
+
+    async def call_many_async(self, events: Iterable[Tuple[Event, Any]]):
+        await self.dispatcher.dispatch_many_async(self._calls(events))
 
     def add_subscription(self, subscriber: Callable, event_types: Iterable):
         self._verify_subscription(subscriber)
@@ -23,6 +41,31 @@ class Broker:
         self._verify_subscription(subscriber)
         self.subscriptions.add_global_subscription(subscriber)
 
+    def _calls(self, events: Iterable[Tuple[Event, Any]]) -> List[Call]:
+        """
+        One call per event and subscriber, except for batch handlers, which
+        get a single call with the lists of their events and records, placed
+        where their first event would be.
+        """
+        calls: List[Call] = []
+        batches: Dict[int, Tuple[list, list]] = {}
+        for event, record in events:
+            for subscriber in self.subscriptions.subscribers_for(event.event_type):
+                if not is_batch_handler(subscriber):
+                    calls.append((subscriber, event, record))
+                    continue
+                batch = batches.get(id(subscriber))
+                if batch is None:
+                    batch = batches[id(subscriber)] = ([], [])
+                    calls.append((subscriber, *batch))
+                batch[0].append(event)
+                batch[1].append(record)
+        return calls
+
     def _verify_subscription(self, subscriber):
         if not callable(subscriber):
             raise TypeError("Handler have to be callable.")
+        if is_batch_handler(subscriber) and not self.dispatcher.supports_batch(
+            subscriber
+        ):
+            raise TypeError("Dispatcher can't call batch handler.")
@@ -1,5 +1,11 @@
 class CeleryScheduler:
+    def __init__(self, serializer=None):
+        # sends data and metadata encoded, reusing the encoding of storage
+        self.serializer = serializer
+
     def call(self, task, record):
+        if self.serializer is not None:
+            record = record.serialize(self.serializer)
         task.apply_async(args=(record.to_dict(),))
 
     def verify(self, subscriber) -> bool:
@@ -2,15 +2,25 @@ from abc import abstractmethod
 
 from celery import Task
 
-from event_store import Event
+from event_store.event_registry import event_classes
 
 
 class EventHandlerBaseTask(Task):
+    registry = event_classes
+    # the serializer of the CeleryScheduler, if it has one
+    serializer = None
+
     def deserialize(self, payload):
-        return type(payload.get("event_type"), (Event,), {})(
+        data, metadata = payload.get("data"), payload.get("metadata")
+        if self.serializer is not None:
+            data, metadata = self.serializer.loads(data), self.serializer.loads(
+                metadata
+            )
+        return self.registry.build(
+            payload.get("event_type"),
             event_id=payload.get("event_id"),
-            data=payload.get("data"),
-            metadata=payload.get("metadata"),
+            data=data,
+            metadata=metadata,
         )
 
     @abstractmethod
@@ -1,11 +1,12 @@
-import uuid
+import typing
 from collections import Iterable
 from datetime import datetime
-from typing import Callable, List, Optional, Sequence, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from event_store.broker import Broker
 from event_store.dispatcher import Dispatcher, DispatcherBase
 from event_store.event import Event
+from event_store.event_id import IdGenerator, new_id
 from event_store.expected_version import ExpectedVersion
 from event_store.mappers.default import Default
 from event_store.mappers.pipeline_mapper import PipelineMapper
@@ -15,26 +16,95 @@ from event_store.specification import Specification
 from event_store.specification_reader import SpecificationReader
 from event_store.stream import GLOBAL_STREAM, Stream
 from event_store.subscriptions import Subscriptions
+from event_store.write_behind import WriteBehindQueue
 
 Events = Union[Event, List[Event]]
 
 
-class Client:
+class ClientBase:
+    """
+    Subscriptions and event to record mapping shared by Client and
+    AsyncClient.
+    """
+
     def __init__(
         self,
-        repository: EventsRepository,
+        repository,
         subscriptions: Optional[Subscriptions] = None,
         dispatcher: DispatcherBase = Dispatcher(),
         mapper: Optional[PipelineMapper] = None,
         clock: Callable = datetime.now,
+        id_generator: IdGenerator = new_id,
     ):
         self.repository = repository
         self.subscriptions = subscriptions or Subscriptions()
         self.broker = Broker(self.subscriptions, dispatcher)
-        self.correlation_id_generator = lambda: str(uuid.uuid4())
+        self.correlation_id_generator = id_generator
         self.mapper = mapper or Default()
         self.clock = clock
 
+    def subscribe(self, subscriber: Callable, to: List) -> "ClientBase":
+        if not isinstance(to, Iterable):
+            to = [to]
+        self.broker.add_subscription(subscriber, to)
+        return self
+
+    def _records_by_stream(
+        self, streams: Dict[str, Tuple[Events, ExpectedVersion]]
+    ) -> Dict[str, Tuple[Records, ExpectedVersion]]:
+        stream_events = {}
+        unique_events: Dict[str, Event] = {}
+        for stream_name, (events, expected_version) in streams.items():
+            if not isinstance(events, Iterable):
+                events = [events]
+            for event in events:
+                unique_events.setdefault(event.event_id, event)
+            stream_events[stream_name] = (events, expected_version)
+
+        records = dict(
+            zip(
+                unique_events,
+                self._transform(self._enrich_events_metadata(unique_events.values())),
+            )
+        )
+        return {
+            stream_name: ([records[event.event_id] for event in events], version)
+            for stream_name, (events, version) in stream_events.items()
+        }
+
+    def _transform(self, events: Events) -> List[Record]:
+        return self.mapper.events_to_records(list(events))
+
+    def _enrich_events_metadata(self, events: Events) -> Events:
+        for event in events:
+            self._enrich_event_metadata(event)
+        return events
+
+    def _enrich_event_metadata(self, event: Event) -> Event:
+        # TODO unit test for timestamp and json serialization
+        event.metadata["timestamp"] = self.clock().timestamp()
+        event.metadata["valid_at"] = event.metadata["timestamp"]
+        event.metadata["correlation_id"] = self.correlation_id_generator()
+        return event
+
+
+class Client(ClientBase):
+    def __init__(
+        self,
+        repository: EventsRepository,
+        subscriptions: Optional[Subscriptions] = None,
+        dispatcher: DispatcherBase = Dispatcher(),
+        mapper: Optional[PipelineMapper] = None,
+        clock: Callable = datetime.now,
+        id_generator: IdGenerator = new_id,
+        write_behind: Optional[WriteBehindQueue] = None,
+    ):
+        super().__init__(
+            repository, subscriptions, dispatcher, mapper, clock, id_generator
+        )
+        # publish/append with ExpectedVersion.any() return before the write
+        self.write_behind = write_behind
+
     def publish(
         self,
         events: Events,
@@ -48,8 +118,7 @@ class Client:
         records = self._transform(enriched_events)
         self.append_records_to_stream(list(records), stream_name, expected_version)
 
-        for event, record in zip(enriched_events, records):
-            self.broker.call(event, record)
+        self.broker.call_many(zip(enriched_events, records))
 
         return self
 
@@ -70,51 +139,82 @@ class Client:
 
         return self
 
+    def append_many(
+        self, streams: Dict[str, Tuple[Events, ExpectedVersion]]
+    ) -> "Client":
+        """
+        Appends events to several streams at once, e.g. to an aggregate stream
+        and to index streams. An event listed under more than one stream is
+        stored once and linked to the others.
+        """
+        stream_records = self._records_by_stream(streams)
+        self.flush()
+        self.repository.append_many(stream_records)
+        return self
+
+    def append_iter(
+        self,
+        events: typing.Iterable[Event],
+        stream_name: str = GLOBAL_STREAM,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+    ) -> "Client":
+        """
+        Appends events pulled lazily from ``events``, the repository stores
+        them batch by batch, without holding all of them in memory.
+        """
+        self.flush()
+        self.repository.append_iter(
+            (
+                self.mapper.event_to_record(self._enrich_event_metadata(event))
+                for event in events
+            ),
+            Stream.new(stream_name),
+            expected_version,
+        )
+        return self
+
     def link(
         self,
         event_ids: Sequence[str],
         stream_name: str,
         expected_version: ExpectedVersion = ExpectedVersion.any(),
     ):
+        self.flush()
         self.repository.link_to_stream(
             event_ids, Stream.new(stream_name), expected_version
         )
         return self
 
-    def subscribe(self, subscriber: Callable, to: List) -> "Client":
-        if not isinstance(to, Iterable):
-            to = [to]
-        self.broker.add_subscription(subscriber, to)
-        return self
-
     def read(self) -> Specification:
         return Specification(SpecificationReader(self.repository, self.mapper))
 
     def append_records_to_stream(
         self, records: Records, stream_name: str, expected_version: ExpectedVersion
     ) -> None:
+        if self.write_behind is not None and expected_version.is_any():
+            self.write_behind.put(records, stream_name)
+            return
+        # writes with expectations see the stream with all queued records
+        self.flush()
         self.repository.append_to_stream(
             records, Stream.new(stream_name), expected_version
         )
 
+    def flush(self) -> "Client":
+        """
+        Waits for records queued in write-behind mode to be written.
+        """
+        if self.write_behind is not None:
+            self.write_behind.flush()
+        return self
+
     def delete_stream(self, stream_name: str) -> "Client":
+        self.flush()
         self.repository.delete_stream(Stream(stream_name))
         return self
 
     def streams_of(self, event_id: str) -> list:
         return self.repository.streams_of(event_id)
 
-    def _transform(self, events: Events) -> List[Record]:
-        return [self.mapper.event_to_record(event) for event in events]
-
-    def _enrich_events_metadata(self, events: Events) -> Events:
-        for event in events:
-            self._enrich_event_metadata(event)
-        return events
-
-    def _enrich_event_metadata(self, event: Event) -> Event:
-        # TODO unit test for timestamp and json serialization
-        event.metadata["timestamp"] = self.clock().timestamp()
-        event.metadata["valid_at"] = event.metadata["timestamp"]
-        event.metadata["correlation_id"] = self.correlation_id_generator()
-        return event
+    def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return self.repository.streams_of_many(event_ids)
@@ -17,3 +17,9 @@ class ComposedDispatcher(DispatcherBase):
         for dispatcher in self.dispatchers:
             dispatcher.verify(subscriber)
         return True
+
+    def supports_batch(self, subscriber) -> bool:
+        for dispatcher in self.dispatchers:
+            if dispatcher.verify(subscriber):
+                return dispatcher.supports_batch(subscriber)
+        return True
@@ -0,0 +1,217 @@
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from event_store.dispatcher import Call, Dispatcher, Scope, instantiate
+from event_store.exceptions import DispatchError
+
+# subscriber, event, exception
+Failure = Tuple[Any, Any, BaseException]
+
+
+class ConcurrentDispatcher(Dispatcher):
+    """
+    Runs the subscribers of a publish concurrently, plain handlers on a thread
+    pool and coroutine handlers as asyncio tasks, so one slow subscriber
+    doesn't hold up the others. A subscriber gets the events of a publish, all
+    of one stream, one after another in stream order. With ``ordered=False``
+    every event is dispatched on its own, in no particular order.
+
+    Every subscriber runs even if others fail. Failures are raised together,
+    as DispatchError, once all subscribers are done; a failed subscriber
+    doesn't get the rest of the events, to keep their order. Subscribers
+    still running after ``timeout`` seconds are reported with TimeoutError.
+    Coroutine handlers are cancelled then, threads can't be and finish in the
+    background. Handler classes are created as by Dispatcher.
+
+    A publish made by a subscriber running on the pool is dispatched inline
+    in that worker thread, without ``timeout``: waiting for other workers
+    could wait forever once all of them are busy.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        ordered: bool = True,
+        scope: Scope = Scope.EVENT,
+        factory: Callable[[type], Callable] = instantiate,
+    ):
+        super().__init__(scope, factory)
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers, thread_name_prefix="event-store-dispatch"
+        )
+        self.timeout = timeout
+        self.ordered = ordered
+        # set in the threads running work of this dispatcher's pool
+        self._local = threading.local()
+
+    def dispatch(self, subscriber, event, record) -> None:
+        self.dispatch_many([(subscriber, event, record)])
+
+    def dispatch_many(self, calls: Sequence[Call]) -> None:
+        if getattr(self._local, "in_worker", False):
+            self._dispatch_inline(calls)
+            return
+
+        started = time.monotonic()
+        groups = self._groups(calls)
+        futures = {
+            self.executor.submit(self._in_worker, self._run, group): group
+            for group in groups
+            if not group.coroutine
+        }
+        failures = self._run_coroutines([group for group in groups if group.coroutine])
+
+        timeout = None
+        if self.timeout is not None:
+            timeout = max(self.timeout - (time.monotonic() - started), 0)
+        done, not_done = wait(futures, timeout=timeout)
+        failures += [future.result() for future in done if future.result()]
+        failures += [self._timed_out(futures[future]) for future in not_done]
+        self._raise(failures)
+
+    async def dispatch_many_async(self, calls: Sequence[Call]) -> None:
+        loop = asyncio.get_running_loop()
+        tasks = {}
+        for group in self._groups(calls):
+            if group.coroutine:
+                task = asyncio.ensure_future(self._run_async(group))
+            else:
+                task = loop.run_in_executor(
+                    self.executor, self._in_worker, self._run, group
+                )
+            tasks[task] = group
+        self._raise(await self._wait(tasks))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+    def _groups(self, calls: Sequence[Call]) -> List["_Group"]:
+        if self.ordered:
+            # by identity, subscribers don't have to be hashable
+            grouped: Dict[int, List[Call]] = {}
+            for call in calls:
+                grouped.setdefault(id(call[0]), []).append(call)
+            groups = [_Group(group) for group in grouped.values()]
+        else:
+            groups = [_Group([call]) for call in calls]
+
+        # shared instances are created here, not racing in the workers
+        publish: Dict[type, Callable] = {}
+        for group in groups:
+            if self.scope is not Scope.EVENT or not isinstance(group.subscriber, type):
+                group.handler = self.handler(group.subscriber, publish)
+        return groups
+
+    def _dispatch_inline(self, calls: Sequence[Call]) -> None:
+        groups = self._groups(calls)
+        failures = [
+            failure
+            for failure in (self._run(group) for group in groups if not group.coroutine)
+            if failure
+        ]
+        failures += self._run_coroutines([group for group in groups if group.coroutine])
+        self._raise(failures)
+
+    def _in_worker(self, function: Callable, *args) -> Any:
+        self._local.in_worker = True
+        try:
+            return function(*args)
+        finally:
+            self._local.in_worker = False
+
+    def _run(self, group: "_Group") -> Optional[Failure]:
+        for group.position, (subscriber, event, _) in enumerate(group.calls):
+            try:
+                group.handler_for(self)(event)
+            except Exception as error:
+                return subscriber, event, error
+        return None
+
+    async def _run_async(self, group: "_Group") -> Optional[Failure]:
+        for group.position, (subscriber, event, _) in enumerate(group.calls):
+            try:
+                await group.handler_for(self)(event)
+            except Exception as error:
+                return subscriber, event, error
+        return None
+
+    def _run_coroutines(self, groups: List["_Group"]) -> List[Failure]:
+        if not groups:
+            return []
+
+        async def run():
+            return await self._wait(
+                {
+                    asyncio.ensure_future(self._run_async(group)): group
+                    for group in groups
+                }
+            )
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+        # a sync publish from async code, this thread's loop is busy
+        if getattr(self._local, "in_worker", False):
+            # from a coroutine handler on the pool, which may have no free worker
+            with ThreadPoolExecutor(1) as executor:
+                return executor.submit(self._in_worker, asyncio.run, run()).result()
+        return self.executor.submit(self._in_worker, asyncio.run, run()).result()
+
+    async def _wait(self, tasks: Dict[asyncio.Future, "_Group"]) -> List[Failure]:
+        if not tasks:
+            return []
+        done, pending = await asyncio.wait(tasks, timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+        failures = [task.result() for task in done if task.result()]
+        return failures + [self._timed_out(tasks[task]) for task in pending]
+
+    def _timed_out(self, group: "_Group") -> Failure:
+        return (
+            group.subscriber,
+            group.event,
+            TimeoutError(
+                f"{group.subscriber!r} did not finish within {self.timeout} s."
+            ),
+        )
+
+    def _raise(self, failures: List[Failure]) -> None:
+        if failures:
+            raise DispatchError(failures) from failures[0][2]
+
+
+class _Group:
+    """
+    Calls of one subscriber, run in order, and how far they got.
+    """
+
+    def __init__(self, calls: List[Call]):
+        self.calls = calls
+        self.position = 0
+        self.subscriber = calls[0][0]
+        self.coroutine = _is_coroutine(self.subscriber)
+        # None for handler classes instantiated for every event
+        self.handler: Optional[Callable] = None
+
+    def handler_for(self, dispatcher: Dispatcher) -> Callable:
+        if self.handler is None:
+            return dispatcher.handler(self.subscriber)
+        return self.handler
+
+    @property
+    def event(self):
+        return self.calls[self.position][1]
+
+
+def _is_coroutine(subscriber) -> bool:
+    # async functions, and classes or instances with an async __call__
+    return inspect.iscoroutinefunction(subscriber) or inspect.iscoroutinefunction(
+        getattr(subscriber, "__call__", None)
+    )
@@ -1,4 +1,11 @@
+import inspect
+import threading
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# subscriber, event, record
+Call = Tuple[Any, Any, Any]
 
 
 class DispatcherBase(ABC):
@@ -11,11 +18,96 @@ class DispatcherBase(ABC):
     def verify(self, subscriber) -> bool:
         pass
 
+    def supports_batch(self, subscriber) -> bool:
+        """
+        Whether ``subscriber`` can be called with the lists of events and
+        records of a publish, see ``batch_handler``.
+        """
+        return True
+
+    def dispatch_many(self, calls: Sequence[Call]) -> None:
+        """
+        Dispatches all subscriber calls of one publish, in order.
+        """
+        for subscriber, event, record in calls:
+            self.dispatch(subscriber, event, record)
+
+    async def dispatch_many_async(self, calls: Sequence[Call]) -> None:
+        self.dispatch_many(calls)
+
+
+class Scope(Enum):
+    """
+    How long a handler class instance lives: for the whole process, for one
+    publish or for one event.
+    """
+
+    SINGLETON = "singleton"
+    PUBLISH = "publish"
+    EVENT = "event"
+
+
+def instantiate(handler_class: type) -> Callable:
+    return handler_class()
+
 
 class Dispatcher(DispatcherBase):
+    """
+    Calls subscribers in the current thread. Handler classes are created by
+    ``factory`` with the lifetime set by ``scope``, a new instance for every
+    event by default.
+    """
+
+    def __init__(
+        self,
+        scope: Scope = Scope.EVENT,
+        factory: Callable[[type], Callable] = instantiate,
+    ):
+        self.scope = scope
+        self.factory = factory
+        self._singletons: Dict[type, Callable] = {}
+        self._lock = threading.Lock()
+
     def dispatch(self, subscriber, event, _) -> None:
-        subscriber = subscriber() if isinstance(subscriber, type) else subscriber
-        subscriber(event)
+        self.handler(subscriber)(event)
+
+    def dispatch_many(self, calls: Sequence[Call]) -> None:
+        publish: Dict[type, Callable] = {}
+        for subscriber, event, _ in calls:
+            self.handler(subscriber, publish)(event)
+
+    async def dispatch_many_async(self, calls: Sequence[Call]) -> None:
+        # coroutine handlers are awaited, one after another like the others
+        publish: Dict[type, Callable] = {}
+        for subscriber, event, _ in calls:
+            result = self.handler(subscriber, publish)(event)
+            if inspect.isawaitable(result):
+                await result
+
+    def handler(
+        self, subscriber, publish: Optional[Dict[type, Callable]] = None
+    ) -> Callable:
+        """
+        Callable of ``subscriber``, ``publish`` keeps the instances of
+        handler classes created during the current publish.
+        """
+        if not isinstance(subscriber, type):
+            return subscriber
+        if self.scope is Scope.SINGLETON:
+            try:
+                return self._singletons[subscriber]
+            except KeyError:
+                with self._lock:
+                    if subscriber not in self._singletons:
+                        self._singletons[subscriber] = self.factory(subscriber)
+                return self._singletons[subscriber]
+        if self.scope is Scope.PUBLISH and publish is not None:
+            try:
+                return publish[subscriber]
+            except KeyError:
+                handler = publish[subscriber] = self.factory(subscriber)
+                return handler
+        return self.factory(subscriber)
 
     def verify(self, subscriber) -> bool:
         if not callable(subscriber):
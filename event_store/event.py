@@ -1,15 +1,23 @@
-import uuid
 from typing import Any, Optional
 
+from event_store.event_id import new_id
+
 
 class Event:
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if register:
+            from event_store.event_registry import event_classes
+
+            event_classes.register(cls)
+
     def __init__(
         self,
         event_id: Optional[str] = None,
         metadata: Optional[dict] = None,
         data: Optional[dict] = None,
     ):
-        self.event_id = event_id or str(uuid.uuid4())
+        self.event_id = event_id or new_id()
         self.metadata = metadata or {}
         self.data = data or {}
 
@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+import uuid
+from typing import Callable
+
+IdGenerator = Callable[[], str]
+
+
+def uuid4() -> str:
+    return str(uuid.uuid4())
+
+
+class UUID7:
+    """
+    Time-ordered UUID version 7 (RFC 9562): 48 bit unix timestamp in
+    milliseconds, 12 bit counter and 62 random bits. Ids generated later sort
+    after earlier ones, also within the same millisecond, so new rows land at
+    the end of an index on the id instead of all over it.
+    """
+
+    COUNTER_MAX = 0xFFF
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timestamp = 0
+        self._counter = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            timestamp = time.time_ns() // 1_000_000
+            if timestamp > self._timestamp:
+                self._timestamp = timestamp
+                # random start leaves room for increments within the millisecond
+                self._counter = int.from_bytes(os.urandom(2), "big") >> 5
+            elif self._counter < self.COUNTER_MAX:
+                self._counter += 1
+            else:
+                # counter overflow, borrow the next millisecond
+                self._timestamp += 1
+                self._counter = 0
+            timestamp, counter = self._timestamp, self._counter
+
+        value = (
+            (timestamp & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | int.from_bytes(os.urandom(8), "big") >> 2
+        )
+        return str(uuid.UUID(int=value))
+
+
+uuid7 = UUID7()
+
+_generator: IdGenerator = uuid4
+
+
+def new_id() -> str:
+    """
+    Id of a new event or correlation, from the generator set with
+    set_id_generator, random UUID4 by default.
+    """
+    return _generator()
+
+
+def set_id_generator(generator: IdGenerator) -> None:
+    global _generator
+    _generator = generator
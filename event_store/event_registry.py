@@ -0,0 +1,76 @@
+import threading
+import types
+import warnings
+from typing import Dict, Optional, Set, Type
+
+from event_store.event import Event
+
+
+class EventClassRegistry:
+    """
+    Event classes by event type. Event subclasses register themselves under
+    their class name in ``event_classes`` when defined, unless declared with
+    ``register=False``. A different class registered later under the same
+    event type replaces the earlier one with a RuntimeWarning, two event
+    classes sharing a name need ``register=False`` or an explicit
+    ``event_type``. Types without a class get one synthesized Event subclass
+    each, created on first use and replaced silently by a class registered
+    later.
+    """
+
+    def __init__(self):
+        self._classes: Dict[str, Type[Event]] = {}
+        self._synthesized: Set[Type[Event]] = set()
+        self._lock = threading.Lock()
+
+    def register(
+        self, event_class: Type[Event], event_type: Optional[str] = None
+    ) -> Type[Event]:
+        event_type = event_type or event_class.__name__
+        registered = self._classes.get(event_type)
+        if (
+            registered is not None
+            and registered is not event_class
+            and registered not in self._synthesized
+        ):
+            warnings.warn(
+                f"Event type {event_type!r} of {_qualified_name(registered)} "
+                f"is now registered to {_qualified_name(event_class)}.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self._classes[event_type] = event_class
+        return event_class
+
+    def resolve(self, event_type: str) -> Type[Event]:
+        try:
+            return self._classes[event_type]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if event_type not in self._classes:
+                event_class = types.new_class(event_type, (Event,), {"register": False})
+                self._synthesized.add(event_class)
+                self._classes[event_type] = event_class
+            return self._classes[event_type]
+
+    def build(
+        self, event_type: str, event_id: str, data: dict, metadata: dict
+    ) -> Event:
+        """
+        Event of the class of ``event_type`` with the stored attributes. The
+        class __init__ isn't called, it may take arguments of its own.
+        """
+        event = Event.__new__(self.resolve(event_type))
+        event.event_id = event_id
+        event.data = data or {}
+        event.metadata = metadata or {}
+        return event
+
+
+def _qualified_name(event_class: type) -> str:
+    return f"{event_class.__module__}.{event_class.__qualname__}"
+
+
+event_classes = EventClassRegistry()
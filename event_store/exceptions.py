@@ -24,3 +24,14 @@ class EventDuplicatedInStream(BaseException):
 
 class WrongExpectedEventVersion(Exception):
     pass
+
+
+class DispatchError(Exception):
+    """
+    Subscribers of a publish that failed or timed out, as (subscriber, event,
+    exception) in ``failures``.
+    """
+
+    def __init__(self, failures: list):
+        super().__init__(f"{len(failures)} subscriber(s) failed: {failures!r}")
+        self.failures = failures
@@ -47,11 +47,18 @@ class ExpectedVersion:
     def is_any(self) -> bool:
         return self.version == Version.ANY
 
+    def following(self) -> "ExpectedVersion":
+        """
+        Expectation for a write that follows one checked against this one,
+        within the same unit of work.
+        """
+        return self if self.is_any() else ExpectedVersion.auto()
+
     def resolve_for(self, stream: Stream, resolver: Callable):
         if isinstance(self.version, int):
             return self.version
         elif self.is_none():
             return POSITION_DEFAULT
         elif self.is_auto():
-            new_version = resolver(stream)
-            return new_version.position if new_version else POSITION_DEFAULT
+            version = resolver(stream)
+            return POSITION_DEFAULT if version is None else version
@@ -1,9 +1,20 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from math import inf
-from typing import Dict, List, Union
+from operator import attrgetter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from event_store.batch_enumerator import BatchIterator
+from event_store.batch_enumerator import in_batches
 from event_store.exceptions import EventDuplicatedInStream, EventNotFound
 from event_store.expected_version import ExpectedVersion
 from event_store.record import Record
@@ -18,17 +29,55 @@ class EventInStream:
     position: int
 
 
+class StoredRecords(Sequence):
+    """
+    Records of a stream, or of the whole store, in stored order. A view, not
+    a copy: a record is looked up only when its offset is read.
+    """
+
+    def __init__(
+        self,
+        storage: Dict[str, Record],
+        entries: list,
+        event_id_of: Optional[Callable] = None,
+    ):
+        self.storage = storage
+        self.entries = entries
+        self.event_id_of = event_id_of
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, offset):
+        if isinstance(offset, slice):
+            return [self[index] for index in range(len(self))[offset]]
+        entry = self.entries[offset]
+        return self.storage[self.event_id_of(entry) if self.event_id_of else entry]
+
+
 class FakeSerializer:
     @staticmethod
     def dumps(args):
         return args
 
+    @staticmethod
+    def loads(args):
+        return args
+
 
 class InMemoryRepository(EventsRepository):
     def __init__(self, serializer=None):
-        self.serializer = serializer or FakeSerializer  # JSONEncoder?
-        self.streams = defaultdict(list)
-        self.storage: Dict[Record] = {}
+        # e.g. a JSONSerializer, to check that events survive encoding
+        self.serializer = serializer or FakeSerializer
+        self.streams: Dict[str, List[EventInStream]] = defaultdict(list)
+        self.storage: Dict[str, Record] = {}
+        # event ids in the global (storage) order
+        self.event_ids: List[str] = []
+        # event_id -> offset, per stream and for the global (storage) order
+        self.stream_offsets: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self.global_offsets: Dict[str, int] = {}
+        # event_id -> names of streams holding it, in order of linking
+        self.event_streams: Dict[str, List[str]] = defaultdict(list)
 
     def append_to_stream(
         self,
@@ -36,18 +85,39 @@ class InMemoryRepository(EventsRepository):
         stream: Stream,
         expected_version: ExpectedVersion = ExpectedVersion.none(),
     ) -> "InMemoryRepository":
+        # checked up front, a failed append stores nothing
+        self._verify_new([records])
         serialized_records = [record.serialize(self.serializer) for record in records]
 
         for index, serialized_record in enumerate(serialized_records):
-            if self.has_event(serialized_record.event_id):
-                raise EventDuplicatedInStream()
-
+            self.global_offsets[serialized_record.event_id] = len(self.storage)
             self.storage[serialized_record.event_id] = serialized_record
+            self.event_ids.append(serialized_record.event_id)
             fake_resolved_version = 1
             self._add_to_stream(stream, serialized_record, fake_resolved_version, index)
 
         return self
 
+    def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "InMemoryRepository":
+        # all or nothing, like the transaction of a database repository
+        self._verify_new([records for records, _ in streams.values()])
+        super().append_many(streams)
+        return self
+
+    def _verify_new(self, stream_records: Iterable[Records]) -> None:
+        """
+        Raises EventDuplicatedInStream if a record is already stored or
+        listed twice for one stream.
+        """
+        for records in stream_records:
+            event_ids = [record.event_id for record in records]
+            if len(set(event_ids)) < len(event_ids) or any(
+                self.has_event(event_id) for event_id in event_ids
+            ):
+                raise EventDuplicatedInStream()
+
     def link_to_stream(
         self,
         event_ids: List[str],
@@ -62,51 +132,59 @@ class InMemoryRepository(EventsRepository):
 
     def read(
         self, spec: SpecificationResult
-    ) -> Union[List[Records], Record]:  # FIXME figure out the type
+    ) -> Union[Iterable[Records], Record]:  # FIXME figure out the type
         serialized_records = self._read_scope(spec)
-        # FIXME deserialization?
-        # return [record.deserialize(self.serializer) for record in serialized_records]
+        if self.serializer is not FakeSerializer:
+            serialized_records = (
+                record.deserialize(self.serializer) for record in serialized_records
+            )
         if spec.batched:
-
-            def batch_reader(offset: int, limit: int):
-                records = serialized_records[offset:]
-                return records[:limit]
-
-            res = [
-                batch
-                for batch in BatchIterator(
-                    spec.batch_size, len(serialized_records), batch_reader
-                )
-            ]
-            return res
+            return in_batches(serialized_records, spec.batch_size)
+        elif spec.streamed:
+            return serialized_records
         elif spec.first:
-            return serialized_records[0] if serialized_records else None
+            return next(serialized_records, None)
         elif spec.last:
-            return serialized_records[-1] if serialized_records else None
+            last = deque(serialized_records, maxlen=1)
+            return last[0] if last else None
 
-        return [serialized_records]
+        return [list(serialized_records)]
 
     def has_event(self, event_id: str) -> bool:
         return event_id in self.storage
 
     def delete_stream(self, stream: Stream) -> "InMemoryRepository":
         del self.streams[stream.name]
+        for event_id in self.stream_offsets.pop(stream.name, {}):
+            self.event_streams[event_id].remove(stream.name)
         return self
 
     def count(self, spec: SpecificationResult) -> int:
-        return len(self._read_scope(spec))
+        if (
+            spec.start
+            or spec.stop
+            or spec.with_ids is not None
+            or spec.with_types is not None
+        ):
+            return sum(1 for _ in self._read_scope(spec))
+        return min(self._stream_length(spec.stream), spec.limit)
 
     def streams_of(self, event_id: str) -> list:
         return [
             Stream.new(stream_name)
-            for stream_name in self.streams
-            if self._has_event_in_stream(event_id, stream_name)
+            for stream_name in self.event_streams.get(event_id, [])
         ]
 
     def _add_to_stream(
         self, stream: Stream, serialized_record: Record, resolved_version, index
     ) -> None:
-        self.streams[stream.name].append(
+        events_in_stream = self.streams[stream.name]
+        if not self._has_event_in_stream(serialized_record.event_id, stream.name):
+            self.event_streams[serialized_record.event_id].append(stream.name)
+        self.stream_offsets[stream.name][serialized_record.event_id] = len(
+            events_in_stream
+        )
+        events_in_stream.append(
             EventInStream(
                 serialized_record.event_id,
                 self._compute_position(resolved_version, index),
@@ -116,66 +194,66 @@ class InMemoryRepository(EventsRepository):
     def _compute_position(self, resolved_version: int, index: int) -> int:
         return resolved_version + index + 1
 
-    def _read_scope(self, spec: SpecificationResult) -> Records:
+    def _read_scope(self, spec: SpecificationResult) -> Iterator[Record]:
         serialized_records = self._serialized_records_of_stream(spec.stream)
         serialized_records = self._ordered(serialized_records, spec)
-        serialized_records = (
-            serialized_records[::-1] if spec.backward else serialized_records
-        )
-        serialized_records = (
-            serialized_records[self._index_of(serialized_records, spec.start) + 1 :]
-            if spec.start
-            else serialized_records
-        )
-        serialized_records = (
-            serialized_records[: spec.limit]
-            if spec.limit is not inf
-            else serialized_records
-        )
+        # slice offsets rather than records, so the scope is read lazily
+        offsets = range(len(serialized_records))
+        offsets = offsets[::-1] if spec.backward else offsets
+        start = self._index_of(spec.stream, spec.start, spec) + 1 if spec.start else 0
+        stop = self._index_of(spec.stream, spec.stop, spec) if spec.stop else None
+        offsets = offsets[start:stop]
+        offsets = offsets[: spec.limit] if spec.limit is not inf else offsets
+        scope = (serialized_records[offset] for offset in offsets)
         if spec.with_ids is not None:
-            serialized_records = [
-                record
-                for record in serialized_records
-                if record.event_id in spec.with_ids
-            ]
+            with_ids = set(spec.with_ids)
+            scope = (record for record in scope if record.event_id in with_ids)
         if spec.with_types is not None:
-            serialized_records = [
-                record
-                for record in serialized_records
-                if record.event_type in spec.with_types
-            ]
-        return serialized_records
+            scope = (record for record in scope if record.event_type in spec.with_types)
+        return scope
 
-    def _index_of(self, source: Records, event_id: str) -> int:
-        for idx, record in enumerate(source):
-            if record.event_id == event_id:
-                return idx
+    def _index_of(
+        self, stream: Stream, event_id: str, spec: SpecificationResult
+    ) -> int:
+        offsets = self._offsets_of_stream(stream)
+        try:
+            offset = offsets[event_id]
+        except KeyError:
+            raise EventNotFound(event_id)
+        return self._stream_length(stream) - offset - 1 if spec.backward else offset
 
     def _has_event_in_stream(self, event_id: str, stream_name: str) -> bool:
-        events_ids_in_stream = [
-            event_in_stream.event_id
-            for event_in_stream in self.streams.get(stream_name, [])
-        ]
-        return event_id in events_ids_in_stream
+        return event_id in self.stream_offsets.get(stream_name, {})
 
     def _event_ids_of_stream(self, stream: Stream) -> List[str]:
-        return [event.event_id for event in self.streams[stream.name]]
+        return [event.event_id for event in self.streams.get(stream.name, [])]
+
+    def _offsets_of_stream(self, stream: Stream) -> Dict[str, int]:
+        if stream.is_global:
+            return self.global_offsets
+        return self.stream_offsets.get(stream.name, {})
+
+    def _stream_length(self, stream: Stream) -> int:
+        if stream.is_global:
+            return len(self.storage)
+        return len(self.streams.get(stream.name, []))
 
-    def _serialized_records_of_stream(self, stream: Stream) -> List[Record]:
+    def _serialized_records_of_stream(self, stream: Stream) -> Sequence[Record]:
         if stream.is_global:
-            return list(self.storage.values())
-        events_id = self._event_ids_of_stream(stream)
-        return list(
-            filter(lambda event: event.event_id in events_id, self.storage.values())
+            return StoredRecords(self.storage, self.event_ids)
+        return StoredRecords(
+            self.storage,
+            self.streams.get(stream.name, []),
+            attrgetter("event_id"),
         )
 
     def _ordered(
-        self, serialized_records: Records, spec: SpecificationResult
-    ) -> Records:
+        self, serialized_records: Sequence[Record], spec: SpecificationResult
+    ) -> Sequence[Record]:
         return serialized_records
 
     def _read_record(self, event_id):
         try:
-            return self.storage.get(event_id)
+            return self.storage[event_id]
         except KeyError:
             raise EventNotFound(event_id)
@@ -1,17 +1,146 @@
+from typing import Callable, List, Optional, Tuple
+
 from event_store.mappers.transformations.domain_event import DomainEvent
+from event_store.record import Record
+
+# a function of a single item and, if there is one, of a list of items
+Step = Tuple[Callable, Optional[Callable]]
+
+
+def record_fields(record: Record) -> dict:
+    return {
+        "event_id": record.event_id,
+        "data": record.data,
+        "metadata": record.metadata,
+        "event_type": record.event_type,
+        "timestamp": record.timestamp,
+        "valid_at": record.valid_at,
+    }
+
+
+def fields_record(fields: dict) -> Record:
+    return Record(**fields)
 
 
 class Pipeline:
+    """
+    Transformations between domain events and records, compiled into dump
+    and load functions, for one item and for a list of them, when the
+    pipeline is created.
+
+    Transformations with a true ``identity_dump`` or ``identity_load`` are
+    skipped in that direction. Field-local ones, with ``dump_fields`` or
+    ``load_fields``, take a dict of the record fields and return it with
+    some fields replaced (nested values must not be changed in place).
+    Consecutive field-local transformations share one dict, so a dump or a
+    load creates at most one Record.
+
+    Transformations may also take whole lists with ``dump_many`` and
+    ``load_many`` (``dump_fields_many`` and ``load_fields_many`` for
+    field-local ones), e.g. to look things up once per batch. Steps without
+    them are applied item by item, in one pass over the list.
+    """
+
     def __init__(self, *transformations, to_domain_event=DomainEvent()):
         self.transformations = [to_domain_event, *transformations]
+        dump = self._dump_steps(to_domain_event, transformations)
+        load = self._load_steps(to_domain_event, transformations)
+        self.dump = _chain([function for function, _ in dump])
+        self.load = _chain([function for function, _ in load])
+        self.dump_many = _chain_many(dump)
+        self.load_many = _chain_many(load)
+
+    def _dump_steps(self, to_domain_event, transformations) -> List[Step]:
+        steps = [
+            transformation
+            for transformation in transformations
+            if not getattr(transformation, "identity_dump", False)
+        ]
+        as_fields = bool(steps) and getattr(steps[0], "dump_fields", None) is not None
+        if as_fields and hasattr(to_domain_event, "event_to_fields"):
+            functions = [_step(to_domain_event, "event_to_fields")]
+        else:
+            functions, as_fields = [_step(to_domain_event, "dump")], False
+
+        for step in steps:
+            as_fields = _add_step(functions, as_fields, step, "dump")
+        if as_fields:
+            functions.append((fields_record, None))
+        return functions
+
+    def _load_steps(self, to_domain_event, transformations) -> List[Step]:
+        functions: List[Step] = []
+        as_fields = False
+        for step in reversed(transformations):
+            if not getattr(step, "identity_load", False):
+                as_fields = _add_step(functions, as_fields, step, "load")
+
+        if as_fields and hasattr(to_domain_event, "fields_to_event"):
+            functions.append(_step(to_domain_event, "fields_to_event"))
+        else:
+            if as_fields:
+                functions.append((fields_record, None))
+            functions.append(_step(to_domain_event, "load"))
+        return functions
+
+
+def _step(transformation, method: str) -> Step:
+    return (
+        getattr(transformation, method),
+        getattr(transformation, f"{method}_many", None),
+    )
+
+
+def _add_step(
+    functions: List[Step], as_fields: bool, transformation, method: str
+) -> bool:
+    """
+    Appends ``method`` of a transformation, dump or load, converting between
+    Record and fields dict where needed, and returns whether its output is a
+    fields dict.
+    """
+    if getattr(transformation, f"{method}_fields", None) is not None:
+        if not as_fields:
+            functions.append((record_fields, None))
+        functions.append(_step(transformation, f"{method}_fields"))
+        return True
+    if as_fields:
+        functions.append((fields_record, None))
+    functions.append(_step(transformation, method))
+    return False
+
+
+def _chain(functions: List[Callable]) -> Callable:
+    if len(functions) == 1:
+        return functions[0]
+    functions = tuple(functions)
+
+    def run(value):
+        for function in functions:
+            value = function(value)
+        return value
+
+    return run
+
+
+def _chain_many(steps: List[Step]) -> Callable[[list], list]:
+    functions: List[Callable] = []
+    run: List[Callable] = []
+    for function, many in steps:
+        if many is None:
+            run.append(function)
+            continue
+        if run:
+            functions.append(_each(_chain(run)))
+            run = []
+        functions.append(many)
+    if run:
+        functions.append(_each(_chain(run)))
+    return _chain(functions)
 
-    def dump(self, domain_event):
-        for transformation in self.transformations:
-            domain_event = transformation.dump(domain_event)
-        return domain_event
 
-    def load(self, record):
-        for transformation in self.transformations[::-1]:
-            record = transformation.load(record)
+def _each(function: Callable) -> Callable[[list], list]:
+    def run(values: list) -> list:
+        return [function(value) for value in values]
 
-        return record
+    return run
@@ -10,3 +10,9 @@ class PipelineMapper:
 
     def record_to_event(self, record):
         return self.pipeline.load(record)
+
+    def events_to_records(self, domain_events: list) -> list:
+        return self.pipeline.dump_many(domain_events)
+
+    def records_to_events(self, records: list) -> list:
+        return self.pipeline.load_many(records)
@@ -1,8 +1,12 @@
 from event_store.event import Event
+from event_store.event_registry import EventClassRegistry, event_classes
 from event_store.record import Record
 
 
 class DomainEvent:
+    def __init__(self, registry: EventClassRegistry = event_classes):
+        self.registry = registry
+
     def dump(self, domain_event: Event):
         # TODO remove timestamp and valid_at, Why?
         return Record(
@@ -14,8 +18,27 @@ class DomainEvent:
             valid_at=domain_event.valid_at,
         )
 
+    def event_to_fields(self, domain_event: Event) -> dict:
+        return {
+            "event_id": domain_event.event_id,
+            "data": domain_event.data,
+            "metadata": domain_event.metadata,
+            "event_type": domain_event.event_type,
+            "timestamp": domain_event.timestamp,
+            "valid_at": domain_event.valid_at,
+        }
+
+    def fields_to_event(self, fields: dict) -> Event:
+        return self.registry.build(
+            fields["event_type"],
+            event_id=fields["event_id"],
+            data=fields["data"],
+            metadata=fields["metadata"],
+        )
+
     def load(self, record: Record) -> Event:
-        return type(record.event_type, (Event,), {})(
+        return self.registry.build(
+            record.event_type,
             event_id=record.event_id,
             data=record.data,
             metadata=record.metadata,
@@ -1,13 +1,51 @@
+from typing import Dict, Type, Union
+
+from event_store.event import Event
+from event_store.event_registry import EventClassRegistry, event_classes
 from event_store.record import Record
 
 
 class EventClassRemapper:
-    def __init__(self, class_map):
-        self.class_map = class_map
+    """
+    Renames event types of loaded records, e.g. of events whose class was
+    renamed. Targets given as classes are registered in ``registry``, so the
+    records load as instances of them.
+    """
+
+    def __init__(
+        self,
+        class_map: Dict[str, Union[str, Type[Event]]],
+        registry: EventClassRegistry = event_classes,
+    ):
+        self.class_map = {
+            event_type: target
+            if isinstance(target, str)
+            else registry.register(target).__name__
+            for event_type, target in class_map.items()
+        }
+
+    identity_dump = True
+
+    @property
+    def identity_load(self) -> bool:
+        return not self.class_map
 
     def dump(self, record):
         return record
 
+    def load_fields(self, fields: dict) -> dict:
+        fields["event_type"] = self.class_map.get(
+            fields["event_type"], fields["event_type"]
+        )
+        return fields
+
+    def load_fields_many(self, fields_list: list) -> list:
+        class_map = self.class_map
+        for fields in fields_list:
+            event_type = fields["event_type"]
+            fields["event_type"] = class_map.get(event_type, event_type)
+        return fields_list
+
     def load(self, record):
         return Record(
             event_id=record.event_id,
@@ -1,19 +1,14 @@
-from event_store.record import Record
+class SymbolizeMetadataKeys:
+    """
+    Keeps records as they are, metadata keys are strings already and Records
+    are immutable, so there is nothing to copy.
+    """
 
+    identity_dump = True
+    identity_load = True
 
-class SymbolizeMetadataKeys:
     def dump(self, record):
-        return self._symbolize(record)
+        return record
 
     def load(self, record):
-        return self._symbolize(record)
-
-    def _symbolize(self, record):
-        return Record(
-            event_id=record.event_id,
-            event_type=record.event_type,
-            data=record.data,
-            metadata=record.metadata,
-            timestamp=record.timestamp,
-            valid_at=record.valid_at,
-        )
+        return record
@@ -22,12 +22,37 @@ class Record:
             "valid_at": self.valid_at,
         }
 
-    def serialize(self, serializer):
-        return Record(
+    def serialize(self, serializer) -> "Record":
+        """
+        Record with data and metadata encoded by ``serializer``. The result
+        is kept in serialized_records, so storing a record, sending it to
+        Celery or caching it with the same serializer encodes it once.
+        Records without timestamps get the current time.
+        """
+        try:
+            return self.serialized_records[serializer]
+        except KeyError:
+            pass
+
+        now = None
+        if self.timestamp is None or self.valid_at is None:
+            now = datetime.now().timestamp()
+        serialized = self.serialized_records[serializer] = Record(
             event_id=self.event_id,
             event_type=self.event_type,
             data=serializer.dumps(self.data),
             metadata=serializer.dumps(self.metadata),
-            timestamp=datetime.now().timestamp(),
-            valid_at=datetime.now().timestamp(),
+            timestamp=now if self.timestamp is None else self.timestamp,
+            valid_at=now if self.valid_at is None else self.valid_at,
+        )
+        return serialized
+
+    def deserialize(self, serializer) -> "Record":
+        return Record(
+            event_id=self.event_id,
+            event_type=self.event_type,
+            data=serializer.loads(self.data),
+            metadata=serializer.loads(self.metadata),
+            timestamp=self.timestamp,
+            valid_at=self.valid_at,
         )
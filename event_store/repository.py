@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from event_store.batch_enumerator import in_batches
 from event_store.expected_version import ExpectedVersion
 from event_store.record import Record
 from event_store.specification import SpecificationResult
@@ -19,6 +21,49 @@ class EventsRepository(ABC):
     ) -> "EventsRepository":
         pass
 
+    def append_iter(
+        self,
+        records: Iterable[Record],
+        stream: Stream,
+        expected_version: ExpectedVersion = ExpectedVersion.any(),
+        batch_size: int = 1000,
+    ) -> "EventsRepository":
+        """
+        Appends ``records`` batch by batch, so they never have to be in memory
+        at once. Only the first batch is checked against ``expected_version``,
+        the next ones continue at the version the previous batch reached.
+        """
+        for batch in in_batches(records, batch_size):
+            self.append_to_stream(batch, stream, expected_version)
+            expected_version = expected_version.following()
+        return self
+
+    def append_many(
+        self, streams: Dict[str, Tuple[Records, ExpectedVersion]]
+    ) -> "EventsRepository":
+        """
+        Appends records to several streams, given by name. A record listed
+        under more than one stream is stored with the first one and linked
+        to the others. Repositories with transactions write all streams
+        atomically, this default doesn't.
+        """
+        stored = set()
+        for stream_name, (records, expected_version) in streams.items():
+            stream = Stream.new(stream_name)
+            for linked, run in groupby(
+                records, key=lambda record: record.event_id in stored
+            ):
+                run = list(run)
+                if linked:
+                    self.link_to_stream(
+                        [record.event_id for record in run], stream, expected_version
+                    )
+                else:
+                    self.append_to_stream(run, stream, expected_version)
+                expected_version = expected_version.following()
+            stored.update(record.event_id for record in records)
+        return self
+
     @abstractmethod
     def link_to_stream(
         self,
@@ -48,5 +93,8 @@ class EventsRepository(ABC):
     def streams_of(self, event_id: str) -> list:
         pass
 
+    def streams_of_many(self, event_ids: Sequence[str]) -> Dict[str, list]:
+        return {event_id: self.streams_of(event_id) for event_id in event_ids}
+
     def position_in_stream(self, event_id: str, stream: Stream):
         pass
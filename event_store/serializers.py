@@ -0,0 +1,96 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+class Serializer(ABC):
+    """
+    Encodes event data and metadata. Serializers are stateless, instances of
+    one class are equal, so records serialized by any of them are encoded
+    once (see Record.serialize). ``json`` tells whether the output is JSON
+    text, which the Django repository can store in its JSON columns.
+    """
+
+    json = False
+
+    @abstractmethod
+    def dumps(self, value: Any) -> Any:
+        pass
+
+    @abstractmethod
+    def loads(self, value: Any) -> Any:
+        pass
+
+    def __eq__(self, other):
+        return type(self) is type(other)
+
+    def __hash__(self):
+        return hash(type(self))
+
+
+class JSONSerializer(Serializer):
+    """
+    Standard library json, without whitespace between items.
+    """
+
+    json = True
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, value: str) -> Any:
+        return json.loads(value)
+
+
+class OrjsonSerializer(Serializer):
+    """
+    JSON by orjson, if installed.
+    """
+
+    json = True
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonSerializer requires the orjson package.")
+
+    def dumps(self, value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    def loads(self, value: str) -> Any:
+        return orjson.loads(value)
+
+
+class MsgpackSerializer(Serializer):
+    """
+    MessagePack by msgpack, if installed. Binary, so not for the Django
+    repository.
+    """
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("MsgpackSerializer requires the msgpack package.")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, value: bytes) -> Any:
+        return msgpack.unpackb(value, raw=False)
+
+
+def fast_json_serializer() -> Serializer:
+    """
+    The fastest JSON serializer available, orjson if installed.
+    """
+    if orjson is not None:
+        return OrjsonSerializer()
+    return JSONSerializer()
@@ -3,6 +3,7 @@ from copy import copy
 from dataclasses import dataclass
 from typing import List, Optional, Sequence, Union
 
+from event_store.batch_enumerator import in_batches
 from event_store.exceptions import (
     EventNotFound,
     InvalidPageSize,
@@ -53,6 +54,10 @@ class SpecificationResult:
     def batched(self):
         return self.read_as == "batch"
 
+    @property
+    def streamed(self):
+        return self.read_as == "stream"
+
     @property
     def first(self):
         return self.read_as == "first"
@@ -92,7 +97,7 @@ class Specification:
         new_result = copy(self.result)
         for key, value in kwargs.items():
             setattr(new_result, key, value)
-        return Specification(self.reader, new_result)
+        return type(self)(self.reader, new_result)
 
     def stream(self, stream_name: str) -> "Specification":
         """
@@ -100,34 +105,30 @@ class Specification:
         """
         new_result = copy(self.result)
         new_result.stream = Stream(stream_name)
-        return Specification(self.reader, new_result)
+        return type(self)(self.reader, new_result)
 
     def start_from(self, start: str) -> "Specification":
         """
         Limits the query to events before or after another event.
+        Unknown event raises EventNotFound once the query is read.
 
         :return:
         """
         if not start:
             raise InvalidPageStart
 
-        if not self.reader.has_event(start):
-            raise EventNotFound
-
         return self._new(start=start)
 
     def to(self, stop: str) -> "Specification":
         """
          Limits the query to events before or after another event.
+         Unknown event raises EventNotFound once the query is read.
 
         :return:
         """
         if not stop:
             raise InvalidPageStop
 
-        if not self.reader.has_event(stop):
-            raise EventNotFound
-
         return self._new(stop=stop)
 
     def limit(self, count: int) -> "Specification":
@@ -144,10 +145,18 @@ class Specification:
 
     def each_batch(self):
         # return to_enum(:each_batch) unless block_given?
+        if self.result.streamed:
+            yield from in_batches(self.each(), self.result.batch_size)
+            return
+
         for batch in self.reader.each(self.in_batches(self.result.batch_size).result):
             yield batch
 
     def each(self):
+        if self.result.streamed:
+            yield from self.reader.each_streamed(self.result)
+            return
+
         for batch in self.each_batch():
             for event in batch:
                 yield event
@@ -155,6 +164,13 @@ class Specification:
     def in_batches(self, batch_size=DEFAULT_BATCH_SIZE):
         return self._new(read_as="batch", batch_size=batch_size)
 
+    def streaming(self, chunk_size=DEFAULT_BATCH_SIZE):
+        """
+        Reads the whole scope with a single query, fetching rows from the
+        database cursor in chunks and mapping them to events one at a time.
+        """
+        return self._new(read_as="stream", batch_size=chunk_size)
+
     def read_first(self):
         return self._new(read_as="first")
 
@@ -16,7 +16,11 @@ class SpecificationReader:
 
     def each(self, specification_result):
         for batch in self.repository.read(specification_result):
-            yield [self.mapper.record_to_event(record) for record in batch]
+            yield self.mapper.records_to_events(batch)
+
+    def each_streamed(self, specification_result):
+        for record in self.repository.read(specification_result):
+            yield self.mapper.record_to_event(record)
 
     def count(self, specification_result):
         return self.repository.count(specification_result)
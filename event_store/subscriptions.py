@@ -1,6 +1,6 @@
 from collections import defaultdict
 from itertools import chain
-from typing import Callable, Dict, List, TypeVar
+from typing import Callable, Dict, List, Tuple, TypeVar
 
 
 class Subscriptions:
@@ -10,17 +10,32 @@ class Subscriptions:
         )
         self._local = LocalSubscriptions()
         self._global = GlobalSubscriptions()
+        # event type -> subscribers, filled on first use, dropped on change
+        self._table: Dict[str, Tuple] = {}
 
     def add_subscription(self, subscriber, event_types):
         self._local.add(subscriber, self.resolve_event_types(event_types))
+        self._table = {}
 
     def add_global_subscription(self, subscriber):
         self._global.add(subscriber)
+        self._table = {}
 
     def all_for(self, event_type: str) -> list:
-        return list(
-            chain(self._local.all_for(event_type), self._global.all_for(event_type))
-        )
+        return list(self.subscribers_for(event_type))
+
+    def subscribers_for(self, event_type: str) -> Tuple:
+        """
+        Local and global subscribers of ``event_type``, computed once per
+        event type until the subscriptions change.
+        """
+        try:
+            return self._table[event_type]
+        except KeyError:
+            subscribers = self._table[event_type] = tuple(
+                chain(self._local.all_for(event_type), self._global.all_for(event_type))
+            )
+            return subscribers
 
     def _default_event_type_resolver(self, event_type):
         if isinstance(event_type, str):
@@ -0,0 +1,195 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from event_store.expected_version import ExpectedVersion
+from event_store.repository import EventsRepository, Records
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# stream name and records of one publish
+Publish = Tuple[str, Records]
+
+
+@dataclass(frozen=True)
+class WriteBehindMetrics:
+    queue_depth: int
+    flushes: int
+    records_written: int
+    failures: int
+    last_flush_latency: float
+    max_flush_latency: float
+
+
+def log_failure(error: BaseException, records: Records) -> None:
+    logger.error(
+        "Write-behind append of %s records failed", len(records), exc_info=error
+    )
+
+
+class WriteBehindQueue:
+    """
+    Bounded queue of records appended to ``repository`` by a background
+    thread, in append_many calls of whole publishes, up to ``batch_size``
+    records each. A publish is queued whole or not at all: producers block
+    until there is room for all of its records, for at most ``put_timeout``
+    seconds (forever when None), after which queue.Full is raised. A
+    publish bigger than ``max_size`` waits for the queue to be empty.
+
+    Appends can't fail for the producer, they already returned, so failed
+    publishes are passed to ``on_error``. When a batch fails, its publishes
+    are retried one by one and only those failing on their own are
+    reported, which relies on append_many storing all records or none.
+    Records still queued are written by shutdown(), which runs at
+    interpreter exit and then calls the hooks added with add_shutdown_hook.
+    """
+
+    def __init__(
+        self,
+        repository: EventsRepository,
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        put_timeout: Optional[float] = None,
+        on_error: Callable[[BaseException, Records], None] = log_failure,
+    ):
+        self.repository = repository
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout
+        self.on_error = on_error
+        self._queue: "queue.Queue" = queue.Queue()
+        # guards _queued_records and _stopped, notified when room is made
+        self._capacity = threading.Condition()
+        self._queued_records = 0
+        self._shutdown_hooks: List[Callable[[], None]] = []
+        self._stopped = False
+        self._flushes = 0
+        self._records_written = 0
+        self._failures = 0
+        self._last_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+        self._worker = threading.Thread(
+            target=self._run, name="event-store-write-behind", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def put(self, records: Records, stream_name: str) -> None:
+        records = list(records)
+        needed = min(len(records), self.max_size)
+        with self._capacity:
+            has_room = self._capacity.wait_for(
+                lambda: self._stopped or self._queued_records + needed <= self.max_size,
+                timeout=self.put_timeout,
+            )
+            if self._stopped:
+                raise RuntimeError("Write-behind queue is shut down.")
+            if not has_room:
+                raise queue.Full
+            self._queued_records += len(records)
+            self._queue.put((stream_name, records))
+
+    def flush(self) -> None:
+        """
+        Blocks until every record queued so far has been written or handed
+        to ``on_error``.
+        """
+        self._queue.join()
+
+    def shutdown(self) -> None:
+        with self._capacity:
+            if self._stopped:
+                return
+            self._stopped = True
+            # nothing can be queued after it
+            self._queue.put(_STOP)
+            self._capacity.notify_all()
+        self._worker.join()
+        atexit.unregister(self.shutdown)
+        for hook in self._shutdown_hooks:
+            hook()
+
+    def add_shutdown_hook(self, hook: Callable[[], None]) -> None:
+        self._shutdown_hooks.append(hook)
+
+    def metrics(self) -> WriteBehindMetrics:
+        return WriteBehindMetrics(
+            queue_depth=self._queued_records,
+            flushes=self._flushes,
+            records_written=self._records_written,
+            failures=self._failures,
+            last_flush_latency=self._last_flush_latency,
+            max_flush_latency=self._max_flush_latency,
+        )
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                with self._capacity:
+                    self._queued_records -= sum(len(records) for _, records in batch)
+                    self._capacity.notify_all()
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _next_batch(self) -> Tuple[List[Publish], bool]:
+        item = self._queue.get()
+        batch = []
+        size = 0
+        while item is not _STOP:
+            batch.append(item)
+            size += len(item[1])
+            if size >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _write(self, batch: List[Publish]) -> None:
+        streams: Dict[str, Records] = {}
+        for stream_name, records in batch:
+            streams.setdefault(stream_name, []).extend(records)
+
+        started = time.perf_counter()
+        try:
+            self.repository.append_many(
+                {
+                    stream_name: (records, ExpectedVersion.any())
+                    for stream_name, records in streams.items()
+                }
+            )
+        # EventDuplicatedInStream is a BaseException
+        except BaseException as error:
+            if len(batch) == 1:
+                self._failed(error, batch[0][1])
+            else:
+                for publish in batch:
+                    self._write([publish])
+            return
+        latency = time.perf_counter() - started
+
+        self._flushes += 1
+        self._records_written += sum(len(records) for records in streams.values())
+        self._last_flush_latency = latency
+        self._max_flush_latency = max(self._max_flush_latency, latency)
+
+    def _failed(self, error: BaseException, records: Records) -> None:
+        self._failures += 1
+        try:
+            self.on_error(error, records)
+        except BaseException:
+            # the worker has to keep going, or flush() would never return
+            logger.exception("Write-behind on_error failed")
@@ -1,6 +1,9 @@
 SECRET_KEY = 1
 
-INSTALLED_APPS = ["django_event_store"]  # , "tests.django.app"]
+INSTALLED_APPS = [
+    "django_event_store",
+    "django_event_store.interned",
+]  # , "tests.django.app"]
 
 TEMPLATES = [
     {
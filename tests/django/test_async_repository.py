@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django_event_store import async_event_repository
+from django_event_store.async_event_repository import AsyncDjangoEventRepository
+from event_store import AsyncClient, Event
+from event_store.exceptions import EventNotFound
+
+
+class Registered(Event):
+    pass
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.fixture
+def executor():
+    executor = CountingExecutor()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def client(executor, mapper):
+    return AsyncClient(
+        repository=AsyncDjangoEventRepository(executor=executor), mapper=mapper
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reads_one_batch_per_hop(client, executor):
+    events = [Registered() for _ in range(10)]
+
+    async def scenario():
+        await client.publish(events, stream_name="users")
+        executor.calls = 0
+        batches = [
+            batch
+            async for batch in client.read().stream("users").in_batches(4).each_batch()
+        ]
+        batch_calls, executor.calls = executor.calls, 0
+        streamed = [event async for event in client.read().streaming(4)]
+        return batches, batch_calls, streamed, executor.calls
+
+    batches, batch_calls, streamed, stream_calls = asyncio.run(scenario())
+
+    ids = [event.event_id for event in events]
+    assert [[str(event.event_id) for event in batch] for batch in batches] == [
+        ids[:4],
+        ids[4:8],
+        ids[8:],
+    ]
+    assert [str(event.event_id) for event in streamed] == ids
+    # one hop per batch and one finding out there is no next one
+    assert batch_calls == stream_calls == 4
+
+
+@pytest.mark.django_db(transaction=True)
+def test_single_calls(client):
+    event = Registered()
+
+    async def scenario():
+        await client.append(event, stream_name="users")
+        await client.link([event.event_id], "active")
+        return (
+            await client.read().stream("active").first(),
+            await client.read().count(),
+            await client.streams_of(event.event_id),
+        )
+
+    first, count, streams = asyncio.run(scenario())
+
+    assert str(first.event_id) == event.event_id
+    assert count == 1
+    assert [stream.name for stream in streams] == ["users", "active"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_missing_bound_raises(client):
+    async def scenario():
+        await client.append(Registered(), stream_name="users")
+        return (
+            await client.read().stream("users").start_from(str(uuid.uuid4())).execute()
+        )
+
+    with pytest.raises(EventNotFound):
+        asyncio.run(scenario())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pool_calls_close_old_connections(client, monkeypatch):
+    closed = []
+    monkeypatch.setattr(
+        async_event_repository,
+        "close_old_connections",
+        lambda: closed.append(threading.current_thread().name),
+    )
+
+    asyncio.run(client.read().count())
+
+    assert len(closed) == 2
+    assert all(name.startswith("ThreadPoolExecutor") for name in closed)
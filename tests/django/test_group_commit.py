@@ -0,0 +1,168 @@
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from uuid import uuid4
+
+import pytest
+from django.db import transaction
+
+from django_event_store import group_commit as group_commit_module
+from django_event_store.event_repository import DjangoEventRepository
+from django_event_store.group_commit import GroupCommitRepository
+from event_store import Client, Event
+from event_store.exceptions import EventDuplicatedInStream, WrongExpectedEventVersion
+from event_store.expected_version import ExpectedVersion
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+
+class Published(Event):
+    pass
+
+
+class RecordingRepository(GroupCommitRepository):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commits = []
+
+    def _commit(self, writes):
+        self.commits.append(len(writes))
+        super()._commit(writes)
+
+
+def in_threads(count, target):
+    """
+    Runs ``target(index)`` in ``count`` threads, returns their exceptions.
+    """
+    errors = [None] * count
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as error:
+            errors[index] = error
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+@pytest.fixture
+def group_commit():
+    return RecordingRepository(DjangoEventRepository(), window=0.2)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_writes_share_a_commit(group_commit, record):
+    errors = in_threads(
+        8,
+        lambda index: group_commit.append_to_stream(
+            [record()], Stream.new(f"stream-{index}"), ExpectedVersion.none()
+        ),
+    )
+
+    assert errors == [None] * 8
+    assert sum(group_commit.commits) == 8
+    assert len(group_commit.commits) < 8
+    assert group_commit.count(SpecificationResult(stream=Stream.new())) == 8
+
+
+@pytest.mark.django_db(transaction=True)
+def test_conflicting_write_fails_alone(group_commit, record):
+    errors = in_threads(
+        4,
+        lambda index: group_commit.append_to_stream(
+            [record()], Stream.new("stream"), ExpectedVersion.none()
+        ),
+    )
+
+    assert len([error for error in errors if error is None]) == 1
+    assert all(
+        isinstance(error, WrongExpectedEventVersion) for error in errors if error
+    )
+    assert group_commit.count(SpecificationResult(stream=Stream.new("stream"))) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_runs_after_commit(group_commit):
+    seen = []
+    client = Client(repository=group_commit)
+    client.subscribe(
+        lambda event: seen.append(DjangoEventRepository().has_event(event.event_id)),
+        [Published],
+    )
+
+    client.publish(Published(), stream_name="stream")
+
+    assert seen == [True]
+
+
+@pytest.mark.django_db
+def test_writes_inside_transaction_are_not_grouped(group_commit, record):
+    event = record()
+    with pytest.raises(RuntimeError), transaction.atomic():
+        group_commit.append_to_stream([event], Stream.new(str(uuid4())))
+        assert group_commit.has_event(event.event_id)
+        raise RuntimeError()
+
+    assert group_commit.commits == []
+    assert not group_commit.has_event(event.event_id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_write_raising_base_exception_fails_alone(group_commit, record):
+    def duplicated():
+        yield record()
+        raise EventDuplicatedInStream()
+
+    def append(index):
+        if index == 0:
+            group_commit.append_iter(duplicated(), Stream.new("stream-0"))
+        else:
+            group_commit.append_to_stream([record()], Stream.new(f"stream-{index}"))
+
+    errors = in_threads(3, append)
+
+    assert isinstance(errors[0], EventDuplicatedInStream)
+    assert errors[1:] == [None, None]
+    assert group_commit.count(SpecificationResult(stream=Stream.new())) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_timed_out_write_is_dropped(record):
+    group_commit = RecordingRepository(
+        DjangoEventRepository(), window=0.2, timeout=0.01
+    )
+    dropped = record()
+
+    with pytest.raises(FutureTimeoutError):
+        group_commit.append_to_stream([dropped], Stream.new("stream"))
+    group_commit.timeout = None
+    group_commit.append_to_stream([record()], Stream.new("stream"))
+
+    assert not group_commit.has_event(dropped.event_id)
+    assert group_commit.count(SpecificationResult(stream=Stream.new())) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_writer_closes_old_connections(group_commit, record, monkeypatch):
+    closed = []
+    committed = threading.Semaphore(0)
+
+    def close_old_connections():
+        closed.append(threading.current_thread().name)
+        committed.release()
+
+    monkeypatch.setattr(
+        group_commit_module, "close_old_connections", close_old_connections
+    )
+
+    group_commit.append_to_stream([record()], Stream.new("stream"))
+
+    # the second one runs after the caller got its result
+    assert committed.acquire(timeout=1) and committed.acquire(timeout=1)
+    assert closed == ["event-store-group-commit"] * 2
@@ -0,0 +1,143 @@
+import pytest
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+from django_event_store.event_repository import DjangoEventRepository
+from django_event_store.interned import event_repository
+from django_event_store.interned.event_repository import InternedEventRepository
+from django_event_store.interned.models import Event as InternedEvent
+from django_event_store.interned.models import EventsInStreams as InternedLinks
+from django_event_store.interned.models import EventType
+from django_event_store.interned.models import StreamHead as InternedStreamHead
+from django_event_store.interned.models import StreamName
+from django_event_store.names import InternedNames
+from event_store.expected_version import ExpectedVersion
+from event_store.stream import Stream
+from tests.django import test_repository
+from tests.django.test_repository import (  # noqa: F401
+    event0,
+    event1,
+    event2,
+    event3,
+    event4,
+    specification_with_orm,
+)
+
+
+@pytest.fixture
+def django_repository():
+    return InternedEventRepository()
+
+
+class TestInternedRepository(test_repository.TestRepository):
+    # the links reference event rows, their ids are read back once
+    auto_append_queries = 7
+
+    def test_stream_head_follows_appends(self, event0, event1, event2, event3):
+        self.repository.append_to_stream([event0, event1], self.stream)
+        self.repository.append_to_stream(
+            [event2, event3], self.stream_flow, ExpectedVersion.auto()
+        )
+        self.repository.link_to_stream(
+            [event0.event_id], self.stream_flow, ExpectedVersion(1)
+        )
+
+        head = InternedStreamHead.objects.get(stream__name=self.stream.name)
+        flow_head = InternedStreamHead.objects.get(stream__name=self.stream_flow.name)
+        assert (head.event_count, head.version) == (2, -1)
+        assert flow_head.version == 2
+
+    def test_names_are_stored_once(self, event0, event1):
+        self.repository.append_to_stream([event0, event1], self.stream)
+        self.repository.link_to_stream([event0.event_id], self.stream_flow)
+
+        assert StreamName.objects.count() == 2
+        assert EventType.objects.count() == 1
+        assert InternedLinks.objects.filter(stream__name=self.stream_flow.name).exists()
+
+    def test_links_reference_event_rows(self, event0):
+        self.repository.append_to_stream([event0], self.stream)
+        self.repository.link_to_stream([event0.event_id], self.stream_flow)
+
+        event = InternedEvent.objects.get(event_id=event0.event_id)
+        assert set(InternedLinks.objects.values_list("event_id", flat=True)) == {
+            event.id
+        }
+
+    def test_committed_names_are_cached(
+        self,
+        event0,
+        event1,
+        django_capture_on_commit_callbacks,
+        django_assert_num_queries,
+    ):
+        names = InternedNames(StreamName, EventType)
+        with django_capture_on_commit_callbacks(execute=True):
+            key = names.stream_key(self.stream.name, create=True)
+
+        with django_assert_num_queries(0):
+            assert names.stream_key(self.stream.name) == key
+            assert names.stream_name(key) == self.stream.name
+
+    def test_rolled_back_names_are_not_cached(self):
+        names = InternedNames(StreamName, EventType)
+        with pytest.raises(RuntimeError), transaction.atomic():
+            names.stream_key(self.stream.name, create=True)
+            raise RuntimeError()
+
+        assert names.stream_key(self.stream.name) is None
+        assert names.streams.keys == {}
+
+    def test_uncommitted_names_are_cached_for_the_transaction(
+        self, django_assert_num_queries
+    ):
+        names = InternedNames(StreamName, EventType)
+        key = names.stream_key(self.stream.name, create=True)
+        with pytest.raises(RuntimeError), transaction.atomic():
+            names.stream_key(self.stream_flow.name, create=True)
+            raise RuntimeError()
+
+        with django_assert_num_queries(0):
+            assert names.stream_key(self.stream.name) == key
+            assert names.stream_name(key) == self.stream.name
+        assert names.stream_key(self.stream_flow.name) is None
+        assert names.streams.keys == {}
+
+    def test_event_types_are_resolved_once_per_batch(self, django_assert_num_queries):
+        records = [self.record(event_type=f"Type{i}") for i in range(3)]
+        self.repository.append_to_stream(records, self.stream)
+        # nothing cached, the three names take one query
+        self.repository.repo_reader.names = InternedNames(StreamName, EventType)
+
+        with django_assert_num_queries(2):
+            assert self.repository.read(self.specification.result) == records
+
+
+def test_shares_names_between_repositories():
+    assert InternedEventRepository().names is event_repository.names
+    assert InternedEventRepository().names is InternedEventRepository().names
+
+
+@pytest.mark.django_db(transaction=True)
+def test_migrations_copy_events(record, monkeypatch):
+    # the copied rows are flushed after the test, keep them out of the shared
+    # cache
+    monkeypatch.setattr(event_repository, "names", InternedNames(StreamName, EventType))
+    executor = MigrationExecutor(connection)
+    executor.migrate([("django_event_store_interned", "0001_initial")])
+
+    records = [record() for _ in range(3)]
+    stream = Stream.new("copied")
+    base = DjangoEventRepository()
+    base.append_to_stream(records, stream, ExpectedVersion.auto())
+    base.link_to_stream([records[0].event_id], Stream.new("linked"))
+
+    executor.loader.build_graph()
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+    interned = InternedEventRepository()
+    assert InternedEvent.objects.count() == 3
+    assert InternedLinks.objects.count() == 4
+    assert interned.position_in_stream(records[2].event_id, stream) == 2
+    assert interned.streams_of(records[0].event_id) == [stream, Stream.new("linked")]
+    assert interned.has_event(records[1].event_id)
@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import pytest
+from django.db import connection
+
+from django_event_store.event_repository import DjangoEventRepository
+from event_store.specification import SpecificationResult
+from event_store.stream import Stream
+
+STREAM = Stream.new("stream")
+LAST_ROW = (10, None, {}, {}, "Type1", datetime(2021, 1, 1), datetime(2021, 1, 1))
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="EXPLAIN QUERY PLAN is SQLite specific"
+)
+
+
+@pytest.fixture
+def reader():
+    return DjangoEventRepository().repo_reader
+
+
+def assert_index_order(qs, index: str):
+    plan = qs.explain()
+
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def assert_index_seek(qs, index: str, constraint: str):
+    plan = qs.explain()
+
+    assert (
+        f"SEARCH {qs.model._meta.db_table} USING INDEX {index} ({constraint})" in plan
+    )
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "spec, index",
+    [
+        (SpecificationResult(stream=STREAM), "events_in_stream_id_idx"),
+        (
+            SpecificationResult(stream=STREAM, direction="backward"),
+            "events_in_stream_id_idx",
+        ),
+        (
+            SpecificationResult(stream=STREAM, with_types=["Type1"]),
+            "events_in_stream_id_idx",
+        ),
+        (SpecificationResult(with_types=["Type1"]), "event_type_id_idx"),
+        (SpecificationResult(time_sort_by="as_at"), "event_created_at_id_idx"),
+        (
+            SpecificationResult(time_sort_by="as_of", direction="backward"),
+            "event_valid_at_id_idx",
+        ),
+    ],
+)
+def test_read_scope_is_served_by_index(reader, spec, index):
+    assert_index_order(reader._read_scope(spec), index)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "spec, index, constraint",
+    [
+        (
+            SpecificationResult(stream=STREAM),
+            "events_in_stream_id_idx",
+            "stream=? AND id>?",
+        ),
+        (
+            SpecificationResult(with_types=["Type1"]),
+            "event_type_id_idx",
+            "event_type=? AND id>?",
+        ),
+        (
+            SpecificationResult(time_sort_by="as_at"),
+            "event_created_at_id_idx",
+            "created_at>?",
+        ),
+        (
+            SpecificationResult(time_sort_by="as_at", direction="backward"),
+            "event_created_at_id_idx",
+            "created_at<?",
+        ),
+        (
+            SpecificationResult(time_sort_by="as_of"),
+            "event_valid_at_id_idx",
+            "valid_at>?",
+        ),
+        (
+            SpecificationResult(time_sort_by="as_of", direction="backward"),
+            "event_valid_at_id_idx",
+            "valid_at>? AND valid_at<?",
+        ),
+    ],
+)
+def test_batch_seek_is_served_by_index(reader, spec, index, constraint):
+    # the phase of rows with a time, the one the seek ranges over
+    phases = reader._phases(spec, "")
+    phase = phases[0] if spec.forward else phases[-1]
+    qs = (
+        reader._unlimited_read_scope(spec)
+        .order_by(*reader._ordering(spec, nulls=False))
+        .filter(phase, reader._seek_condition(LAST_ROW, spec))
+    )
+
+    assert_index_seek(qs, index, constraint)
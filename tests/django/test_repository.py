@@ -1,15 +1,19 @@
+import ast
 import uuid
 from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django_event_store.event_repository import DjangoEventRepository
 from django_event_store.models import Event as EventModel
-from django_event_store.models import EventsInStreams
+from django_event_store.models import EventsInStreams, StreamHead
 from event_store import Event, EventNotFound
 from event_store.exceptions import WrongExpectedEventVersion
 from event_store.expected_version import ExpectedVersion
+from event_store.serializers import JSONSerializer, Serializer
 from event_store.specification import Specification, SpecificationResult
 from event_store.specification_reader import SpecificationReader
 from event_store.stream import Stream
@@ -40,8 +44,8 @@ def test_read_in_batches_forward(django_repository, record, specification):
         Stream.new(),
     )
 
-    batches = django_repository.read(
-        specification.forward().limit(11).in_batches(10).result
+    batches = list(
+        django_repository.read(specification.forward().limit(11).in_batches(10).result)
     )
 
     assert len(batches) == 2
@@ -59,8 +63,8 @@ def test_read_in_batches_backward(django_repository, record, specification):
         Stream.new(),
     )
 
-    batches = django_repository.read(
-        specification.backward().limit(11).in_batches(10).result
+    batches = list(
+        django_repository.read(specification.backward().limit(11).in_batches(10).result)
     )
 
     assert len(batches) == 2
@@ -83,8 +87,10 @@ def test_read_in_batches_forward_from_named_stream(
         records[20:40],
         Stream.new(),
     )
-    batches = django_repository.read(
-        specification.stream("bazinga!").forward().limit(11).in_batches(10).result
+    batches = list(
+        django_repository.read(
+            specification.stream("bazinga!").forward().limit(11).in_batches(10).result
+        )
     )
 
     assert len(batches) == 2
@@ -105,6 +111,33 @@ def test_allows_custom_base_class():
     pass
 
 
+@pytest.mark.django_db
+def test_stores_data_encoded_by_serializer(record, specification):
+    repository = DjangoEventRepository(serializer=JSONSerializer())
+    stored = record(data={"name": "Zoë", "items": [1, 2]}, metadata={"user": 1})
+
+    repository.append_to_stream([stored], Stream.new("serialized"))
+
+    (read,) = repository.read(specification.stream("serialized").result)
+    assert read.data == stored.data
+    assert read.metadata == stored.metadata
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT data FROM {EventModel._meta.db_table}")
+        assert cursor.fetchone() == ('{"name":"Zoë","items":[1,2]}',)
+
+
+def test_requires_json_serializer():
+    class ReprSerializer(Serializer):
+        def dumps(self, value):
+            return repr(value)
+
+        def loads(self, value):
+            return ast.literal_eval(value)
+
+    with pytest.raises(ValueError):
+        DjangoEventRepository(serializer=ReprSerializer())
+
+
 @pytest.fixture()
 def event0(record):
     return record()
@@ -143,6 +176,8 @@ class TestRepository:
     global_stream = Stream.new()
     stream = Stream.new(str(uuid.uuid4()))
     stream_flow = Stream.new("stream_flow")
+    # queries of an append with ExpectedVersion.auto() to an existing stream
+    auto_append_queries = 6
 
     @pytest.fixture(autouse=True)
     def repository(self, django_repository):
@@ -552,6 +587,200 @@ class TestRepository:
             event1,
         ]
 
+    def test_stream_head_follows_appends(self, event0, event1, event2, event3):
+        self.repository.append_to_stream([event0, event1], self.stream)
+        self.repository.append_to_stream(
+            [event2, event3], self.stream_flow, ExpectedVersion.auto()
+        )
+        self.repository.link_to_stream(
+            [event0.event_id], self.stream_flow, ExpectedVersion(1)
+        )
+
+        assert StreamHead.objects.get(stream=self.stream.name).event_count == 2
+        assert StreamHead.objects.get(stream=self.stream.name).version == -1
+        assert StreamHead.objects.get(stream=self.stream_flow.name).version == 2
+
+    def test_auto_resolves_version_from_stream_head(
+        self, event0, event1, django_assert_num_queries
+    ):
+        self.repository.append_to_stream([event0], self.stream, ExpectedVersion.auto())
+
+        with django_assert_num_queries(self.auto_append_queries) as context:
+            self.repository.append_to_stream(
+                [event1], self.stream, ExpectedVersion.auto()
+            )
+
+        stream_table = EventsInStreams._meta.db_table
+        assert not [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT") and stream_table in query["sql"]
+        ]
+
+        assert self.repository.position_in_stream(event1.event_id, self.stream) == 1
+
+    def test_none_fails_for_stream_with_events_without_position(self, event0, event1):
+        self.repository.append_to_stream([event0], self.stream, ExpectedVersion.any())
+
+        with pytest.raises(WrongExpectedEventVersion):
+            self.repository.append_to_stream(
+                [event1], self.stream, ExpectedVersion.none()
+            )
+        self.repository.append_to_stream([event1], self.stream, ExpectedVersion.auto())
+
+        assert self.repository.position_in_stream(event1.event_id, self.stream) == 0
+
+    def test_count_of_stream_is_point_read(self, django_assert_num_queries):
+        self.repository.append_to_stream(
+            [self.record() for _ in range(3)], self.stream, ExpectedVersion.any()
+        )
+        spec = self.specification.stream(self.stream.name)
+
+        with django_assert_num_queries(1):
+            assert self.repository.count(spec.result) == 3
+        assert self.repository.count(spec.limit(2).result) == 2
+        assert self.repository.count(self.specification.stream("empty").result) == 0
+
+        self.repository.delete_stream(self.stream)
+        assert self.repository.count(spec.result) == 0
+
+    def test_count_pushes_filters_into_single_query(self, django_assert_num_queries):
+        events = [self.record(event_type=Type1.__name__) for _ in range(3)]
+        events.append(self.record(event_type=Type2.__name__))
+        self.repository.append_to_stream(events, self.stream)
+        self.repository.append_to_stream([self.record()], self.stream_flow)
+        spec = self.specification
+
+        with django_assert_num_queries(1):
+            assert self.repository.count(spec.result) == 5
+        with django_assert_num_queries(1):
+            assert (
+                self.repository.count(
+                    spec.stream(self.stream.name)
+                    .of_type(Type1)
+                    .start_from(events[0].event_id)
+                    .to(events[3].event_id)
+                    .result
+                )
+                == 2
+            )
+        assert self.repository.count(spec.limit(2).result) == 2
+        assert self.repository.count(spec.of_types([Type2, Type3]).result) == 1
+        assert self.repository.count(spec.with_ids([events[1].event_id]).result) == 1
+        assert self.repository.count(spec.with_ids([]).result) == 0
+        assert self.repository.count(spec.backward().to(events[3].event_id).result) == 1
+        with pytest.raises(EventNotFound):
+            self.repository.count(spec.start_from(str(uuid.uuid4())).result)
+
+    def test_approximate_count_uses_table_statistics(self):
+        repository = type(self.repository)(approximate_count=True)
+        repository.append_to_stream([self.record() for _ in range(3)], self.stream)
+
+        assert repository.count(self.specification.result) == 3
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        repository.append_to_stream([self.record()], self.stream)
+
+        assert repository.count(self.specification.result) == 3
+        assert repository.count(self.specification.of_type(Type1).result) == 0
+        assert self.repository.count(self.specification.result) == 4
+
+    def test_append_and_link_in_batches(self):
+        self.repository.batch_size = 2
+        records = [self.record() for _ in range(5)]
+        event_ids = [record.event_id for record in records]
+
+        self.repository.append_to_stream(records, self.stream, ExpectedVersion.none())
+        self.repository.link_to_stream(event_ids, self.stream_flow)
+
+        assert self.read_events_forward(self.repository, self.stream) == records
+        assert self.read_events_forward(self.repository, self.stream_flow) == records
+        with pytest.raises(EventNotFound):
+            self.repository.link_to_stream(
+                [*event_ids, str(uuid.uuid4())], self.stream_flow
+            )
+
+    def test_append_iter_continues_expected_version(self):
+        records = [self.record() for _ in range(5)]
+
+        self.repository.append_iter(
+            iter(records), self.stream, ExpectedVersion.none(), batch_size=2
+        )
+
+        assert [
+            self.repository.position_in_stream(record.event_id, self.stream)
+            for record in records
+        ] == [0, 1, 2, 3, 4]
+        with pytest.raises(WrongExpectedEventVersion):
+            self.repository.append_iter(
+                [self.record()], self.stream, ExpectedVersion(3)
+            )
+
+    def test_append_iter_is_single_transaction(self):
+        def records():
+            yield from (self.record() for _ in range(3))
+            raise RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            self.repository.append_iter(records(), self.stream, batch_size=2)
+
+        assert self.read_events_forward(self.repository) == []
+
+    def test_append_many_stores_shared_events_once(self, event0, event1, event2):
+        self.repository.append_many(
+            {
+                self.stream.name: ([event0, event1], ExpectedVersion.none()),
+                self.stream_flow.name: ([event1, event2], ExpectedVersion.none()),
+            }
+        )
+
+        assert self.read_events_forward(self.repository) == [event0, event1, event2]
+        assert self.read_events_forward(self.repository, self.stream_flow) == [
+            event1,
+            event2,
+        ]
+        assert self.repository.streams_of(event1.event_id) == [
+            self.stream,
+            self.stream_flow,
+        ]
+        assert (
+            self.repository.position_in_stream(event2.event_id, self.stream_flow) == 1
+        )
+
+    def test_append_many_is_single_bulk_insert_per_table(self):
+        with CaptureQueriesContext(connection) as context:
+            self.repository.append_many(
+                {
+                    self.stream.name: ([self.record()], ExpectedVersion.none()),
+                    self.stream_flow.name: ([self.record()], ExpectedVersion.auto()),
+                    "other": ([self.record()], ExpectedVersion.any()),
+                }
+            )
+
+        inserts = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        for model in (self.repository.event_class, self.repository.stream_class):
+            table = f'INSERT INTO "{model._meta.db_table}"'
+            assert len([sql for sql in inserts if sql.startswith(table)]) == 1
+
+    def test_append_many_checks_all_expected_versions(self, event0, event1):
+        self.repository.append_to_stream([event0], self.stream_flow)
+
+        with pytest.raises(WrongExpectedEventVersion):
+            self.repository.append_many(
+                {
+                    self.stream.name: ([self.record()], ExpectedVersion.none()),
+                    self.stream_flow.name: ([event1], ExpectedVersion.none()),
+                }
+            )
+
+        assert self.read_events_forward(self.repository, self.stream) == []
+        assert not self.repository.has_event(event1.event_id)
+
     def test_should_has_event_even_after_removing_stream(self, event0):
         self.repository.append_to_stream([event0], self.stream)
 
@@ -561,6 +790,29 @@ class TestRepository:
         self.repository.delete_stream(self.stream)
         assert self.repository.has_event(event0.event_id) is True
 
+    def test_streams_of(self, event0, event1):
+        self.repository.append_to_stream([event0, event1], self.stream)
+        self.repository.link_to_stream([event0.event_id], self.stream_flow)
+
+        assert self.repository.streams_of(event0.event_id) == [
+            self.stream,
+            self.stream_flow,
+        ]
+        assert self.repository.streams_of(event1.event_id) == [self.stream]
+        assert self.repository.streams_of(uuid.uuid4()) == []
+
+    def test_streams_of_many(self, event0, event1, event2):
+        self.repository.append_to_stream([event0, event1], self.stream)
+        self.repository.link_to_stream([event0.event_id], self.stream_flow)
+
+        assert self.repository.streams_of_many(
+            [event0.event_id, str(event1.event_id), event2.event_id]
+        ) == {
+            event0.event_id: [self.stream, self.stream_flow],
+            str(event1.event_id): [self.stream],
+            event2.event_id: [],
+        }
+
     def test_data_attributes_are_retrieved(self):
         event = self.record(data={"order_id": 2})
         self.repository.append_to_stream([event], self.stream)
@@ -761,7 +1013,7 @@ class TestRepository:
             .in_batches(2)
             .result
         )
-        assert self.repository.read(spec)[0] == [event2, event0]
+        assert next(self.repository.read(spec)) == [event2, event0]
 
     def test_read_events_with_specific_id_from_local_scope(
         self, event0, event1, event2
@@ -803,7 +1055,7 @@ class TestRepository:
             .in_batches(2)
             .result
         )
-        assert self.repository.read(spec)[0] == [event2, event0]
+        assert next(self.repository.read(spec)) == [event2, event0]
 
     def test_read_events_of_type_from_global_scope(self):
         event1 = self.record(event_type=Type1.__name__)
@@ -931,6 +1183,144 @@ class TestRepository:
             event3,
         ]
 
+    @pytest.mark.parametrize("stream_name", [None, "stream"])
+    def test_time_order_is_respected_with_batches(self, stream_name):
+        event1 = self.record(
+            timestamp=datetime(2021, 1, 1), valid_at=datetime(2021, 1, 9)
+        )
+        event2 = self.record(
+            timestamp=datetime(2021, 1, 3), valid_at=datetime(2021, 1, 6)
+        )
+        event3 = self.record(
+            timestamp=datetime(2021, 1, 2), valid_at=datetime(2021, 1, 3)
+        )
+        event4 = self.record(
+            timestamp=datetime(2021, 1, 2), valid_at=datetime(2021, 1, 3)
+        )
+        self.repository.append_to_stream(
+            [event1, event2, event3, event4], Stream.new("stream")
+        )
+        specification = self.specification
+        if stream_name:
+            specification = specification.stream(stream_name)
+
+        def read_in_batches(spec):
+            return list(self.repository.read(spec.in_batches(1).result))
+
+        assert read_in_batches(specification.as_at()) == [
+            [event1],
+            [event3],
+            [event4],
+            [event2],
+        ]
+        assert read_in_batches(specification.as_at().backward()) == [
+            [event2],
+            [event4],
+            [event3],
+            [event1],
+        ]
+        assert read_in_batches(specification.as_of().limit(3)) == [
+            [event3],
+            [event4],
+            [event2],
+        ]
+        assert read_in_batches(specification.as_of().backward()) == [
+            [event1],
+            [event2],
+            [event4],
+            [event3],
+        ]
+
+    def test_batches_seek_past_last_row(self, django_assert_num_queries):
+        events = [self.record() for _ in range(5)]
+        self.repository.append_to_stream(events, self.stream)
+
+        with django_assert_num_queries(3) as context:
+            batches = list(
+                self.repository.read(
+                    self.specification.stream(self.stream.name).in_batches(2).result
+                )
+            )
+
+        assert batches == [events[:2], events[2:4], events[4:]]
+        assert all("OFFSET" not in query["sql"] for query in context.captured_queries)
+
+    def test_streaming_reads_with_single_query(self, django_assert_num_queries):
+        events = [self.record() for _ in range(5)]
+        self.repository.append_to_stream(events, self.stream)
+
+        with django_assert_num_queries(1):
+            streamed = self.repository.read(
+                self.specification.stream(self.stream.name).streaming(2).result
+            )
+            assert list(streamed) == events
+
+        with django_assert_num_queries(1):
+            streamed = self.repository.read(
+                self.specification.backward().streaming(2).result
+            )
+            assert list(streamed) == events[::-1]
+
+    def test_bounded_read_is_single_query(self, django_assert_num_queries):
+        events = [self.record() for _ in range(5)]
+        self.repository.append_to_stream(events, self.stream)
+        spec = (
+            self.specification.stream(self.stream.name)
+            .start_from(events[0].event_id)
+            .to(events[4].event_id)
+            .limit(2)
+        )
+
+        with django_assert_num_queries(1):
+            assert self.repository.read(spec.result) == events[1:3]
+
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    @pytest.mark.parametrize("stream_name", [None, "stream"])
+    def test_batches_seek_past_rows_without_valid_at(self, stream_name, batch_size):
+        records = [
+            self.record(
+                timestamp=datetime(2021, 1, day), valid_at=datetime(2021, 2, day)
+            )
+            for day in range(1, 5)
+        ]
+        self.repository.append_to_stream(records, Stream.new("stream"))
+        # rows written before valid_at was tracked
+        self.repository.event_class.objects.filter(
+            event_id__in=[records[0].event_id, records[2].event_id]
+        ).update(valid_at=None)
+        specification = self.specification.as_of()
+        if stream_name:
+            specification = specification.stream(stream_name)
+
+        def read_in_batches(spec):
+            return [
+                [record.event_id for record in batch]
+                for batch in self.repository.read(spec.in_batches(batch_size).result)
+            ]
+
+        def batches(indexes):
+            event_ids = [records[index].event_id for index in indexes]
+            return [
+                event_ids[start : start + batch_size]
+                for start in range(0, len(event_ids), batch_size)
+            ]
+
+        # with rows of both kinds in one batch when batch_size is 3
+        assert read_in_batches(specification) == batches([1, 3, 0, 2])
+        assert read_in_batches(specification.backward()) == batches([2, 0, 3, 1])
+        assert read_in_batches(specification.limit(3)) == batches([1, 3, 0])
+
+    def test_missing_bound_raises_on_read(self, event0, event1):
+        self.repository.append_to_stream([event0], self.stream)
+        self.repository.append_to_stream([event1], self.stream_flow)
+        spec = self.specification.stream(self.stream.name)
+
+        with pytest.raises(EventNotFound):
+            self.repository.read(spec.start_from(event1.event_id).result)
+        with pytest.raises(EventNotFound):
+            list(self.repository.read(spec.to(str(uuid.uuid4())).in_batches().result))
+        assert self.repository.read(spec.start_from(event0.event_id).result) == []
+
 
 def unlimited_concurrency_for_any_everything_should_succeed():
     pass
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from event_store import AsyncClient, AsyncInMemoryRepository, Event
+from event_store.exceptions import EventNotFound
+from event_store.expected_version import ExpectedVersion
+from event_store.stream import Stream
+
+
+class Placed(Event):
+    pass
+
+
+class Paid(Event):
+    pass
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def client(mapper):
+    return AsyncClient(repository=AsyncInMemoryRepository(), mapper=mapper)
+
+
+def test_awaits_coroutine_handlers(client):
+    handled = []
+
+    async def handler(event):
+        await asyncio.sleep(0)
+        handled.append(event)
+
+    class Handler:
+        async def __call__(self, event):
+            handled.append(event)
+
+    client.subscribe(handler, [Paid])
+    client.subscribe(Handler, [Paid])
+    event = Paid()
+
+    run(client.publish(event))
+
+    assert handled == [event, event]
+
+
+def test_publish_and_read(client):
+    events = [Placed(), Paid(), Placed()]
+    handled = []
+    client.subscribe(handled.append, [Paid])
+
+    async def scenario():
+        await client.publish(events, stream_name="order")
+        return (
+            [event async for event in client.read().stream("order")],
+            await client.read().stream("order").of_type(Placed).execute(),
+            await client.read().stream("order").count(),
+        )
+
+    read, placed, count = run(scenario())
+
+    assert read == events
+    assert placed == [events[0], events[2]]
+    assert count == 3
+    assert handled == [events[1]]
+
+
+def test_first_last_and_single_event(client):
+    events = [Placed(), Paid()]
+
+    async def scenario():
+        await client.append(events)
+        return (
+            await client.read().first(),
+            await client.read().last(),
+            await client.read().event(events[1].event_id),
+        )
+
+    assert run(scenario()) == (events[0], events[1], events[1])
+    with pytest.raises(EventNotFound):
+        run(client.read().event("missing"))
+
+
+def test_batches_and_streaming(client):
+    events = [Placed() for _ in range(5)]
+
+    async def scenario():
+        await client.append(events)
+        return (
+            [batch async for batch in client.read().in_batches(2).each_batch()],
+            [event async for event in client.read().streaming(2)],
+        )
+
+    batches, streamed = run(scenario())
+
+    assert batches == [events[:2], events[2:4], events[4:]]
+    assert streamed == events
+
+
+def test_link_and_append_many(client):
+    placed, paid = Placed(), Paid()
+
+    async def scenario():
+        await client.append_many(
+            {
+                "order": ([placed, paid], ExpectedVersion.none()),
+                "payments": (paid, ExpectedVersion.none()),
+            }
+        )
+        await client.link([placed.event_id], "placed")
+        return await client.streams_of_many([placed.event_id, paid.event_id])
+
+    assert run(scenario()) == {
+        placed.event_id: [Stream.new("order"), Stream.new("placed")],
+        paid.event_id: [Stream.new("order"), Stream.new("payments")],
+    }
@@ -3,6 +3,11 @@ from unittest.mock import Mock
 
 import pytest
 
+from event_store.broker import batch_handler
+from event_store.celery_scheduler import CeleryScheduler
+from event_store.client import Client
+from event_store.composed_dispatcher import ComposedDispatcher
+from event_store.dispatcher import Dispatcher, Scope
 from event_store.event import Event
 from event_store.exceptions import (
     EventNotFound,
@@ -10,6 +15,8 @@ from event_store.exceptions import (
     InvalidPageSize,
     InvalidPageStart,
 )
+from event_store.expected_version import ExpectedVersion
+from event_store.immediate_celery_dispatcher import ImmediateCeleryDispatcher
 from event_store.stream import Stream
 
 
@@ -70,6 +77,79 @@ def test_notifies_subscribed_handlers(client):
     assert another_handler.events == [test_event2]
 
 
+def test_calls_batch_handlers_once_per_publish(client):
+    events = [TestEvent(), TestEvent2(), TestEvent()]
+    calls = []
+
+    @batch_handler
+    def handler(batch):
+        calls.append(batch)
+
+    @batch_handler
+    class BatchHandler:
+        def __call__(self, batch):
+            calls.append(batch)
+
+    single_handler = TestHandler()
+    client.subscribe(handler, [TestEvent, TestEvent2])
+    client.subscribe(BatchHandler, [TestEvent])
+    client.subscribe(single_handler, [TestEvent])
+
+    client.publish(events)
+
+    assert calls == [events, [events[0], events[2]]]
+    assert single_handler.events == [events[0], events[2]]
+
+
+@pytest.mark.parametrize(
+    "scope, instances", [(Scope.EVENT, 4), (Scope.PUBLISH, 2), (Scope.SINGLETON, 1)]
+)
+def test_creates_handler_classes_per_scope(repository, mapper, scope, instances):
+    created = []
+
+    def factory(handler_class):
+        handler = handler_class()
+        created.append(handler)
+        return handler
+
+    client = Client(
+        repository=repository,
+        mapper=mapper,
+        dispatcher=Dispatcher(scope=scope, factory=factory),
+    )
+    client.subscribe(TestHandler, [TestEvent])
+    events = [TestEvent(), TestEvent(), TestEvent(), TestEvent()]
+
+    client.publish(events[:2])
+    client.publish(events[2:])
+
+    assert len(created) == instances
+    assert [event for handler in created for event in handler.events] == events
+
+
+def test_rejects_batch_handlers_the_dispatcher_cant_call(repository, mapper):
+    task = batch_handler(Mock(spec=["apply_async", "__call__"]))
+
+    @batch_handler
+    def handler(batch):
+        pass
+
+    celery = ImmediateCeleryDispatcher(CeleryScheduler())
+    client = Client(
+        repository=repository,
+        mapper=mapper,
+        dispatcher=ComposedDispatcher([celery, Dispatcher()]),
+    )
+    client.subscribe(handler, [TestEvent])
+
+    with pytest.raises(TypeError):
+        client.subscribe(task, [TestEvent])
+    with pytest.raises(TypeError):
+        Client(repository=repository, mapper=mapper, dispatcher=celery).subscribe(
+            task, [TestEvent]
+        )
+
+
 def test_raises_error_when_no_valid_method_on_handler(client):
     handler = InvalidTestHandler()
 
@@ -163,7 +243,7 @@ def test_should_raise_exception_when_stream_name_is_incorrect(event_store):
 
 def test_should_raise_when_event_doesnt_exist(event_store):
     with pytest.raises(EventNotFound):
-        event_store.read().stream("stream_name").start_from("0")
+        event_store.read().stream("stream_name").start_from("0").execute()
 
 
 def test_should_raise_when_event_id_is_not_given_or_invalid(event_store):
@@ -265,3 +345,39 @@ def test_should_return_list_of_streams_where_event_is_stored(event_store):
     ]
     assert event_store.streams_of(event_2.event_id) == [Stream.new("stream1")]
     assert event_store.streams_of(event_3.event_id) == [Stream.new("stream2")]
+
+
+def test_correlation_ids_come_from_id_generator(repository, mapper):
+    client = Client(repository=repository, mapper=mapper, id_generator=lambda: "1")
+    event = TestEvent()
+
+    client.publish(event)
+
+    assert event.metadata["correlation_id"] == "1"
+
+
+def test_append_iter_appends_lazily_produced_events(event_store):
+    events = [TestEvent() for _ in range(5)]
+
+    event_store.append_iter(iter(events), stream_name="imported")
+
+    assert event_store.read().stream("imported").execute() == events
+
+
+def test_append_many_links_shared_events(event_store):
+    order_placed = TestEvent()
+    order_paid = TestEvent()
+
+    event_store.append_many(
+        {
+            "order-1": ([order_placed, order_paid], ExpectedVersion.none()),
+            "orders-paid": (order_paid, ExpectedVersion.any()),
+        }
+    )
+
+    assert event_store.read().execute() == [order_placed, order_paid]
+    assert event_store.read().stream("orders-paid").execute() == [order_paid]
+    assert event_store.streams_of(order_paid.event_id) == [
+        Stream.new("order-1"),
+        Stream.new("orders-paid"),
+    ]
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from event_store import (
+    AsyncClient,
+    AsyncInMemoryRepository,
+    Client,
+    ConcurrentDispatcher,
+    DispatchError,
+    Event,
+    InMemoryRepository,
+    Scope,
+)
+
+
+class Registered(Event, register=False):
+    pass
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.events = []
+        self.threads = set()
+
+    def __call__(self, event):
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.events.append(event)
+
+
+class AsyncRecorder(Recorder):
+    async def __call__(self, event):
+        await asyncio.sleep(self.delay)
+        self.events.append(event)
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = ConcurrentDispatcher(max_workers=4, timeout=1)
+    yield dispatcher
+    dispatcher.shutdown()
+
+
+@pytest.fixture
+def client(dispatcher, mapper):
+    return Client(repository=InMemoryRepository(), dispatcher=dispatcher, mapper=mapper)
+
+
+def test_runs_subscribers_concurrently(client):
+    recorders = [Recorder(delay=0.1) for _ in range(4)]
+    for recorder in recorders:
+        client.subscribe(recorder, [Registered])
+
+    started = time.perf_counter()
+    client.publish(Registered())
+
+    assert time.perf_counter() - started < 0.3
+    assert all(len(recorder.events) == 1 for recorder in recorders)
+    assert all(
+        thread.startswith("event-store-dispatch")
+        for recorder in recorders
+        for thread in recorder.threads
+    )
+
+
+def test_subscriber_gets_events_in_stream_order(client):
+    recorder = Recorder(delay=0.01)
+    async_recorder = AsyncRecorder(delay=0.01)
+    client.subscribe(recorder, [Registered])
+    client.subscribe(async_recorder, [Registered])
+    events = [Registered() for _ in range(10)]
+
+    client.publish(events, stream_name="users")
+
+    assert recorder.events == events
+    assert async_recorder.events == events
+
+
+def test_collects_failures_of_all_subscribers(client):
+    def fail(event):
+        raise ValueError("sync")
+
+    async def fail_async(event):
+        raise KeyError("async")
+
+    recorder = Recorder()
+    for subscriber in (fail, fail_async, recorder):
+        client.subscribe(subscriber, [Registered])
+    events = [Registered(), Registered()]
+
+    with pytest.raises(DispatchError) as error:
+        client.publish(events)
+
+    failures = sorted(error.value.failures, key=lambda failure: repr(failure[2]))
+    assert [(subscriber, event) for subscriber, event, _ in failures] == [
+        (fail_async, events[0]),
+        (fail, events[0]),
+    ]
+    assert recorder.events == events
+
+
+class Confirmed(Event, register=False):
+    pass
+
+
+def test_handlers_publish_with_all_workers_busy(mapper):
+    dispatcher = ConcurrentDispatcher(max_workers=1, timeout=1)
+    client = Client(
+        repository=InMemoryRepository(), dispatcher=dispatcher, mapper=mapper
+    )
+    recorder, async_recorder = Recorder(), AsyncRecorder()
+    client.subscribe(lambda event: client.publish(Confirmed()), [Registered])
+    client.subscribe(recorder, [Confirmed])
+    client.subscribe(async_recorder, [Confirmed])
+
+    client.publish(Registered())
+
+    assert len(recorder.events) == len(async_recorder.events) == 1
+    dispatcher.shutdown()
+
+
+def test_reports_subscribers_out_of_time(mapper):
+    dispatcher = ConcurrentDispatcher(timeout=0.05)
+    client = Client(
+        repository=InMemoryRepository(), dispatcher=dispatcher, mapper=mapper
+    )
+    slow, slow_async = Recorder(delay=0.5), AsyncRecorder(delay=0.5)
+    client.subscribe(slow, [Registered])
+    client.subscribe(slow_async, [Registered])
+
+    started = time.perf_counter()
+    with pytest.raises(DispatchError) as error:
+        client.publish(Registered())
+
+    assert time.perf_counter() - started < 0.4
+    assert [type(failure) for _, _, failure in error.value.failures] == [
+        TimeoutError,
+        TimeoutError,
+    ]
+    dispatcher.shutdown(wait=False)
+
+
+def test_async_client_runs_coroutine_handlers_as_tasks(dispatcher, mapper):
+    client = AsyncClient(
+        repository=AsyncInMemoryRepository(), dispatcher=dispatcher, mapper=mapper
+    )
+    recorders = [AsyncRecorder(delay=0.1) for _ in range(10)] + [Recorder(delay=0.1)]
+    for recorder in recorders:
+        client.subscribe(recorder, [Registered])
+    event = Registered()
+
+    started = time.perf_counter()
+    asyncio.run(client.publish(event))
+
+    assert time.perf_counter() - started < 0.3
+    assert all(recorder.events == [event] for recorder in recorders)
+
+
+def test_shares_publish_scoped_handlers_between_workers(mapper):
+    created = []
+
+    def factory(handler_class):
+        created.append(handler_class(delay=0.01))
+        return created[-1]
+
+    dispatcher = ConcurrentDispatcher(
+        ordered=False, scope=Scope.PUBLISH, factory=factory
+    )
+    client = Client(
+        repository=InMemoryRepository(), dispatcher=dispatcher, mapper=mapper
+    )
+    client.subscribe(Recorder, [Registered])
+
+    client.publish([Registered() for _ in range(8)])
+
+    assert len(created) == 1
+    assert len(created[0].events) == 8
+    dispatcher.shutdown()
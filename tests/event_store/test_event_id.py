@@ -0,0 +1,47 @@
+import uuid
+
+import pytest
+
+from event_store import event_id
+from event_store.event import Event
+from event_store.event_id import UUID7, new_id, set_id_generator, uuid7
+
+
+@pytest.fixture
+def id_generator():
+    yield set_id_generator
+    set_id_generator(event_id.uuid4)
+
+
+def test_uuid4_by_default():
+    assert uuid.UUID(new_id()).version == 4
+
+
+def test_uuid7_is_valid_uuid():
+    value = uuid.UUID(uuid7())
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_are_ordered():
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_uuid7_borrows_next_millisecond_on_counter_overflow(monkeypatch):
+    monkeypatch.setattr(event_id.time, "time_ns", lambda: 1_000_000_000)
+    generator = UUID7()
+
+    ids = [generator() for _ in range(UUID7.COUNTER_MAX + 1)]
+
+    assert ids == sorted(ids)
+    assert uuid.UUID(ids[-1]).int >> 80 == 1001
+
+
+def test_events_use_configured_generator(id_generator):
+    id_generator(uuid7)
+
+    assert uuid.UUID(Event().event_id).version == 7
@@ -3,6 +3,9 @@ import uuid
 import pytest
 
 from event_store.exceptions import EventDuplicatedInStream
+from event_store.expected_version import ExpectedVersion
+from event_store.in_memory_repository import InMemoryRepository
+from event_store.serializers import JSONSerializer
 from event_store.stream import Stream
 
 
@@ -22,3 +25,152 @@ def test_does_not_allow_for_duplicated_events_in_the_stream(repository, record):
             [record(event_id=event_id)],
             Stream.new("stream"),
         )
+
+
+def event_ids(records):
+    return [record.event_id for record in records]
+
+
+def test_reads_linked_events_in_stream_order(repository, record, specification):
+    first, second, third = record(), record(), record()
+    repository.append_to_stream([first, second, third], Stream.new("source"))
+    repository.link_to_stream([third.event_id, first.event_id], Stream.new("linked"))
+
+    (batch,) = repository.read(specification.stream("linked").result)
+
+    assert event_ids(batch) == [third.event_id, first.event_id]
+
+
+def test_start_from_uses_offset_in_stream(repository, record, specification):
+    records = [record() for _ in range(5)]
+    repository.append_to_stream(records, Stream.new("stream"))
+
+    spec = specification.stream("stream").start_from(records[2].event_id)
+
+    (forward,) = repository.read(spec.result)
+    (backward,) = repository.read(spec.backward().result)
+
+    assert event_ids(forward) == event_ids(records[3:])
+    assert event_ids(backward) == event_ids(records[1::-1])
+
+
+class CountingStorage(dict):
+    reads = 0
+
+    def __getitem__(self, event_id):
+        self.reads += 1
+        return super().__getitem__(event_id)
+
+
+@pytest.mark.parametrize("stream_name", [None, "stream"])
+def test_reads_only_the_records_it_returns(
+    repository, record, specification, stream_name
+):
+    records = [record() for _ in range(100)]
+    repository.append_to_stream(records, Stream.new("stream"))
+    repository.storage = storage = CountingStorage(repository.storage)
+    if stream_name:
+        specification = specification.stream(stream_name)
+
+    first = repository.read(specification.read_first().result)
+    batch = next(
+        repository.read(
+            specification.start_from(records[89].event_id).in_batches(5).result
+        )
+    )
+
+    assert first.event_id == records[0].event_id
+    assert event_ids(batch) == event_ids(records[90:95])
+    assert storage.reads == 6
+
+
+def test_reads_up_to_stop_event(repository, record, specification):
+    records = [record() for _ in range(5)]
+    repository.append_to_stream(records, Stream.new("stream"))
+
+    spec = specification.stream("stream").to(records[3].event_id)
+    (forward,) = repository.read(spec.result)
+    (backward,) = repository.read(spec.backward().result)
+    (bounded,) = repository.read(spec.start_from(records[0].event_id).result)
+
+    assert event_ids(forward) == event_ids(records[:3])
+    assert event_ids(backward) == [records[4].event_id]
+    assert event_ids(bounded) == event_ids(records[1:3])
+
+
+def test_counts_stream_without_reading_it(repository, record, specification):
+    repository.append_to_stream([record() for _ in range(3)], Stream.new("stream"))
+
+    assert repository.count(specification.stream("stream").result) == 3
+    assert repository.count(specification.stream("stream").limit(2).result) == 2
+    assert repository.count(specification.stream("other").result) == 0
+    assert "other" not in repository.streams
+
+
+def test_streams_of_forgets_deleted_stream(repository, record):
+    event = record()
+    repository.append_to_stream([event], Stream.new("stream"))
+    repository.link_to_stream([event.event_id], Stream.new("linked"))
+
+    repository.delete_stream(Stream.new("linked"))
+
+    assert repository.streams_of(event.event_id) == [Stream.new("stream")]
+
+
+def test_reads_batches_lazily(repository, record, specification):
+    records = [record() for _ in range(25)]
+    repository.append_to_stream(records, Stream.new("stream"))
+
+    batches = repository.read(specification.stream("stream").in_batches(10).result)
+
+    assert event_ids(next(batches)) == event_ids(records[:10])
+    repository.append_to_stream([record()], Stream.new("stream"))
+    assert [event_ids(batch) for batch in batches] == [
+        event_ids(records[10:20]),
+        event_ids(records[20:]),
+    ]
+
+
+def test_reads_events_encoded_by_serializer(record, specification):
+    repository = InMemoryRepository(serializer=JSONSerializer())
+    stored = record(data={"items": [1, 2]}, metadata={"user": "Zoë"})
+    repository.append_to_stream([stored], Stream.new("stream"))
+
+    (batch,) = repository.read(specification.stream("stream").result)
+
+    assert batch == [stored]
+    assert repository.storage[stored.event_id].data == '{"items":[1,2]}'
+
+
+def test_serializes_record_once_per_serializer(record):
+    class CountingSerializer(JSONSerializer):
+        calls = 0
+
+        def dumps(self, value):
+            CountingSerializer.calls += 1
+            return super().dumps(value)
+
+    stored = record(data={"items": [1, 2]})
+
+    serialized = stored.serialize(CountingSerializer())
+
+    assert stored.serialize(CountingSerializer()) is serialized
+    assert stored.serialize(JSONSerializer()) is not serialized
+    assert CountingSerializer.calls == 2
+    assert serialized.timestamp == stored.timestamp
+
+
+def test_failed_append_many_stores_nothing(repository, record):
+    stored = record()
+    repository.append_to_stream([stored], Stream.new("stream"))
+    new = record()
+
+    with pytest.raises(EventDuplicatedInStream):
+        repository.append_many(
+            {
+                "other": ([new], ExpectedVersion.any()),
+                "stream": ([record(event_id=stored.event_id)], ExpectedVersion.any()),
+            }
+        )
+
+    assert not repository.has_event(new.event_id)
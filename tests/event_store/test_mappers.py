@@ -1,7 +1,17 @@
+import types
+import warnings
 from unittest import TestCase
+from unittest.mock import patch
 
+from event_store.client import Client
 from event_store.event import Event
+from event_store.event_registry import EventClassRegistry, event_classes
+from event_store.in_memory_repository import InMemoryRepository
 from event_store.mappers.default import Default
+from event_store.mappers.pipeline import Pipeline
+from event_store.mappers.pipeline_mapper import PipelineMapper
+from event_store.mappers.transformations.domain_event import DomainEvent
+from event_store.mappers.transformations.event_class_remapper import EventClassRemapper
 from event_store.record import Record
 
 
@@ -21,3 +31,159 @@ class TestMappers(TestCase):
         record = self.mapper.event_to_record(self.domain_event)
 
         assert self.mapper.record_to_event(record) == self.domain_event
+
+    def test_loads_records_as_instances_of_their_event_class(self):
+        event = OrderPlaced("order-1")
+
+        loaded = self.mapper.record_to_event(self.mapper.event_to_record(event))
+
+        assert type(loaded) is OrderPlaced
+        assert loaded == event
+
+    def test_synthesizes_one_class_per_unknown_event_type(self):
+        records = [
+            Record(
+                event_id=str(index),
+                event_type="NeverDefined",
+                data={},
+                metadata={},
+                timestamp=None,
+                valid_at=None,
+            )
+            for index in range(2)
+        ]
+
+        first, second = [self.mapper.record_to_event(record) for record in records]
+
+        assert type(first) is type(second)
+        assert type(first).__name__ == "NeverDefined"
+        assert issubclass(type(first), Event)
+
+    def test_remaps_event_types_to_event_classes(self):
+        class Renamed(Event, register=False):
+            pass
+
+        registry = EventClassRegistry()
+        mapper = PipelineMapper(
+            Pipeline(
+                EventClassRemapper({"OldName": Renamed}, registry=registry),
+                to_domain_event=DomainEvent(registry),
+            )
+        )
+        record = Record(
+            event_id="1",
+            event_type="OldName",
+            data={},
+            metadata={},
+            timestamp=None,
+            valid_at=None,
+        )
+
+        assert type(mapper.record_to_event(record)) is Renamed
+        assert event_classes.resolve("Renamed") is not Renamed
+
+    def test_warns_when_another_class_takes_an_event_type(self):
+        class Shipped(Event, register=False):
+            pass
+
+        registry = EventClassRegistry()
+        synthesized = registry.resolve("Shipped")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            registry.register(Shipped)
+            registry.register(Shipped)
+        other = types.new_class("Shipped", (Event,), {"register": False})
+        with self.assertWarns(RuntimeWarning):
+            registry.register(other)
+
+        assert synthesized is not Shipped
+        assert registry.resolve("Shipped") is other
+
+    def test_skips_identity_transformations_and_fuses_field_local_ones(self):
+        class Identity:
+            identity_dump = True
+            identity_load = True
+
+            def dump(self, record):
+                raise AssertionError("identity transformation called")
+
+            load = dump
+
+        class Upcast:
+            identity_dump = True
+
+            def load_fields(self, fields):
+                fields["data"] = {**fields["data"], "version": 2}
+                return fields
+
+        mapper = PipelineMapper(
+            Pipeline(
+                EventClassRemapper({"OldName": "NewName"}),
+                Identity(),
+                Upcast(),
+            )
+        )
+        record = Record(
+            event_id="1",
+            event_type="OldName",
+            data={"version": 1},
+            metadata={},
+            timestamp=None,
+            valid_at=None,
+        )
+
+        with patch.object(Record, "__init__", side_effect=AssertionError):
+            event = mapper.record_to_event(record)
+
+        assert event.event_type == "NewName"
+        assert event.data == {"version": 2}
+        assert record.data == {"version": 1}
+        assert mapper.event_to_record(event) == Record(
+            event_id="1",
+            event_type="NewName",
+            data={"version": 2},
+            metadata={},
+            timestamp=None,
+            valid_at=None,
+        )
+
+    def test_maps_batches_with_many_functions_of_transformations(self):
+        calls = []
+
+        class Upcast:
+            def dump(self, record):
+                return record
+
+            def load_fields(self, fields):
+                return self.load_fields_many([fields])[0]
+
+            def dump_many(self, records):
+                calls.append(("dump", len(records)))
+                return records
+
+            def load_fields_many(self, fields_list):
+                calls.append(("load", len(fields_list)))
+                for fields in fields_list:
+                    fields["data"] = {**fields["data"], "version": 2}
+                return fields_list
+
+        client = Client(
+            repository=InMemoryRepository(),
+            mapper=PipelineMapper(Pipeline(EventClassRemapper({}), Upcast())),
+        )
+        events = [Event(data={"version": 1}) for _ in range(5)]
+
+        client.publish(events)
+        batches = list(client.read().in_batches(2).each_batch())
+
+        assert calls == [("dump", 5), ("load", 2), ("load", 2), ("load", 1)]
+        assert [event.event_id for batch in batches for event in batch] == [
+            event.event_id for event in events
+        ]
+        assert all(event.data == {"version": 2} for batch in batches for event in batch)
+
+
+class OrderPlaced(Event):
+    def __init__(self, order_id: str):
+        super().__init__(data={"order_id": order_id})
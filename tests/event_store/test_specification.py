@@ -21,7 +21,7 @@ from event_store.specification_reader import SpecificationReader
 from event_store.stream import GLOBAL_STREAM, Stream
 
 
-class TestEvent(Event):
+class TestEvent(Event, register=False):
     pass
 
 
@@ -64,7 +64,7 @@ class SpecificationTest(TestCase):
             self.specification.start_from("")
 
         with self.assertRaises(EventNotFound):
-            self.specification.start_from("dsds")
+            self.specification.start_from("dsds").execute()
 
         with self.with_event_of_id("123"):
             self.assertEqual(self.specification.start_from("123").result.start, "123")
@@ -77,7 +77,7 @@ class SpecificationTest(TestCase):
             self.specification.to("")
 
         with self.assertRaises(EventNotFound):
-            self.specification.to("dsds")
+            self.specification.to("dsds").execute()
 
         with self.with_event_of_id("123"):
             self.assertEqual(self.specification.to("123").result.stop, "123")
@@ -171,6 +171,17 @@ def test_should_return_events_in_batches_2(repository, specification, test_recor
     assert len(specification.stream("stream").in_batches(10).execute()) == 20
 
 
+def test_should_stream_events(repository, specification, test_record):
+    records = [test_record() for _ in range(5)]
+    repository.append_to_stream(records, stream=Stream.new("stream"))
+
+    streamed = specification.stream("stream").streaming(2)
+
+    assert streamed.result.streamed
+    assert streamed.execute() == [TestEvent(record.event_id) for record in records]
+    assert [len(batch) for batch in streamed.each_batch()] == [2, 2, 1]
+
+
 def test_should_return_none_when_first_event_doesnt_exist_in_stream(
     specification, event_of_id
 ):
@@ -49,3 +49,20 @@ def test_should_subscribe_to_all_events(subscription):
     subscription.add_global_subscription(handler)
 
     assert subscription.all_for("Test") == [handler]
+
+
+def test_subscribers_for_is_computed_once_until_subscriptions_change(subscription):
+    handler = TestHandler()
+    another_handler = TestHandler()
+    subscription.add_subscription(handler, [Test1DomainEvent])
+
+    subscribers = subscription.subscribers_for("Test1DomainEvent")
+    assert subscribers == (handler,)
+    assert subscription.subscribers_for("Test1DomainEvent") is subscribers
+
+    subscription.add_global_subscription(another_handler)
+
+    assert subscription.subscribers_for("Test1DomainEvent") == (
+        handler,
+        another_handler,
+    )
@@ -0,0 +1,185 @@
+import queue
+import threading
+
+import pytest
+
+from event_store import Client, Event, InMemoryRepository
+from event_store.expected_version import ExpectedVersion
+from event_store.write_behind import WriteBehindQueue
+
+
+class Measured(Event):
+    pass
+
+
+class BlockingRepository(InMemoryRepository):
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+        self.appends = []
+
+    def append_many(self, streams):
+        self.released.wait(timeout=5)
+        self.appends.append(sum(len(records) for records, _ in streams.values()))
+        return super().append_many(streams)
+
+
+@pytest.fixture
+def blocking_repository():
+    repository = BlockingRepository()
+    yield repository
+    repository.released.set()
+
+
+@pytest.fixture
+def write_behind(blocking_repository):
+    write_behind = WriteBehindQueue(blocking_repository, max_size=100)
+    yield write_behind
+    write_behind.shutdown()
+
+
+def test_publish_returns_before_write(blocking_repository, write_behind):
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    events = [Measured() for _ in range(5)]
+
+    for event in events:
+        client.publish(event, stream_name="metrics")
+
+    assert client.read().stream("metrics").execute() == []
+    blocking_repository.released.set()
+    client.flush()
+    assert client.read().stream("metrics").execute() == events
+    assert sum(blocking_repository.appends) == 5
+    assert len(blocking_repository.appends) <= 2
+
+
+def test_expected_version_writes_after_queued_records(
+    blocking_repository, write_behind
+):
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    queued, checked = Measured(), Measured()
+    client.publish(queued, stream_name="metrics")
+    blocking_repository.released.set()
+
+    client.publish(checked, stream_name="metrics", expected_version=ExpectedVersion(0))
+
+    assert client.read().stream("metrics").execute() == [queued, checked]
+
+
+def test_full_queue_blocks_producers(blocking_repository):
+    write_behind = WriteBehindQueue(blocking_repository, max_size=1, put_timeout=0.01)
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+
+    with pytest.raises(queue.Full):
+        for _ in range(3):
+            client.publish(Measured())
+
+    blocking_repository.released.set()
+    write_behind.shutdown()
+
+
+def test_shutdown_writes_queued_records_and_runs_hooks(blocking_repository):
+    write_behind = WriteBehindQueue(blocking_repository)
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    hooks = []
+    write_behind.add_shutdown_hook(
+        lambda: hooks.append(len(blocking_repository.storage))
+    )
+    client.publish([Measured(), Measured()])
+    blocking_repository.released.set()
+
+    write_behind.shutdown()
+
+    assert hooks == [2]
+    with pytest.raises(RuntimeError):
+        client.publish(Measured())
+
+
+def test_failed_batches_are_reported(blocking_repository):
+    failures = []
+    write_behind = WriteBehindQueue(
+        blocking_repository, on_error=lambda error, records: failures.append(records)
+    )
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    event = Measured()
+    blocking_repository.released.set()
+    client.append(event).flush()
+
+    client.append(Measured(event_id=event.event_id)).flush()
+
+    assert [[record.event_id for record in records] for records in failures] == [
+        [event.event_id]
+    ]
+    assert write_behind.metrics().failures == 1
+    write_behind.shutdown()
+
+
+def test_metrics(blocking_repository, write_behind):
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    client.publish([Measured(), Measured()])
+
+    assert write_behind.metrics().queue_depth in (1, 2)
+
+    blocking_repository.released.set()
+    client.flush()
+    metrics = write_behind.metrics()
+    assert metrics.queue_depth == 0
+    assert metrics.records_written == 2
+    assert metrics.flushes >= 1
+    assert 0 < metrics.last_flush_latency <= metrics.max_flush_latency
+
+
+def test_reports_only_failing_publishes_of_a_batch(blocking_repository):
+    failures = []
+    write_behind = WriteBehindQueue(
+        blocking_repository, on_error=lambda error, records: failures.append(records)
+    )
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    stored = Measured()
+    blocking_repository.released.set()
+    client.append(stored).flush()
+    blocking_repository.released.clear()
+    first, duplicate, last = Measured(), Measured(event_id=stored.event_id), Measured()
+
+    for event in (first, duplicate, last):
+        client.append(event, stream_name="metrics")
+    blocking_repository.released.set()
+    client.flush()
+
+    assert [[record.event_id for record in records] for records in failures] == [
+        [duplicate.event_id]
+    ]
+    assert client.read().stream("metrics").execute() == [first, last]
+    assert write_behind.metrics().failures == 1
+    write_behind.shutdown()
+
+
+def test_keeps_writing_when_on_error_raises(blocking_repository):
+    def on_error(error, records):
+        raise ValueError("reporting failed")
+
+    write_behind = WriteBehindQueue(blocking_repository, on_error=on_error)
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    event = Measured()
+    blocking_repository.released.set()
+    client.append(event).flush()
+
+    client.append(Measured(event_id=event.event_id)).flush()
+    client.append(Measured(), stream_name="metrics").flush()
+
+    assert len(client.read().stream("metrics").execute()) == 1
+    write_behind.shutdown()
+
+
+def test_publish_is_queued_whole_or_not_at_all(blocking_repository):
+    write_behind = WriteBehindQueue(blocking_repository, max_size=2, put_timeout=0.01)
+    client = Client(repository=blocking_repository, write_behind=write_behind)
+    client.publish(Measured())
+
+    with pytest.raises(queue.Full):
+        client.publish([Measured(), Measured()])
+
+    assert write_behind.metrics().queue_depth == 1
+    blocking_repository.released.set()
+    write_behind.shutdown()
+    assert len(blocking_repository.storage) == 1